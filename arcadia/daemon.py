@@ -0,0 +1,49 @@
+import os
+import signal
+import threading
+import logging.config
+
+from dotenv import load_dotenv
+from library.arcadia_daemon import ArcadiaDaemon
+from library.collectors.scrape_cache import ScrapeCache
+from library.metrics import metrics
+
+
+if __name__ == '__main__':
+    logging.config.fileConfig(fname=os.path.abspath('arcadia/bin/logging.conf'), disable_existing_loggers=False)
+    logger: logging.Logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+
+    try:
+        load_dotenv()
+        SQL_LITE_DB: str = os.getenv('SQL_LITE_DB')
+        METRICS_OUTPUT: str = os.getenv('ARCADIA_METRICS_OUTPUT')
+        metrics.configure_from_env(logging_object=logging)
+        SCRAPE_CACHE_DB: str = os.getenv('SCRAPE_CACHE_DB')
+        scrape_cache: ScrapeCache = ScrapeCache(
+            logging,
+            SCRAPE_CACHE_DB,
+            ttl=float(os.getenv('SCRAPE_CACHE_TTL', '86400')),
+            max_entries=int(os.getenv('SCRAPE_CACHE_MAX_ENTRIES', '100000'))
+        ) if SCRAPE_CACHE_DB else None
+        arcadia_daemon: ArcadiaDaemon = ArcadiaDaemon(
+            logging, SQL_LITE_DB, scrape_workers=int(os.getenv('SCRAPE_WORKERS', '2')), scrape_cache=scrape_cache
+        )
+        signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=arcadia_daemon.shutdown).start())
+        try:
+            arcadia_daemon.serve_forever()
+        except KeyboardInterrupt:
+            logger.info(f'Received interrupt, stopping Arcadia daemon')
+        finally:
+            arcadia_daemon.close()
+        if scrape_cache:
+            scrape_cache.close()
+        if METRICS_OUTPUT and metrics.enabled:
+            metrics.write(METRICS_OUTPUT)
+
+    except TypeError as type_error:
+        logger.error(f'Received TypeError: Check that the .env project file is configured correctly: {type_error}')
+        exit()
+    except Exception as exception:
+        logger.error(f'Exception was thrown: {str(exception)}')
+        raise
@@ -1,55 +1,110 @@
-import ast
+import copy
+import itertools
 import logging.config
 import sqlite3
-from typing import Any, Union
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, Union
 
 from willow_core.library.db_types import DeleteDbItemResponse, UpdateDbItemResponse, AddDbItemResponse
-from .arcadia_types import DataViewType, VineRoot
-from .collectors.scraper import Scraper
-from .db.db_types import ItemPackage, ArcadiaDataType, ArcadiaDbRecord
+from .arcadia_types import DataViewType, VineRoot, ArcadiaSearchResult, RelatedSubject
+from .co_occurrence import CoOccurrence
+from .collectors.scrape_cache import ScrapeCache
+from .db.db_types import ItemPackage, ArcadiaDataType, ArcadiaDbRecord, AddDbItemsResponse, EnrichmentResponse, \
+    RecordFilters
+from .query_cache import QueryCache, QueryCacheStats
+from .tag_index import TagIndex
 from .vine import Vine
 from .db.arcadia_db import ArcadiaDb
 
 
 class Arcadia:
-    def __init__(self, logging_object: Any, sql_lite_db_path: str, data_view_type: DataViewType):
+    def __init__(self, logging_object: Any, sql_lite_db_path: str, data_view_type: DataViewType,
+                 persistent: bool = False, scrape_cache: Optional[ScrapeCache] = None,
+                 query_cache_size: int = 256, query_cache_ttl: Optional[float] = 300.0):
         self._logging_object = logging_object
         self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
         self._logger.setLevel(logging.INFO)
         self._data_view_type: DataViewType = data_view_type
-        self._arcadia_db: ArcadiaDb = ArcadiaDb(logging_object, sql_lite_db_path)
+        self._arcadia_db: ArcadiaDb = ArcadiaDb(logging_object, sql_lite_db_path, persistent)
+        self._scrape_cache: Optional[ScrapeCache] = scrape_cache
+        self._tag_index: Optional[TagIndex] = None
+        self._tag_index_stale: bool = False
+        self._subjects_dictionary: Optional[dict[str, list[str]]] = None
+        self._query_cache: QueryCache = QueryCache(query_cache_size, query_cache_ttl)
+
+    def __enter__(self) -> 'Arcadia':
+        self._arcadia_db.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._arcadia_db.close()
 
     def _get_subjects_list(self) -> list[str]:
-        subjects: Union[str, list] = self.get_subjects()
-        if isinstance(subjects, list):
-            subjects_list = subjects
+        db_tags: list[sqlite3.Row] = self._arcadia_db.get_tags()
+        subjects: list[str] = [db_tag[0] for db_tag in db_tags]
+        subjects.sort(key=lambda subject: subject.lower())
+        return subjects
+
+    @staticmethod
+    def _subject_bucket(subject: str) -> str:
+        first_character: str = subject[0].upper()
+        return first_character if first_character.isalpha() else '#'
+
+    def _get_tag_index(self) -> TagIndex:
+        self._check_data_version()
+        if self._tag_index is None:
+            self._tag_index = TagIndex(db_tag[0] for db_tag in self._arcadia_db.get_tags())
+        elif self._tag_index_stale:
+            self._tag_index.sync(db_tag[0] for db_tag in self._arcadia_db.get_tags())
+        self._tag_index_stale = False
+        return self._tag_index
+
+    def _tags_changed(self, added_tags: Optional[list[str]] = None) -> None:
+        self._subjects_dictionary = None
+        if added_tags is not None and self._tag_index is not None:
+            for tag in added_tags:
+                self._tag_index.add(tag)
         else:
-            subjects_list: list[str] = subjects.split(',')
-        return subjects_list
+            self._tag_index_stale = True
+
+    def _items_changed(self, *namespaces: str) -> None:
+        self._query_cache.invalidate(*namespaces)
+
+    def _check_data_version(self) -> None:
+        if self._arcadia_db.data_changed():
+            self._query_cache.clear()
+            self._tags_changed()
+
+    def _cached(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        self._check_data_version()
+        return self._query_cache.get(key, loader)
+
+    def get_cache_stats(self) -> QueryCacheStats:
+        return self._query_cache.stats()
 
     @staticmethod
     def _tags_invalid(tags: list[str]) -> bool:
         return '' in tags
 
     def get_url_item_count(self) -> int:
-        return int(self._arcadia_db.get_url_record_count()[0])
+        return self._cached(('url_item_count',), lambda: int(self._arcadia_db.get_url_record_count()[0]))
 
     def get_item_count(self) -> int:
-        return int(self._arcadia_db.get_record_count()[0])
+        return self._cached(('item_count',), lambda: int(self._arcadia_db.get_record_count()[0]))
 
     def get_item(self, item_key) -> ArcadiaDbRecord:
-        item: dict = dict(self._arcadia_db.get_record(item_key))
-        if 'tags' in item:
-            item['tags'] = ast.literal_eval(item['tags'])
-        return item
+        return self._arcadia_db.get_record(item_key)
 
     def get_random_url_item(self) -> ArcadiaDbRecord:
-        item: dict = dict(self._arcadia_db.get_random_url_record())
-        if 'tags' in item:
-            item['tags'] = ast.literal_eval(item['tags'])
-        return item
+        return self._arcadia_db.get_random_url_record()
+
+    def get_random_url_items(self, count: int, tag: Optional[str] = None) -> list[ArcadiaDbRecord]:
+        return self._arcadia_db.get_random_url_records(count, tag.lower() if tag else None)
 
-    def add_item(self, item_package: ItemPackage) -> AddDbItemResponse:
+    def add_item(self, item_package: ItemPackage, fetch_meta: bool = False) -> AddDbItemResponse:
         response: AddDbItemResponse = {
             'added_item': False,
             'reason': 'error',
@@ -63,7 +118,10 @@ class Arcadia:
         else:
             try:
                 response = self._arcadia_db.insert_record(item_package)
-                if item_package['data_type'] == ArcadiaDataType.URL:
+                if response['added_item']:
+                    self._tags_changed([tag.lower() for tag in item_package['tags']])
+                    self._items_changed()
+                if fetch_meta and item_package['data_type'] == ArcadiaDataType.URL:
                     self.update_item_meta(item_package['content'])
             except TypeError as type_error:
                 self._logger.error(f'Received error trying to add record: {str(type_error)}')
@@ -74,88 +132,344 @@ class Arcadia:
             finally:
                 return response
 
-    def get_summary(self, main_tag: str) -> Union[VineRoot, str]:
+    def add_items(self, item_packages: Iterable[ItemPackage], batch_size: int = 500) -> AddDbItemsResponse:
+        invalid_items: list[ItemPackage] = []
+
+        def valid_items() -> Iterator[ItemPackage]:
+            for item_package in item_packages:
+                if Arcadia._tags_invalid(item_package['tags']):
+                    invalid_items.append(item_package)
+                else:
+                    yield item_package
+
+        response: AddDbItemsResponse = self._arcadia_db.insert_records(valid_items(), batch_size)
+        if response['added_items']:
+            self._tags_changed()
+            self._items_changed()
+        response['invalid_items'] = len(invalid_items)
+        if invalid_items:
+            self._logger.error(f'Skipped {len(invalid_items)} items with unaccepted empty string tags')
+        return response
+
+    def get_items(self, search_term: str, limit: int = 50, before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        return self._arcadia_db.get_records(search_term, limit, before_id)
+
+    def iter_items(self, search_term: str, before_id: Optional[int] = None) -> Iterator[ArcadiaDbRecord]:
+        return self._arcadia_db.iter_records(search_term, before_id)
+
+    def find_items(self, filters: RecordFilters, limit: int = 50,
+                   before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        return self._arcadia_db.find_records(filters, limit, before_id)
+
+    def iter_found_items(self, filters: RecordFilters, before_id: Optional[int] = None) -> Iterator[ArcadiaDbRecord]:
+        return self._arcadia_db.iter_found_records(filters, before_id)
+
+    def get_summary(self, main_tag: str, limit: Optional[int] = None, before_id: Optional[int] = None,
+                    order_by_related: bool = False) -> Union[VineRoot, str]:
         try:
-            records: list[sqlite3.Row] = self._arcadia_db.get_records(main_tag)
-            arcadia_vine: Vine = Vine(self._logging_object, main_tag.lower(), records, self._data_view_type)
-            if self._data_view_type == DataViewType.RAW:
-                return arcadia_vine.get_vine_root()
-            return arcadia_vine.__str__()
+            summary: Union[VineRoot, str] = self._cached(
+                ('summary', main_tag.lower(), limit, before_id, order_by_related),
+                lambda: self._build_summary(main_tag, limit, before_id, order_by_related)
+            )
+            return copy.deepcopy(summary) if isinstance(summary, dict) else summary
         except TypeError as type_error:
             self._logger.error(f'Received error getting record vine: {str(type_error)}')
 
+    def _build_summary(self, main_tag: str, limit: Optional[int], before_id: Optional[int],
+                       order_by_related: bool) -> Union[VineRoot, str]:
+        records: list[ArcadiaDbRecord] = self._arcadia_db.get_records(main_tag, limit, before_id)
+        arcadia_vine: Vine = Vine(self._logging_object, main_tag.lower(), records, self._data_view_type)
+        if order_by_related:
+            arcadia_vine.order_sub_nodes(self._related_ranks(main_tag))
+        if self._data_view_type == DataViewType.RAW:
+            return arcadia_vine.get_vine_root()
+        return arcadia_vine.__str__()
+
+    def write_summary(self, main_tag: str, stream: TextIO, node_limit: Optional[int] = None,
+                      line_limit: Optional[int] = None, order_by_related: bool = False) -> None:
+        try:
+            records: Iterator[ArcadiaDbRecord] = itertools.chain(
+                self._arcadia_db.iter_found_records({'search_term': main_tag, 'data_type': ArcadiaDataType.NOTE}),
+                self._arcadia_db.iter_found_records({'search_term': main_tag, 'data_type': ArcadiaDataType.URL})
+            )
+            arcadia_vine: Vine = Vine(self._logging_object, main_tag.lower(), (), self._data_view_type)
+            arcadia_vine.write_records(records, stream, node_limit, line_limit,
+                                       self._related_ranks(main_tag) if order_by_related else None)
+        except TypeError as type_error:
+            self._logger.error(f'Received error writing record vine: {str(type_error)}')
+
+    def _related_ranks(self, main_tag: str) -> dict[str, float]:
+        related_subjects: list[RelatedSubject] = self.get_related_subjects(main_tag, max(1, self.get_subject_count()))
+        return {related_subject['tag']: related_subject['lift'] for related_subject in related_subjects}
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> Union[list[ArcadiaSearchResult], str]:
+        try:
+            highlight: tuple[str, str] = ('*', '*') \
+                if self._data_view_type == DataViewType.ENHANCED_TEXT else ('[', ']')
+            results: list[ArcadiaSearchResult] = []
+            for item in self._arcadia_db.search_records(query, limit, offset, highlight):
+                search_result: ArcadiaSearchResult = {
+                    'rank': item.pop('rank'),
+                    'title_snippet': item.pop('title_snippet'),
+                    'description_snippet': item.pop('description_snippet'),
+                    'item': item
+                }
+                results.append(search_result)
+            return results if self._data_view_type == DataViewType.RAW else Arcadia._search_string(query, results)
+        except sqlite3.Error as error:
+            self._logger.error(f'Received error searching arcadia for "{query}": {str(error)}')
+            return [] if self._data_view_type == DataViewType.RAW else Arcadia._search_string(query, [])
+
+    @staticmethod
+    def _search_string(query: str, results: list[ArcadiaSearchResult]) -> str:
+        title_view: str = f'🔎  {query}\n'
+        if not results:
+            return f'{title_view} No results found\n'
+        return title_view + ''.join(
+            f'  ◦ {result["item"]["time_stamp"]} [{Vine.tag_string(result["item"]["tags"])}]: '
+            f'{result["item"]["data"]}\n'
+            f'{Arcadia._search_snippet_string(result)}'
+            for result in results
+        )
+
+    @staticmethod
+    def _search_snippet_string(result: ArcadiaSearchResult) -> str:
+        if result['item']['title'] == 'None':
+            return ''
+        return f'     {result["title_snippet"]}\n'
+
     def get_subjects(self) -> Union[str, list]:
         try:
-            db_tags: list[sqlite3.Row] = self._arcadia_db.get_tags()
-            subjects: list = [db_tag[0] for db_tag in db_tags]
-            subjects.sort(key=lambda subject: subject.lower())
+            subjects: list[str] = list(self._cached(('subjects',), self._get_subjects_list))
             return subjects if self._data_view_type == DataViewType.RAW else Vine.tag_string(subjects)
         except TypeError as type_error:
             self._logger.error(f'Received error getting arcadia subjects: {str(type_error)}')
 
     def get_subject_count(self) -> int:
-        return int(self._arcadia_db.get_tag_count()[0])
+        return self._cached(('subject_count',), lambda: int(self._arcadia_db.get_tag_count()[0]))
 
-    def get_counts_of_subjects(self) -> list[dict]:
-        return [dict(row) for row in self._arcadia_db.get_tags_with_count()]
+    def get_counts_of_subjects(self, limit: Optional[int] = None) -> list[dict]:
+        return [dict(subject_count) for subject_count in self._cached(
+            ('subject_counts', limit), lambda: [dict(row) for row in self._arcadia_db.get_tags_with_count(limit)]
+        )]
 
-    def get_subjects_dictionary(self) -> dict[str:list[str]]:
+    def get_related_subjects(self, main_tag: str, k: int = 10, metric: str = 'lift',
+                             min_count: int = 1) -> list[RelatedSubject]:
         try:
-            subjects_list = self._get_subjects_list()
-            ascii_start: int = 65
-            ascii_stop: int = 91
-            ascii_loop_counter: int = ascii_start
-            ascii_range: int = ascii_stop - ascii_start
-            alphabetical_tags: dict[str:list[str]] = {}
-
-            for index in range(ascii_range):
-                if ascii_loop_counter < ascii_stop:
-                    key_letter: str = chr(ascii_loop_counter)
-                    alphabetical_tags[key_letter] = []
-                    for subject_index in range(len(subjects_list)):
-                        if subjects_list[subject_index] and subjects_list[subject_index][0]:
-                            subject_first_letter: str = subjects_list[subject_index][0].capitalize()
-                            if subject_first_letter == key_letter:
-                                alphabetical_tags[key_letter].append(subjects_list[subject_index])
-                ascii_loop_counter += 1
-            return alphabetical_tags
+            return [dict(related_subject) for related_subject in self._cached(
+                ('related', main_tag.lower(), k, metric, min_count),
+                lambda: self._rank_related_subjects(main_tag, k, metric, min_count)
+            )]
+        except sqlite3.Error as error:
+            self._logger.error(f'Received error getting related subjects for "{main_tag}": {str(error)}')
+            return []
+
+    def _rank_related_subjects(self, main_tag: str, k: int, metric: str, min_count: int) -> list[RelatedSubject]:
+        return CoOccurrence.rank(
+            (tuple(db_row) for db_row in self._arcadia_db.get_related_tags(main_tag, min_count)),
+            self._arcadia_db.get_tag_item_count(main_tag),
+            self.get_item_count(),
+            k,
+            metric
+        )
+
+    def rebuild_subject_stats(self) -> int:
+        tag_count: int = self._arcadia_db.rebuild_tag_stats()
+        self._arcadia_db.rebuild_tag_pairs()
+        self._tags_changed()
+        self._items_changed()
+        return tag_count
+
+    def get_subjects_dictionary(self) -> dict[str, list[str]]:
+        try:
+            self._check_data_version()
+            if self._subjects_dictionary is None:
+                alphabetical_tags: dict[str, list[str]] = {chr(letter): [] for letter in range(ord('A'), ord('Z') + 1)}
+                for subject in self._cached(('subjects',), self._get_subjects_list):
+                    if subject:
+                        alphabetical_tags.setdefault(Arcadia._subject_bucket(subject), []).append(subject)
+                self._subjects_dictionary = alphabetical_tags
+            return {bucket: list(subjects) for bucket, subjects in self._subjects_dictionary.items()}
         except TypeError as type_error:
             self._logger.error(f'Received error getting subjects dict: {str(type_error)}')
         except Exception as error:
             self._logger.error(f'Received error trying to get subjects dict: {str(error)}')
 
+    def get_subjects_dictionary_counts(self) -> dict[str, int]:
+        subjects_dictionary: dict[str, list[str]] = self.get_subjects_dictionary() or {}
+        return {bucket: len(subjects) for bucket, subjects in subjects_dictionary.items()}
+
     def get_similar_subjects(self, main_tag: str) -> list[str]:
         try:
-            similar_subjects: list[str] = []
-            subjects_list = self._get_subjects_list()
             lowercase_main_tag: str = main_tag.lower()
-
-            for subject in subjects_list:
-                if lowercase_main_tag != subject and lowercase_main_tag in subject:
-                    similar_subjects.append(subject)
-            return similar_subjects
+            return [
+                subject for subject in self._get_tag_index().search_substring(lowercase_main_tag)
+                if lowercase_main_tag != subject and lowercase_main_tag in subject
+            ]
         except TypeError as type_error:
             self._logger.error(f'Received error getting similar subjects: {str(type_error)}')
 
+    def suggest_subjects(self, query: str, limit: int = 10, max_distance: int = 2) -> list[str]:
+        try:
+            return self._get_tag_index().suggest(query, limit, max_distance)
+        except TypeError as type_error:
+            self._logger.error(f'Received error suggesting subjects: {str(type_error)}')
+            return []
+
     def update_item_meta(self, db_url: str) -> None:
+        from .collectors.scraper import Scraper
         try:
             self._logger.info(f'Attempting to get: {db_url}')
-            payload = Scraper.get_url_meta(db_url)
+            payload = Scraper.get_url_meta(db_url, cache=self._scrape_cache)
+            self.set_item_meta(db_url, payload)
+        except Exception as e:
+            self._logger.error(f'Exception was thrown: {str(e)}')
+
+    def set_item_meta(self, db_url: str, payload: dict) -> bool:
+        if not payload:
+            self._logger.error(f'Unsuccessful getting meta for: {db_url}')
+            return False
+        self._check_data_version()
+        self._arcadia_db.update_record_meta(db_url, *Arcadia._meta_from_payload(payload))
+        self._items_changed('summary')
+        return True
 
+    def set_items_meta(self, url_payloads: Iterable[tuple[str, dict]]) -> int:
+        meta_updates: list[tuple[str, str, str, str]] = []
+        for db_url, payload in url_payloads:
             if payload:
-                title = payload['title']['content'] if payload['title'] else 'None'
-                description = payload['description']['content'] if payload['description'] else 'None'
-                image = payload['image']['href'] if payload['image'] else 'None'
-                self._arcadia_db.update_record_meta(
-                    db_url,
-                    title.strip(),
-                    description.strip(),
-                    image.strip()
-                )
+                meta_updates.append((db_url, *Arcadia._meta_from_payload(payload)))
             else:
                 self._logger.error(f'Unsuccessful getting meta for: {db_url}')
+        if not meta_updates:
+            return 0
+        self._check_data_version()
+        updated_count: int = self._arcadia_db.update_records_meta(meta_updates)
+        self._items_changed('summary')
+        return updated_count
+
+    @staticmethod
+    def _meta_from_payload(payload: dict) -> tuple[str, str, str]:
+        title = payload['title']['content'] if payload['title'] else 'None'
+        description = payload['description']['content'] if payload['description'] else 'None'
+        image = payload['image']['href'] if payload['image'] else 'None'
+        return title.strip(), description.strip(), image.strip()
+
+    def update_items_meta(self, db_urls: Iterable[str], workers: int = 8, host_concurrency: int = 2,
+                          host_delay: float = 1.0, batch_size: int = 100) -> int:
+        from .collectors.scrape_pool import ScrapePool
+        scrape_pool: ScrapePool = ScrapePool(self._logging_object, workers, host_concurrency, host_delay,
+                                             cache=self._scrape_cache)
+        url_payloads: list[tuple[str, dict]] = []
+        updated_count: int = 0
+        try:
+            for url_payload in scrape_pool.scrape(db_urls):
+                url_payloads.append(url_payload)
+                if len(url_payloads) >= batch_size:
+                    updated_count += self.set_items_meta(url_payloads)
+                    url_payloads = []
+            if url_payloads:
+                updated_count += self.set_items_meta(url_payloads)
         except Exception as e:
             self._logger.error(f'Exception was thrown: {str(e)}')
+        finally:
+            scrape_pool.close()
+        return updated_count
+
+    def process_enrichment_queue(self, limit: int = 500, workers: int = 8, host_concurrency: int = 2,
+                                 host_delay: float = 1.0, batch_size: int = 100, max_attempts: int = 5,
+                                 retry_delay: float = 300.0, max_retry_delay: float = 86400.0,
+                                 claim_lease: float = 3600.0) -> EnrichmentResponse:
+        from .collectors.scrape_pool import ScrapePool
+        scrape_pool: ScrapePool = ScrapePool(self._logging_object, workers, host_concurrency, host_delay,
+                                             cache=self._scrape_cache, retries=1)
+        return Arcadia.run_enrichment(lambda method_name, *args: getattr(self, method_name)(*args), self._logger,
+                                      scrape_pool, limit, batch_size, max_attempts, retry_delay, max_retry_delay,
+                                      claim_lease)
+
+    @staticmethod
+    def run_enrichment(call: Callable[..., Any], logger: logging.Logger, scrape_pool: 'ScrapePool', limit: int,
+                       batch_size: int, max_attempts: int, retry_delay: float, max_retry_delay: float,
+                       claim_lease: float) -> EnrichmentResponse:
+        from .collectors.scrape_pool import ScrapePool
+        response: EnrichmentResponse = {
+            'attempted': 0,
+            'updated': 0,
+            'failed': 0,
+            'deferred': 0
+        }
+        due_items: dict[str, dict] = {}
+        deferrals: list[tuple[int, float]] = []
+        url_payloads: list[tuple[str, dict]] = []
+        failures: list[tuple[int, float, str]] = []
+        failed_hosts: set[str] = set()
+        succeeded_hosts: set[str] = set()
+        attempted_urls: set[str] = set()
+        try:
+            due_items, deferrals = call('claim_enrichment_items', limit, claim_lease)
+            response['deferred'] = len(deferrals)
+            for db_url, payload, error in scrape_pool.scrape_results(due_items):
+                response['attempted'] += 1
+                attempted_urls.add(db_url)
+                if payload:
+                    url_payloads.append((db_url, payload))
+                    succeeded_hosts.add(ScrapePool.get_host(db_url))
+                else:
+                    attempts: int = due_items[db_url]['attempts']
+                    failures.append((
+                        due_items[db_url]['item_id'],
+                        time.time() + min(max_retry_delay, retry_delay * 2 ** attempts),
+                        error or 'No meta data found'
+                    ))
+                    failed_hosts.add(ScrapePool.get_host(db_url))
+                if len(url_payloads) >= batch_size:
+                    response['updated'] += call('set_items_meta', url_payloads)
+                    url_payloads = []
+        except Exception as e:
+            logger.error(f'Exception was thrown: {str(e)}')
+        finally:
+            scrape_pool.close()
+            if url_payloads:
+                response['updated'] += call('set_items_meta', url_payloads)
+            call('finish_enrichments', failures, deferrals,
+                 [enrichment['item_id'] for db_url, enrichment in due_items.items() if db_url not in attempted_urls],
+                 sorted(failed_hosts - succeeded_hosts), sorted(succeeded_hosts), max_attempts, retry_delay,
+                 max_retry_delay)
+        response['failed'] = len(failures)
+        logger.info(f'Enrichment attempted: {response["attempted"]}, updated: {response["updated"]}, '
+                    f'failed: {response["failed"]}, deferred: {response["deferred"]}')
+        return response
+
+    def claim_enrichment_items(self, limit: int, claim_lease: float) -> tuple[dict[str, dict], list[tuple[int, float]]]:
+        from .collectors.scrape_pool import ScrapePool
+        now: float = time.time()
+        host_backoffs: dict[str, float] = self._arcadia_db.get_enrichment_host_backoffs(now)
+        due_items: dict[str, dict] = {}
+        deferrals: list[tuple[int, float]] = []
+        for enrichment in self._arcadia_db.claim_enrichments(now, limit, now + claim_lease):
+            host: str = ScrapePool.get_host(enrichment['url'])
+            if host in host_backoffs:
+                deferrals.append((enrichment['item_id'], host_backoffs[host]))
+            else:
+                due_items[enrichment['url']] = dict(enrichment)
+        return due_items, deferrals
+
+    def finish_enrichments(self, failures: list[tuple[int, float, str]], deferrals: list[tuple[int, float]],
+                           unattempted_ids: list[int], failed_hosts: list[str], succeeded_hosts: list[str],
+                           max_attempts: int, retry_delay: float, max_retry_delay: float) -> None:
+        now: float = time.time()
+        self._arcadia_db.record_enrichment_attempts(failures, deferrals, max_attempts)
+        self._arcadia_db.release_enrichments(unattempted_ids, now)
+        self._arcadia_db.record_enrichment_hosts(failed_hosts, succeeded_hosts, now, retry_delay, max_retry_delay)
+
+    def enqueue_url_items(self) -> int:
+        return self._arcadia_db.enqueue_url_records()
+
+    def retry_failed_enrichments(self) -> int:
+        return self._arcadia_db.retry_failed_enrichments()
+
+    def get_enrichment_counts(self) -> dict[str, int]:
+        return self._arcadia_db.get_enrichment_counts()
 
     def update_item(self, data_key: str, new_data_key: str, title: str, tags: list[str], description: str,
                     image_location: str) -> UpdateDbItemResponse:
@@ -173,6 +487,8 @@ class Arcadia:
             try:
                 response = self._arcadia_db.update_record(data_key, new_data_key, title, tags, description,
                                                           image_location)
+                self._tags_changed()
+                self._items_changed()
             except Exception as e:
                 self._logger.error(f'Exception was thrown: {str(e)}')
             finally:
@@ -186,6 +502,8 @@ class Arcadia:
         }
         try:
             response = self._arcadia_db.delete_arc_record(data_key)
+            self._tags_changed()
+            self._items_changed()
         except Exception as exception:
             self._logger.error(f'Exception was thrown: {str(exception)}')
         finally:
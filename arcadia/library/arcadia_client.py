@@ -0,0 +1,100 @@
+import itertools
+import socket
+from typing import Any, Optional
+
+from .daemon_protocol import DaemonProtocol
+
+
+class ArcadiaDaemonError(Exception):
+    pass
+
+
+class ArcadiaClient:
+    def __init__(self, socket_path: str, timeout: Optional[float] = 30.0):
+        self.socket_path: str = socket_path
+        self._timeout: Optional[float] = timeout
+        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[Any] = None
+        self._request_ids: itertools.count = itertools.count(1)
+
+    def __enter__(self) -> 'ArcadiaClient':
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def connect_if_running(socket_path: str, timeout: Optional[float] = 30.0) -> Optional['ArcadiaClient']:
+        client: ArcadiaClient = ArcadiaClient(socket_path, timeout)
+        try:
+            client.connect()
+            return client
+        except OSError:
+            client.close()
+            return None
+
+    def connect(self) -> None:
+        if self._socket is None:
+            client_socket: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client_socket.settimeout(self._timeout)
+            try:
+                client_socket.connect(self.socket_path)
+            except OSError:
+                client_socket.close()
+                raise
+            self._socket = client_socket
+            self._reader = client_socket.makefile('rb')
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def call(self, method: str, **params) -> Any:
+        self.connect()
+        request_id: int = next(self._request_ids)
+        self._socket.sendall(DaemonProtocol.encode({'id': request_id, 'method': method, 'params': params}))
+        line: bytes = self._reader.readline()
+        if not line:
+            self.close()
+            raise ArcadiaDaemonError('Arcadia daemon closed the connection')
+        response: dict = DaemonProtocol.decode(line)
+        if 'error' in response:
+            raise ArcadiaDaemonError(response['error'])
+        return response['result']
+
+    def ping(self) -> dict:
+        return self.call('ping')
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> Any:
+        return self.call('search', query=query, limit=limit, offset=offset)
+
+    def find_items(self, filters: dict, limit: int = 50, before_id: Optional[int] = None) -> list[dict]:
+        return self.call('find', filters=filters, limit=limit, before_id=before_id)
+
+    def add_item(self, content: str, tags: list[str], data_type: str = 'URL', fetch_meta: bool = True) -> dict:
+        return self.call('add', content=content, tags=tags, data_type=data_type, fetch_meta=fetch_meta)
+
+    def get_summary(self, tag: str, node_limit: Optional[int] = None, line_limit: Optional[int] = None,
+                    order_by_related: bool = False) -> str:
+        return self.call('summary', tag=tag, node_limit=node_limit, line_limit=line_limit,
+                         order_by_related=order_by_related)
+
+    def get_similar_subjects(self, tag: str) -> list[str]:
+        return self.call('similar', tag=tag)
+
+    def get_related_subjects(self, tag: str, k: int = 10, metric: str = 'lift', min_count: int = 1) -> list[dict]:
+        return self.call('related', tag=tag, k=k, metric=metric, min_count=min_count)
+
+    def get_stats(self, subjects: int = 0) -> dict:
+        return self.call('stats', subjects=subjects)
+
+    def get_item(self, content: str) -> dict:
+        return self.call('get', content=content)
+
+    def get_random_url_items(self, count: int = 1, tag: Optional[str] = None) -> list[dict]:
+        return self.call('random', count=count, tag=tag)
@@ -0,0 +1,203 @@
+import io
+import logging.config
+import os
+import socket
+import socketserver
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .arcadia import Arcadia
+from .arcadia_types import DataViewType, RelatedSubject
+from .collectors.scrape_cache import ScrapeCache
+from .daemon_protocol import DaemonProtocol
+from .db.db_types import ItemPackage, ArcadiaDataType, RecordFilters
+from .db.tag_codec import TagCodec
+from .metrics import metrics
+
+
+class ArcadiaRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: 'ArcadiaDaemon' = self.server.arcadia_daemon
+        while True:
+            line: bytes = self.rfile.readline(DaemonProtocol.max_message_bytes + 1)
+            if not line:
+                break
+            if len(line) > DaemonProtocol.max_message_bytes:
+                self.wfile.write(DaemonProtocol.encode({'id': None, 'error': 'Request too large'}))
+                break
+            if line.strip():
+                self.wfile.write(DaemonProtocol.encode(daemon.handle_request(line)))
+
+
+class ArcadiaSocketServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads: bool = True
+
+    def __init__(self, socket_path: str, arcadia_daemon: 'ArcadiaDaemon'):
+        self.arcadia_daemon: 'ArcadiaDaemon' = arcadia_daemon
+        super().__init__(socket_path, ArcadiaRequestHandler)
+
+
+class ArcadiaDaemon:
+    def __init__(self, logging_object: Any, sql_lite_db_path: str, socket_path: Optional[str] = None,
+                 scrape_workers: int = 2, scrape_cache: Optional[ScrapeCache] = None):
+        self._logging_object = logging_object
+        self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
+        self._logger.setLevel(logging.INFO)
+        self._db_path: str = sql_lite_db_path
+        self.socket_path: str = DaemonProtocol.socket_path(sql_lite_db_path, socket_path)
+        self._scrape_cache: Optional[ScrapeCache] = scrape_cache
+        self._worker: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arcadia-daemon')
+        self._scrapers: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, scrape_workers),
+                                                                thread_name_prefix='arcadia-scraper')
+        self._arcadia: Optional[Arcadia] = None
+        self._server: Optional[ArcadiaSocketServer] = None
+        self._methods: dict[str, Callable[..., Any]] = {
+            'ping': self._ping,
+            'search': self._search,
+            'find': self._find,
+            'add': self._add,
+            'summary': self._summary,
+            'similar': self._similar,
+            'related': self._related,
+            'stats': self._stats,
+            'get': self._get,
+            'random': self._random
+        }
+
+    def __enter__(self) -> 'ArcadiaDaemon':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self._server is not None:
+            return
+        self._remove_stale_socket()
+        self._arcadia = self._worker.submit(
+            Arcadia, self._logging_object, self._db_path, DataViewType.TEXT, True, self._scrape_cache
+        ).result()
+        self._worker.submit(self._arcadia.get_subjects_dictionary).result()
+        self._server = ArcadiaSocketServer(self.socket_path, self)
+        os.chmod(self.socket_path, 0o600)
+        self._logger.info(f'Arcadia daemon listening on {self.socket_path}')
+
+    def serve_forever(self) -> None:
+        self.open()
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        self._scrapers.shutdown(wait=True)
+        if self._arcadia is not None:
+            self._worker.submit(self._arcadia.close).result()
+            self._arcadia = None
+        self._worker.shutdown(wait=True)
+        self._logger.info(f'Arcadia daemon stopped')
+
+    def _remove_stale_socket(self) -> None:
+        if not os.path.exists(self.socket_path):
+            return
+        probe: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            raise RuntimeError(f'An Arcadia daemon is already listening on {self.socket_path}')
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.socket_path)
+        finally:
+            probe.close()
+
+    def handle_request(self, line: bytes) -> dict:
+        request_id: Any = None
+        method: str = 'unknown'
+        try:
+            request: dict = DaemonProtocol.decode(line)
+            request_id = request.get('id')
+            method = request.get('method', '')
+            if method not in self._methods:
+                metrics.inc('arcadia_daemon_requests_total', method='unknown', outcome='error')
+                return {'id': request_id, 'error': f'Unknown method: {method}'}
+            params: dict = request.get('params') or {}
+            with metrics.timer('arcadia_daemon_request_seconds', method=method):
+                result: Any = self._worker.submit(self._methods[method], **params).result()
+            metrics.inc('arcadia_daemon_requests_total', method=method, outcome='ok')
+            return {'id': request_id, 'result': result}
+        except Exception as error:
+            self._logger.error(f'Error handling daemon request {method}: {str(error)}')
+            metrics.inc('arcadia_daemon_requests_total', method=method, outcome='error')
+            return {'id': request_id, 'error': str(error)}
+
+    def _ping(self) -> dict:
+        return {'pid': os.getpid(), 'db': os.path.abspath(self._db_path)}
+
+    def _search(self, query: str, limit: int = 20, offset: int = 0) -> Any:
+        return self._arcadia.search(query, limit, offset)
+
+    def _find(self, filters: RecordFilters, limit: int = 50, before_id: Optional[int] = None) -> list[dict]:
+        return self._arcadia.find_items(filters, limit, before_id)
+
+    def _add(self, content: str, tags: list[str], data_type: str = ArcadiaDataType.URL.value,
+             fetch_meta: bool = True) -> dict:
+        item_package: ItemPackage = {
+            'data_type': ArcadiaDataType(data_type),
+            'content': content,
+            'tags': tags
+        }
+        response: dict = self._arcadia.add_item(item_package)
+        response['data'] = [
+            {**dict(row), 'tags': TagCodec.decode_tags(row['tags'])} if isinstance(row, sqlite3.Row) else row
+            for row in response['data']
+        ]
+        if fetch_meta and response['added_item'] and item_package['data_type'] == ArcadiaDataType.URL:
+            self._scrapers.submit(self._fetch_meta, content)
+        return response
+
+    def _fetch_meta(self, db_url: str) -> None:
+        from .collectors.scraper import Scraper
+        try:
+            self._logger.info(f'Attempting to get: {db_url}')
+            payload: dict = Scraper.get_url_meta(db_url, cache=self._scrape_cache)
+            meta_update: Future = self._worker.submit(self._arcadia.set_item_meta, db_url, payload)
+            meta_update.result()
+        except Exception as e:
+            self._logger.error(f'Exception was thrown: {str(e)}')
+
+    def _summary(self, tag: str, node_limit: Optional[int] = None, line_limit: Optional[int] = None,
+                 order_by_related: bool = False) -> str:
+        summary: io.StringIO = io.StringIO()
+        self._arcadia.write_summary(tag, summary, node_limit, line_limit, order_by_related)
+        return summary.getvalue()
+
+    def _similar(self, tag: str) -> list[str]:
+        return self._arcadia.get_similar_subjects(tag)
+
+    def _related(self, tag: str, k: int = 10, metric: str = 'lift', min_count: int = 1) -> list[RelatedSubject]:
+        return self._arcadia.get_related_subjects(tag, k, metric, min_count)
+
+    def _stats(self, subjects: int = 0) -> dict:
+        return {
+            'tag_count': self._arcadia.get_subject_count(),
+            'item_count': self._arcadia.get_item_count(),
+            'url_count': self._arcadia.get_url_item_count(),
+            'enrichment': self._arcadia.get_enrichment_counts(),
+            'cache': self._arcadia.get_cache_stats(),
+            'subjects': self._arcadia.get_counts_of_subjects(subjects) if subjects else []
+        }
+
+    def _get(self, content: str) -> dict:
+        return self._arcadia.get_item(content)
+
+    def _random(self, count: int = 1, tag: Optional[str] = None) -> list[dict]:
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError('count must be a positive integer')
+        return self._arcadia.get_random_url_items(count, tag)
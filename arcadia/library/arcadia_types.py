@@ -26,3 +26,18 @@ class VineRoot(TypedDict):
     main_node: Union[VineNode, None]
     sub_node: list[VineNode]
 
+
+class RelatedSubject(TypedDict):
+    tag: str
+    pair_count: int
+    item_count: int
+    lift: float
+    pmi: float
+    npmi: float
+
+
+class ArcadiaSearchResult(TypedDict):
+    item: ArcadiaDbRecord
+    rank: float
+    title_snippet: str
+    description_snippet: str
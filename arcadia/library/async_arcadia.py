@@ -0,0 +1,286 @@
+import asyncio
+import logging.config
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TextIO, Union
+
+from willow_core.library.db_types import DeleteDbItemResponse, UpdateDbItemResponse, AddDbItemResponse
+from .arcadia import Arcadia
+from .arcadia_types import DataViewType, VineRoot, ArcadiaSearchResult, RelatedSubject
+from .collectors.scrape_cache import ScrapeCache
+from .db.db_types import ItemPackage, ArcadiaDataType, ArcadiaDbRecord, AddDbItemsResponse, EnrichmentResponse, \
+    RecordFilters
+from .query_cache import QueryCacheStats
+
+
+class AsyncArcadia:
+    def __init__(self, logging_object: Any, sql_lite_db_path: str, data_view_type: DataViewType, readers: int = 4,
+                 scrape_workers: int = 4, scrape_cache: Optional[ScrapeCache] = None):
+        self._logging_object = logging_object
+        self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
+        self._logger.setLevel(logging.INFO)
+        self._db_path: str = sql_lite_db_path
+        self._data_view_type: DataViewType = data_view_type
+        self._scrape_cache: Optional[ScrapeCache] = scrape_cache
+        self._reader_count: int = max(1, readers)
+        self._scrape_workers: int = max(1, scrape_workers)
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._readers: list[ThreadPoolExecutor] = []
+        self._scrapers: Optional[ThreadPoolExecutor] = None
+        self._thread_local: threading.local = threading.local()
+        self._idle_readers: Optional[asyncio.Queue] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> 'AsyncArcadia':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self._idle_readers is not None:
+            return
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._idle_readers is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arcadia-writer')
+                self._readers = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'arcadia-reader-{reader}')
+                    for reader in range(self._reader_count)
+                ]
+                self._scrapers = ThreadPoolExecutor(max_workers=self._scrape_workers,
+                                                    thread_name_prefix='arcadia-scraper')
+                await asyncio.get_running_loop().run_in_executor(self._writer, self._thread_arcadia)
+                idle_readers: asyncio.Queue = asyncio.Queue()
+                for reader in self._readers:
+                    idle_readers.put_nowait(reader)
+                self._idle_readers = idle_readers
+
+    async def close(self) -> None:
+        await self.wait_for_background()
+        if self._idle_readers is None:
+            return
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(executor, self._close_thread_arcadia) for executor in [self._writer, *self._readers]
+        ])
+        for executor in [self._writer, *self._readers, self._scrapers]:
+            executor.shutdown(wait=True)
+        self._writer = None
+        self._readers = []
+        self._scrapers = None
+        self._idle_readers = None
+        self._open_lock = None
+
+    async def wait_for_background(self) -> None:
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    def _thread_arcadia(self) -> Arcadia:
+        arcadia: Optional[Arcadia] = getattr(self._thread_local, 'arcadia', None)
+        if arcadia is None:
+            arcadia = Arcadia(self._logging_object, self._db_path, self._data_view_type, persistent=True,
+                              scrape_cache=self._scrape_cache)
+            self._thread_local.arcadia = arcadia
+        return arcadia
+
+    def _close_thread_arcadia(self) -> None:
+        arcadia: Optional[Arcadia] = getattr(self._thread_local, 'arcadia', None)
+        if arcadia is not None:
+            arcadia.close()
+            self._thread_local.arcadia = None
+
+    def _call(self, method_name: str, *args, **kwargs) -> Any:
+        return getattr(self._thread_arcadia(), method_name)(*args, **kwargs)
+
+    async def _read(self, method_name: str, *args, **kwargs) -> Any:
+        await self.open()
+        reader: ThreadPoolExecutor = await self._idle_readers.get()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                reader, partial(self._call, method_name, *args, **kwargs)
+            )
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    async def _write(self, method_name: str, *args, **kwargs) -> Any:
+        await self.open()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._writer, partial(self._call, method_name, *args, **kwargs)
+        )
+
+    async def _scrape(self, function: Callable, *args, **kwargs) -> Any:
+        await self.open()
+        return await asyncio.get_running_loop().run_in_executor(self._scrapers, partial(function, *args, **kwargs))
+
+    def _run_in_background(self, coroutine) -> asyncio.Task:
+        task: asyncio.Task = asyncio.get_running_loop().create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def get_url_item_count(self) -> int:
+        return await self._read('get_url_item_count')
+
+    async def get_item_count(self) -> int:
+        return await self._read('get_item_count')
+
+    async def get_item(self, item_key) -> ArcadiaDbRecord:
+        return await self._read('get_item', item_key)
+
+    async def get_random_url_item(self) -> ArcadiaDbRecord:
+        return await self._read('get_random_url_item')
+
+    async def get_random_url_items(self, count: int, tag: Optional[str] = None) -> list[ArcadiaDbRecord]:
+        return await self._read('get_random_url_items', count, tag)
+
+    async def add_item(self, item_package: ItemPackage, wait_for_meta: bool = False) -> AddDbItemResponse:
+        response: AddDbItemResponse = await self._write('add_item', item_package, fetch_meta=False)
+        if response['added_item'] and item_package['data_type'] == ArcadiaDataType.URL:
+            meta_task: asyncio.Task = self._run_in_background(self.update_item_meta(item_package['content']))
+            if wait_for_meta:
+                await meta_task
+        return response
+
+    async def add_items(self, item_packages: Iterable[ItemPackage], batch_size: int = 500) -> AddDbItemsResponse:
+        return await self._write('add_items', item_packages, batch_size)
+
+    async def get_items(self, search_term: str, limit: int = 50,
+                        before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        return await self._read('get_items', search_term, limit, before_id)
+
+    async def iter_items(self, search_term: str, before_id: Optional[int] = None,
+                         page_size: int = 200) -> AsyncIterator[ArcadiaDbRecord]:
+        while True:
+            items: list[ArcadiaDbRecord] = await self.get_items(search_term, page_size, before_id)
+            for item in items:
+                yield item
+            if len(items) < page_size:
+                return
+            before_id = items[-1]['ID']
+
+    async def find_items(self, filters: RecordFilters, limit: int = 50,
+                         before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        return await self._read('find_items', filters, limit, before_id)
+
+    async def get_summary(self, main_tag: str, limit: Optional[int] = None, before_id: Optional[int] = None,
+                          order_by_related: bool = False) -> Union[VineRoot, str]:
+        return await self._read('get_summary', main_tag, limit, before_id, order_by_related)
+
+    async def write_summary(self, main_tag: str, stream: TextIO, node_limit: Optional[int] = None,
+                            line_limit: Optional[int] = None, order_by_related: bool = False) -> None:
+        await self._read('write_summary', main_tag, stream, node_limit, line_limit, order_by_related)
+
+    async def search(self, query: str, limit: int = 20, offset: int = 0) -> Union[list[ArcadiaSearchResult], str]:
+        return await self._read('search', query, limit, offset)
+
+    async def get_subjects(self) -> Union[str, list]:
+        return await self._read('get_subjects')
+
+    async def get_subject_count(self) -> int:
+        return await self._read('get_subject_count')
+
+    async def get_counts_of_subjects(self, limit: Optional[int] = None) -> list[dict]:
+        return await self._read('get_counts_of_subjects', limit)
+
+    async def get_related_subjects(self, main_tag: str, k: int = 10, metric: str = 'lift',
+                                   min_count: int = 1) -> list[RelatedSubject]:
+        return await self._read('get_related_subjects', main_tag, k, metric, min_count)
+
+    async def rebuild_subject_stats(self) -> int:
+        return await self._write('rebuild_subject_stats')
+
+    async def get_subjects_dictionary(self) -> dict[str, list[str]]:
+        return await self._read('get_subjects_dictionary')
+
+    async def get_subjects_dictionary_counts(self) -> dict[str, int]:
+        return await self._read('get_subjects_dictionary_counts')
+
+    async def get_similar_subjects(self, main_tag: str) -> list[str]:
+        return await self._read('get_similar_subjects', main_tag)
+
+    async def suggest_subjects(self, query: str, limit: int = 10, max_distance: int = 2) -> list[str]:
+        return await self._read('suggest_subjects', query, limit, max_distance)
+
+    async def get_cache_stats(self) -> QueryCacheStats:
+        await self.open()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        thread_stats: list[QueryCacheStats] = await asyncio.gather(*[
+            loop.run_in_executor(executor, self._call, 'get_cache_stats') for executor in [self._writer, *self._readers]
+        ])
+        return {stat: sum(stats[stat] for stats in thread_stats) for stat in thread_stats[0]}
+
+    async def update_item_meta(self, db_url: str) -> bool:
+        from .collectors.scraper import Scraper
+        try:
+            self._logger.info(f'Attempting to get: {db_url}')
+            payload: dict = await self._scrape(Scraper.get_url_meta, db_url, cache=self._scrape_cache)
+            return await self._write('set_item_meta', db_url, payload)
+        except Exception as e:
+            self._logger.error(f'Exception was thrown: {str(e)}')
+            return False
+
+    def _update_items_meta(self, db_urls: Iterable[str], workers: int, host_concurrency: int, host_delay: float,
+                           batch_size: int) -> int:
+        from .collectors.scrape_pool import ScrapePool
+        scrape_pool: ScrapePool = ScrapePool(self._logging_object, workers, host_concurrency, host_delay,
+                                             cache=self._scrape_cache)
+        url_payloads: list[tuple[str, dict]] = []
+        updated_count: int = 0
+        try:
+            for url_payload in scrape_pool.scrape(db_urls):
+                url_payloads.append(url_payload)
+                if len(url_payloads) >= batch_size:
+                    updated_count += self._writer.submit(self._call, 'set_items_meta', url_payloads).result()
+                    url_payloads = []
+            if url_payloads:
+                updated_count += self._writer.submit(self._call, 'set_items_meta', url_payloads).result()
+        except Exception as e:
+            self._logger.error(f'Exception was thrown: {str(e)}')
+        finally:
+            scrape_pool.close()
+        return updated_count
+
+    async def update_items_meta(self, db_urls: Iterable[str], workers: int = 8, host_concurrency: int = 2,
+                                host_delay: float = 1.0, batch_size: int = 100) -> int:
+        await self.open()
+        return await self._scrape(self._update_items_meta, db_urls, workers, host_concurrency, host_delay, batch_size)
+
+    def _process_enrichment_queue(self, limit: int, workers: int, host_concurrency: int, host_delay: float,
+                                  batch_size: int, max_attempts: int, retry_delay: float, max_retry_delay: float,
+                                  claim_lease: float) -> EnrichmentResponse:
+        from .collectors.scrape_pool import ScrapePool
+        scrape_pool: ScrapePool = ScrapePool(self._logging_object, workers, host_concurrency, host_delay,
+                                             cache=self._scrape_cache, retries=1)
+        return Arcadia.run_enrichment(lambda method_name, *args: self._writer.submit(self._call, method_name,
+                                                                                     *args).result(),
+                                      self._logger, scrape_pool, limit, batch_size, max_attempts, retry_delay,
+                                      max_retry_delay, claim_lease)
+
+    async def process_enrichment_queue(self, limit: int = 500, workers: int = 8, host_concurrency: int = 2,
+                                       host_delay: float = 1.0, batch_size: int = 100, max_attempts: int = 5,
+                                       retry_delay: float = 300.0, max_retry_delay: float = 86400.0,
+                                       claim_lease: float = 3600.0) -> EnrichmentResponse:
+        await self.open()
+        return await self._scrape(self._process_enrichment_queue, limit, workers, host_concurrency, host_delay,
+                                  batch_size, max_attempts, retry_delay, max_retry_delay, claim_lease)
+
+    async def enqueue_url_items(self) -> int:
+        return await self._write('enqueue_url_items')
+
+    async def retry_failed_enrichments(self) -> int:
+        return await self._write('retry_failed_enrichments')
+
+    async def get_enrichment_counts(self) -> dict[str, int]:
+        return await self._read('get_enrichment_counts')
+
+    async def update_item(self, data_key: str, new_data_key: str, title: str, tags: list[str], description: str,
+                          image_location: str) -> UpdateDbItemResponse:
+        return await self._write('update_item', data_key, new_data_key, title, tags, description, image_location)
+
+    async def delete_item(self, data_key: str) -> DeleteDbItemResponse:
+        return await self._write('delete_item', data_key)
@@ -0,0 +1,42 @@
+import heapq
+import math
+from typing import Iterable
+
+from .arcadia_types import RelatedSubject
+
+
+class CoOccurrence:
+    metrics: tuple[str, ...] = ('lift', 'pmi', 'npmi', 'pair_count')
+    # Items with more tags than this are left out of TAG_PAIRS but still counted in TAG_STATS, so the pair counts
+    # of tags used on such items are understated and their lift and PMI skew low.
+    max_item_tags: int = 50
+
+    @staticmethod
+    def score(tag: str, pair_count: int, tag_count: int, item_count: int, total_count: int) -> RelatedSubject:
+        lift: float = pair_count * total_count / (tag_count * item_count) if tag_count and item_count else 0.0
+        pmi: float = math.log(lift) if lift > 0 else -math.inf
+        joint_probability: float = pair_count / total_count if total_count else 0.0
+        npmi: float = pmi / -math.log(joint_probability) if 0 < joint_probability < 1 else float(lift > 0)
+        return {
+            'tag': tag,
+            'pair_count': pair_count,
+            'item_count': item_count,
+            'lift': lift,
+            'pmi': pmi,
+            'npmi': npmi
+        }
+
+    @staticmethod
+    def rank(pairs: Iterable[tuple[str, int, int]], tag_count: int, total_count: int, k: int = 10,
+             metric: str = 'lift') -> list[RelatedSubject]:
+        if metric not in CoOccurrence.metrics:
+            raise ValueError(f'Unknown co-occurrence metric: {metric}')
+        total_count = max(total_count, tag_count)
+        related_subjects: Iterable[RelatedSubject] = (
+            CoOccurrence.score(tag, pair_count, tag_count, item_count, total_count)
+            for tag, pair_count, item_count in pairs
+        )
+        return heapq.nlargest(
+            k, related_subjects,
+            key=lambda subject: (subject[metric], subject['pair_count'], -subject['item_count'])
+        )
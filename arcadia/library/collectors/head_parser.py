@@ -0,0 +1,116 @@
+from html.parser import HTMLParser
+from typing import Optional
+
+
+class HeadParser(HTMLParser):
+    title_length: int = 90
+    description_length: int = 300
+    max_image_size: int = 200
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.head_complete: bool = False
+        self._title: Optional[str] = None
+        self._in_title: bool = False
+        self._meta_properties: dict[str, Optional[str]] = {}
+        self._meta_names: dict[str, Optional[str]] = {}
+        self._icons: list[dict[str, Optional[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self.head_complete:
+            return
+        attributes: dict[str, Optional[str]] = dict(attrs)
+        if tag == 'title' and self._title is None:
+            self._in_title = True
+            self._title = ''
+        elif tag == 'meta':
+            if attributes.get('property'):
+                self._meta_properties.setdefault(attributes['property'].lower(), attributes.get('content'))
+            if attributes.get('name'):
+                self._meta_names.setdefault(attributes['name'].lower(), attributes.get('content'))
+        elif tag == 'link' and 'icon' in (attributes.get('rel') or '').lower().split():
+            self._icons.append(attributes)
+        elif tag == 'body':
+            self.head_complete = True
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'title':
+            self._in_title = False
+        elif tag == 'head':
+            self.head_complete = True
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title += data
+
+    def get_url_title(self) -> dict:
+        og_title: Optional[str] = self._meta_properties.get('og:title')
+        if og_title is not None:
+            return {
+                'type': 'OpenGraph',
+                'content': og_title[:self.title_length]
+            }
+        if self._title:
+            return {
+                'type': 'Meta',
+                'content': self._title[:self.title_length].strip()
+            }
+        return {}
+
+    def get_url_description(self) -> dict:
+        og_description: Optional[str] = self._meta_properties.get('og:description')
+        if og_description is not None:
+            return {
+                'type': 'OpenGraph',
+                'content': og_description[:self.description_length]
+            }
+        description: Optional[str] = self._meta_names.get('description')
+        if description is not None:
+            return {
+                'type': 'Meta',
+                'content': description[:self.description_length]
+            }
+        return {}
+
+    def get_url_image(self) -> dict:
+        og_image: Optional[str] = self._meta_properties.get('og:image')
+        if og_image is not None:
+            return {
+                'type': 'OpenGraph',
+                'href': og_image
+            }
+        if not self._icons:
+            return {}
+
+        largest_icon_href = ''
+        largest_icon_size = 0
+        largest_size = 0
+        for icon in self._icons:
+            sizes: Optional[str] = icon.get('sizes')
+            if sizes is not None:
+                try:
+                    icon_size = int(sizes[:sizes.lower().index('x')])
+                except ValueError:
+                    continue
+                if self.max_image_size > icon_size > largest_size:
+                    largest_size = icon_size
+                    largest_icon_size = sizes
+                    largest_icon_href = icon.get('href') or ''
+            elif largest_icon_href == '':
+                largest_icon_size = ''
+                largest_icon_href = self._icons[0].get('href') or ''
+        return {
+            'type': 'Meta',
+            'size': largest_icon_size,
+            'href': largest_icon_href
+        }
+
+    def get_package(self) -> dict:
+        return {
+            'title': self.get_url_title(),
+            'description': self.get_url_description(),
+            'image': self.get_url_image()
+        }
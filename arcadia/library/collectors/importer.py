@@ -0,0 +1,150 @@
+import csv
+import json
+import os
+from html.parser import HTMLParser
+from typing import Any, Iterator, Optional
+from ..db.db_types import ItemPackage, ArcadiaDataType
+
+
+class BookmarksParser(HTMLParser):
+    ignored_folders: set[str] = {'bookmarks', 'bookmarks_bar', 'bookmarks_toolbar', 'bookmarks_menu',
+                                 'other_bookmarks', 'mobile_bookmarks', 'favorites_bar'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.bookmarks: list[tuple[str, list[str]]] = []
+        self._folders: list[Optional[str]] = []
+        self._pending_folder: Optional[str] = None
+        self._in_folder_title: bool = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        attributes: dict = dict(attrs)
+        if tag == 'h3':
+            self._in_folder_title = True
+            self._pending_folder = ''
+        elif tag == 'dl':
+            self._folders.append(self._pending_folder)
+            self._pending_folder = None
+        elif tag == 'a' and (attributes.get('href') or '').startswith(('http://', 'https://')):
+            tags: list[str] = [folder for folder in self._folders if folder]
+            if attributes.get('tags'):
+                tags.extend(Importer.split_tags(attributes['tags']))
+            self.bookmarks.append((attributes['href'], tags))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'h3':
+            self._in_folder_title = False
+            folder: str = Importer.normalize_tag(self._pending_folder or '')
+            self._pending_folder = None if folder in self.ignored_folders else folder
+        elif tag == 'dl' and self._folders:
+            self._folders.pop()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_folder_title:
+            self._pending_folder += data
+
+
+class Importer:
+    formats: tuple[str, ...] = ('urls', 'csv', 'jsonl', 'bookmarks')
+
+    @staticmethod
+    def normalize_tag(tag: str) -> str:
+        return '_'.join(tag.strip().lower().split())
+
+    @staticmethod
+    def split_tags(tags: str) -> list[str]:
+        return [Importer.normalize_tag(tag) for tag in tags.replace(';', ',').split(',') if tag.strip()]
+
+    @staticmethod
+    def detect_format(file_path: str) -> str:
+        extension: str = os.path.splitext(file_path)[1].lower()
+        if extension == '.csv':
+            return 'csv'
+        elif extension in ('.jsonl', '.ndjson'):
+            return 'jsonl'
+        elif extension in ('.html', '.htm'):
+            return 'bookmarks'
+        return 'urls'
+
+    @staticmethod
+    def _item_package(content: str, tags: list[str], data_type: Optional[str],
+                      default_tags: list[str]) -> ItemPackage:
+        if data_type and not isinstance(data_type, str):
+            raise ValueError(f'{data_type!r} is not a valid ArcadiaDataType')
+        return {
+            'data_type': ArcadiaDataType(data_type.upper()) if data_type else ArcadiaDataType.URL,
+            'content': content.strip(),
+            'tags': tags if tags else default_tags
+        }
+
+    @staticmethod
+    def _read_urls(file_path: str, default_tags: list[str], errors: list[str]) -> Iterator[ItemPackage]:
+        with open(file_path, encoding='utf-8') as file:
+            for line in file:
+                if line.strip() and not line.lstrip().startswith('#'):
+                    yield Importer._item_package(line, [], None, default_tags)
+
+    @staticmethod
+    def _read_csv(file_path: str, default_tags: list[str], errors: list[str]) -> Iterator[ItemPackage]:
+        with open(file_path, encoding='utf-8', newline='') as file:
+            csv_reader: csv.DictReader = csv.DictReader(file)
+            for row in csv_reader:
+                try:
+                    content: str = row.get('content') or row.get('url') or row.get('data') or ''
+                    if content.strip():
+                        yield Importer._item_package(
+                            content, Importer.split_tags(row.get('tags') or ''), row.get('data_type'), default_tags
+                        )
+                except ValueError as error:
+                    errors.append(f'{file_path}:{csv_reader.line_num}: {str(error)}')
+
+    @staticmethod
+    def _jsonl_item_package(line: str, default_tags: list[str]) -> Optional[ItemPackage]:
+        record: Any = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError('JSONL line is not an object')
+        content: Any = record.get('content') or record.get('url') or record.get('data') or ''
+        raw_tags: Any = record.get('tags') or []
+        if not isinstance(content, str) or not isinstance(raw_tags, (str, list)) \
+                or not all(isinstance(tag, str) for tag in raw_tags):
+            raise ValueError('content must be a string and tags a string or list of strings')
+        tags: list[str] = Importer.split_tags(raw_tags) if isinstance(raw_tags, str) \
+            else [Importer.normalize_tag(tag) for tag in raw_tags]
+        return Importer._item_package(content, tags, record.get('data_type'), default_tags) \
+            if content.strip() else None
+
+    @staticmethod
+    def _read_jsonl(file_path: str, default_tags: list[str], errors: list[str]) -> Iterator[ItemPackage]:
+        with open(file_path, encoding='utf-8') as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item_package: Optional[ItemPackage] = Importer._jsonl_item_package(line, default_tags)
+                except ValueError as error:
+                    errors.append(f'{file_path}:{line_number}: {str(error)}')
+                    continue
+                if item_package:
+                    yield item_package
+
+    @staticmethod
+    def _read_bookmarks(file_path: str, default_tags: list[str], errors: list[str]) -> Iterator[ItemPackage]:
+        parser: BookmarksParser = BookmarksParser()
+        with open(file_path, encoding='utf-8') as file:
+            parser.feed(file.read())
+        parser.close()
+        for url, tags in parser.bookmarks:
+            yield Importer._item_package(url, list(dict.fromkeys(tags)), None, default_tags)
+
+    @staticmethod
+    def read_items(file_path: str, file_format: Optional[str] = None, default_tags: Optional[list[str]] = None,
+                   errors: Optional[list[str]] = None) -> Iterator[ItemPackage]:
+        readers: dict = {
+            'urls': Importer._read_urls,
+            'csv': Importer._read_csv,
+            'jsonl': Importer._read_jsonl,
+            'bookmarks': Importer._read_bookmarks
+        }
+        return readers[file_format or Importer.detect_format(file_path)](
+            file_path, default_tags or ['imported'], [] if errors is None else errors
+        )
@@ -0,0 +1,130 @@
+import json
+import logging.config
+import sqlite3
+import threading
+import time
+from sqlite3 import Connection, Row
+from typing import Any, Optional, TypedDict
+from urllib.parse import urlsplit, urlunsplit
+
+
+class ScrapeCacheEntry(TypedDict):
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    payload: dict
+    fetched_at: float
+
+
+class ScrapeCache:
+    default_ports: dict[str, int] = {'http': 80, 'https': 443}
+
+    def __init__(self, logging_object: Any, cache_location: str, ttl: float = 86400.0, max_age: float = 2592000.0,
+                 max_entries: int = 100000, eviction_interval: int = 500):
+        self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
+        self._logger.setLevel(logging.INFO)
+        self._ttl: float = ttl
+        self._max_age: float = max_age
+        self._max_entries: int = max_entries
+        self._eviction_interval: int = eviction_interval
+        self._writes_since_eviction: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: Connection = sqlite3.connect(cache_location, check_same_thread=False)
+        self._conn.row_factory = Row
+        self._conn.executescript(
+            'PRAGMA journal_mode = WAL;'
+            'PRAGMA synchronous = NORMAL;'
+            'CREATE TABLE IF NOT EXISTS SCRAPE_CACHE('
+            '    url TEXT PRIMARY KEY,'
+            '    etag TEXT,'
+            '    last_modified TEXT,'
+            '    payload TEXT NOT NULL,'
+            '    fetched_at REAL NOT NULL,'
+            '    accessed_at REAL NOT NULL'
+            ');'
+            'CREATE INDEX IF NOT EXISTS idx_scrape_cache_accessed_at ON SCRAPE_CACHE(accessed_at);'
+        )
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        url = url.strip()
+        if not url.lower().startswith(('http://', 'https://')):
+            url = 'https://' + url
+        parts = urlsplit(url)
+        scheme: str = parts.scheme.lower()
+        host: str = (parts.hostname or '').lower()
+        if parts.port and parts.port != ScrapeCache.default_ports.get(scheme):
+            host = f'{host}:{parts.port}'
+        return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+    def is_fresh(self, entry: ScrapeCacheEntry) -> bool:
+        return time.time() - entry['fetched_at'] < self._ttl
+
+    @staticmethod
+    def conditional_headers(entry: ScrapeCacheEntry) -> dict:
+        headers: dict = {}
+        if entry['etag']:
+            headers['if-none-match'] = entry['etag']
+        if entry['last_modified']:
+            headers['if-modified-since'] = entry['last_modified']
+        return headers
+
+    def get(self, url: str) -> Optional[ScrapeCacheEntry]:
+        cache_key: str = self.normalize_url(url)
+        with self._lock:
+            row: Optional[Row] = self._conn.execute(
+                'SELECT url, etag, last_modified, payload, fetched_at FROM SCRAPE_CACHE WHERE url = ?;',
+                [cache_key]
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE SCRAPE_CACHE SET accessed_at = ? WHERE url = ?;', [time.time(), cache_key])
+            self._conn.commit()
+        entry: dict = dict(row)
+        entry['payload'] = json.loads(entry['payload'])
+        return entry
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], payload: dict) -> None:
+        now: float = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO SCRAPE_CACHE(url, etag, last_modified, payload, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, '
+                'payload = excluded.payload, fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at;',
+                [self.normalize_url(url), etag, last_modified, json.dumps(payload), now, now]
+            )
+            self._conn.commit()
+            self._writes_since_eviction += 1
+            evict: bool = self._writes_since_eviction >= self._eviction_interval
+        if evict:
+            self.evict()
+
+    def touch(self, url: str) -> None:
+        now: float = time.time()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE SCRAPE_CACHE SET fetched_at = ?, accessed_at = ? WHERE url = ?;',
+                [now, now, self.normalize_url(url)]
+            )
+            self._conn.commit()
+
+    def evict(self) -> int:
+        with self._lock:
+            self._writes_since_eviction = 0
+            evicted: int = self._conn.execute(
+                'DELETE FROM SCRAPE_CACHE WHERE accessed_at < ?;', [time.time() - self._max_age]
+            ).rowcount
+            evicted += self._conn.execute(
+                'DELETE FROM SCRAPE_CACHE WHERE url IN ('
+                'SELECT url FROM SCRAPE_CACHE ORDER BY accessed_at DESC LIMIT -1 OFFSET ?);',
+                [self._max_entries]
+            ).rowcount
+            self._conn.commit()
+        if evicted:
+            self._logger.info(f'Evicted {evicted} scrape cache entries')
+        return evicted
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,102 @@
+import logging.config
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+from .scraper import Scraper
+from .scrape_cache import ScrapeCache
+
+
+class ScrapePool:
+    def __init__(self, logging_object: Any, workers: int = 8, host_concurrency: int = 2, host_delay: float = 1.0,
+                 progress_interval: int = 50, progress_callback: Optional[Callable[[int, int, int], None]] = None,
+                 cache: Optional[ScrapeCache] = None, retries: int = 3):
+        self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
+        self._logger.setLevel(logging.INFO)
+        self._workers: int = max(1, workers)
+        self._host_concurrency: int = max(1, host_concurrency)
+        self._host_delay: float = max(0.0, host_delay)
+        self._progress_interval: int = max(1, progress_interval)
+        self._progress_callback: Optional[Callable[[int, int, int], None]] = progress_callback
+        self._cache: Optional[ScrapeCache] = cache
+        self._host_lock: threading.Lock = threading.Lock()
+        self._host_semaphores: dict[str, threading.Semaphore] = {}
+        self._host_next_request: dict[str, float] = {}
+        self._session = Scraper.create_session(pool_connections=self._workers * 2, pool_maxsize=self._host_concurrency,
+                                               retries=retries)
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urlsplit(Scraper.format_url(url)).netloc.lower()
+
+    @staticmethod
+    def _interleave_hosts(urls: Iterable[str]) -> list[str]:
+        host_queues: dict[str, deque] = defaultdict(deque)
+        for url in urls:
+            host_queues[ScrapePool.get_host(url)].append(url)
+        interleaved: list[str] = []
+        queues: list[deque] = list(host_queues.values())
+        while queues:
+            for queue in queues:
+                interleaved.append(queue.popleft())
+            queues = [queue for queue in queues if queue]
+        return interleaved
+
+    def _host_semaphore(self, host: str) -> threading.Semaphore:
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.Semaphore(self._host_concurrency)
+            return self._host_semaphores[host]
+
+    def _wait_for_host_slot(self, host: str) -> None:
+        with self._host_lock:
+            now: float = time.monotonic()
+            request_at: float = max(now, self._host_next_request.get(host, now))
+            self._host_next_request[host] = request_at + self._host_delay
+        if request_at > now:
+            time.sleep(request_at - now)
+
+    def _scrape_url(self, url: str) -> tuple[str, dict, str]:
+        cached_payload: dict = Scraper.get_cached_meta(url, self._cache) if self._cache else {}
+        if cached_payload:
+            return url, cached_payload, ''
+        host: str = self.get_host(url)
+        with self._host_semaphore(host):
+            self._wait_for_host_slot(host)
+            return url, *Scraper.fetch_url_meta(url, self._session, cache=self._cache)
+
+    def _report_progress(self, completed: int, failed: int, total: int, start_time: float) -> None:
+        if self._progress_callback:
+            self._progress_callback(completed, failed, total)
+        if completed % self._progress_interval == 0 or completed == total:
+            elapsed: float = max(time.monotonic() - start_time, 1e-9)
+            self._logger.info(f'Scraped {completed}/{total} ({completed / total:.1%}), {failed} failed, '
+                              f'{completed / elapsed:.1f} urls/s')
+
+    def scrape(self, urls: Iterable[str]) -> Iterator[tuple[str, dict]]:
+        for url, payload, _ in self.scrape_results(urls):
+            yield url, payload
+
+    def scrape_results(self, urls: Iterable[str]) -> Iterator[tuple[str, dict, str]]:
+        pending_urls: deque = deque(self._interleave_hosts(urls))
+        total: int = len(pending_urls)
+        completed: int = 0
+        failed: int = 0
+        start_time: float = time.monotonic()
+        in_flight: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='scraper') as executor:
+            while pending_urls or in_flight:
+                while pending_urls and len(in_flight) < self._workers * 2:
+                    in_flight.add(executor.submit(self._scrape_url, pending_urls.popleft()))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, payload, error = future.result()
+                    completed += 1
+                    failed += 0 if payload else 1
+                    self._report_progress(completed, failed, total, start_time)
+                    yield url, payload, error
+
+    def close(self) -> None:
+        self._session.close()
@@ -1,11 +1,32 @@
+import codecs
+import re
+import time
 import requests
 from requests.adapters import HTTPAdapter
+from typing import Optional
 from urllib3.util.retry import Retry
 from pyuseragents import random as random_useragent
 from bs4 import BeautifulSoup
+from .head_parser import HeadParser
+from .scrape_cache import ScrapeCache, ScrapeCacheEntry
+from ..metrics import metrics, MetricsRegistry
 
 
 class Scraper:
+    request_timeout: tuple[float, float] = (10, 30)
+    max_head_bytes: int = 512 * 1024
+    chunk_size: int = 16 * 1024
+    html_content_types: tuple[str, ...] = ('text/html', 'application/xhtml+xml')
+
+    @staticmethod
+    def create_session(pool_connections: int = 10, pool_maxsize: int = 10, retries: int = 3) -> requests.Session:
+        session = requests.Session()
+        retry = Retry(total=retries, connect=retries, backoff_factor=0.5)
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     @staticmethod
     def get_random_agent():
         random_agent: str = random_useragent()
@@ -140,31 +161,109 @@ class Scraper:
             print(f'Exception was thrown', e)
 
     @staticmethod
-    def get_url_meta(url: str) -> dict:
+    def is_html_response(response: requests.Response) -> bool:
+        content_type: str = response.headers.get('content-type', '').lower()
+        return not content_type or content_type.startswith(Scraper.html_content_types)
+
+    @staticmethod
+    def get_response_encoding(response: requests.Response, first_chunk: bytes) -> str:
+        if 'charset' in response.headers.get('content-type', '').lower() and response.encoding:
+            return response.encoding
+        meta_charset = re.search(rb'<meta[^>]+charset=["\']?([\w-]+)', first_chunk, re.IGNORECASE)
+        if meta_charset:
+            try:
+                return codecs.lookup(meta_charset.group(1).decode('ascii')).name
+            except LookupError:
+                pass
+        return 'utf-8'
+
+    @staticmethod
+    def parse_head_stream(response: requests.Response, max_bytes: int) -> dict:
+        head_parser: HeadParser = HeadParser()
+        decoder: Optional[codecs.IncrementalDecoder] = None
+        bytes_read: int = 0
+        for chunk in response.iter_content(chunk_size=Scraper.chunk_size):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(Scraper.get_response_encoding(response, chunk))(errors='replace')
+            bytes_read += len(chunk)
+            head_parser.feed(decoder.decode(chunk))
+            if head_parser.head_complete or bytes_read >= max_bytes:
+                break
+        head_parser.close()
+        metrics.observe('arcadia_scrape_bytes', bytes_read, MetricsRegistry.bytes_buckets, mode='stream')
+        return head_parser.get_package()
+
+    @staticmethod
+    def get_cached_meta(url: str, cache: ScrapeCache, cache_entry: Optional[ScrapeCacheEntry] = None) -> dict:
+        cache_entry = cache_entry if cache_entry else cache.get(url)
+        if cache_entry and cache.is_fresh(cache_entry):
+            return {**cache_entry['payload'], 'cache_status': 'hit'}
+        return {}
+
+    @staticmethod
+    def get_url_meta(url: str, session: Optional[requests.Session] = None, stream: bool = True,
+                     max_bytes: Optional[int] = None, cache: Optional[ScrapeCache] = None) -> dict:
+        return Scraper.fetch_url_meta(url, session, stream, max_bytes, cache)[0]
+
+    @staticmethod
+    def fetch_url_meta(url: str, session: Optional[requests.Session] = None, stream: bool = True,
+                       max_bytes: Optional[int] = None, cache: Optional[ScrapeCache] = None) -> tuple[dict, str]:
+        start_time: float = time.perf_counter()
+        payload, error = Scraper._fetch_url_meta(url, session, stream, max_bytes, cache)
+        outcome: str = payload.get('cache_status', 'fetched') if payload else 'error'
+        metrics.observe('arcadia_scrape_seconds', time.perf_counter() - start_time, outcome=outcome)
+        return payload, error
+
+    @staticmethod
+    def _fetch_url_meta(url: str, session: Optional[requests.Session], stream: bool, max_bytes: Optional[int],
+                        cache: Optional[ScrapeCache]) -> tuple[dict, str]:
+        error: str = ''
         try:
-            session = requests.Session()
-            retry = Retry(total=3, connect=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)
+            cache_entry: Optional[ScrapeCacheEntry] = cache.get(url) if cache else None
+            if cache_entry and cache.is_fresh(cache_entry):
+                return Scraper.get_cached_meta(url, cache, cache_entry), error
+
+            headers: dict = Scraper.generate_headers()
+            if cache_entry:
+                headers.update(ScrapeCache.conditional_headers(cache_entry))
+            session = session if session else Scraper.create_session()
             response = session.request(
                 'GET', Scraper.format_url(url),
-                headers=Scraper.generate_headers(),
-                verify=True
+                headers=headers,
+                verify=True,
+                timeout=Scraper.request_timeout,
+                stream=stream
             )
 
-            if response:
+            package: dict = {}
+            if cache_entry and response.status_code == 304:
+                response.close()
+                cache.touch(url)
+                return {**cache_entry['payload'], 'cache_status': 'not_modified'}, error
+            elif response and not Scraper.is_html_response(response):
+                error = f'Skipping non-HTML content type: {response.headers.get("content-type")}'
+                response.close()
+            elif response and stream:
+                with response:
+                    package = Scraper.parse_head_stream(response, max_bytes or Scraper.max_head_bytes)
+            elif response:
+                metrics.observe('arcadia_scrape_bytes', len(response.content), MetricsRegistry.bytes_buckets,
+                                mode='full')
                 beautiful_soup: BeautifulSoup = BeautifulSoup(response.content, 'html.parser')
-                package: dict = {
+                package = {
                     'title': Scraper.get_url_title(beautiful_soup),
                     'description': Scraper.get_url_description(beautiful_soup),
                     'image': Scraper.get_url_image(beautiful_soup)
                 }
-                return package
             else:
-                print(f'API Status code: {response.status_code}')
+                error = f'API Status code: {response.status_code}'
+
+            if package and cache:
+                cache.put(url, response.headers.get('etag'), response.headers.get('last-modified'), package)
+                return {**package, 'cache_status': 'miss'}, error
+            return package, error
         except TypeError as type_error:
-            print(f'Received TypeError: {type_error}')
+            error = f'Received TypeError: {type_error}'
         except Exception as e:
-            print(f'Exception was thrown', e)
-        return {}
+            error = f'Exception was thrown: {str(e)}'
+        return {}, error
@@ -0,0 +1,22 @@
+import json
+import os
+from typing import Any, Optional
+
+
+class DaemonProtocol:
+    max_message_bytes: int = 1048576
+
+    @staticmethod
+    def socket_path(db_path: str, socket_path: Optional[str] = None) -> str:
+        return socket_path or os.getenv('ARCADIA_SOCKET') or f'{os.path.abspath(db_path)}.sock'
+
+    @staticmethod
+    def encode(message: dict) -> bytes:
+        return json.dumps(message, separators=(',', ':'), ensure_ascii=False, default=str).encode() + b'\n'
+
+    @staticmethod
+    def decode(line: bytes) -> dict:
+        message: Any = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError('Message must be a JSON object')
+        return message
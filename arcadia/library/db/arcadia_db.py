@@ -1,42 +1,268 @@
+import json
 import logging.config
 import os
+import random
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from functools import cache
 from willow_core.library.sqlite_db import SqlLiteDb
 from willow_core.library.db_types import DeleteDbItemResponse, AddDbItemResponse, UpdateDbItemResponse
 from sqlite3 import Connection, Cursor, Error, Row
-from typing import Any
-from .db_types import ItemPackage
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, Union
+from .db_types import ItemPackage, AddDbItemsResponse, ArcadiaDataType, ArcadiaDbRecord, RecordFilters
+from .query_builder import QueryBuilder
+from .tag_codec import TagCodec
+from ..co_occurrence import CoOccurrence
+from ..metrics import metrics
 from .initial_db_data import initial_records
 
 
 class ArcadiaDb(SqlLiteDb):
-    def __init__(self, logging_object: Any, db_location: str):
+    connection_pragmas: dict[str, Union[str, int]] = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY'
+    }
+    cached_statements: int = 256
+    random_probe_attempts: int = 8
+    random_sample_fraction: int = 4
+    random_url_sql: tuple[str, str] = (
+        "SELECT * FROM ITEMS WHERE ID = ?1 AND data_type = 'URL';",
+        "SELECT * FROM ITEMS WHERE data_type = 'URL' AND ID >= ?1 ORDER BY ID LIMIT 1;"
+    )
+    random_tag_url_sql: tuple[str, str] = (
+        "SELECT ITEMS.* FROM ITEM_TAGS JOIN ITEMS ON ITEMS.ID = ITEM_TAGS.item_id "
+        "WHERE ITEM_TAGS.tag = ?2 AND ITEM_TAGS.item_id = ?1 AND ITEMS.data_type = 'URL';",
+        "SELECT ITEMS.* FROM ITEM_TAGS JOIN ITEMS ON ITEMS.ID = ITEM_TAGS.item_id "
+        "WHERE ITEM_TAGS.tag = ?2 AND ITEM_TAGS.item_id >= ?1 AND ITEMS.data_type = 'URL' "
+        "ORDER BY ITEM_TAGS.item_id LIMIT 1;"
+    )
+    random_url_ids_sql: str = (
+        "SELECT ID FROM ITEMS WHERE data_type = 'URL' AND ID NOT IN (SELECT value FROM json_each(?1));"
+    )
+    random_tag_url_ids_sql: str = (
+        "SELECT ITEMS.ID FROM ITEM_TAGS JOIN ITEMS ON ITEMS.ID = ITEM_TAGS.item_id "
+        "WHERE ITEM_TAGS.tag = ?2 AND ITEMS.data_type = 'URL' AND ITEMS.ID NOT IN (SELECT value FROM json_each(?1));"
+    )
+    schema_migrations: tuple[str, ...] = (
+        'items', 'item_tags', 'items_fts', 'json_tags', 'enrichment_queue', 'items_indexes', 'tag_stats',
+        'tag_pairs'
+    )
+
+    def __init__(self, logging_object: Any, db_location: str, persistent: bool = False):
         self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
         self._logger.setLevel(logging.INFO)
         super().__init__(logging_object, db_location)
-        self._check_db_schema()
+        self._db_path: str = db_location
+        self._connection: Optional[Connection] = None
+        self._version_connection: Optional[Connection] = None
+        self._data_version: Optional[int] = None
+        self._statement_texts: OrderedDict[str, None] = OrderedDict()
+        self._insert_record_sql: str = self.read_sql_file('/sql/insert_record.sql')
+        self._insert_records_sql: str = self.read_sql_file('/sql/insert_records.sql')
+        self._insert_item_tag_sql: str = self.read_sql_file('/sql/insert_item_tag.sql')
+        self._search_records_sql: str = self.read_sql_file('/sql/search_records.sql')
+        self._update_record_meta_sql: str = self.read_sql_file('/sql/update_record_meta.sql')
+        self._dequeue_enrichment_sql: str = self.read_sql_file('/sql/dequeue_enrichment.sql')
+        self._related_tags_sql: str = self.read_sql_file('/sql/related_tags.sql')
+        if persistent:
+            self.open()
+        self._migrate_db_schema()
+
+    def __enter__(self) -> 'ArcadiaDb':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @staticmethod
     def add_file_path(relative_file_path: str) -> str:
         return f'{os.path.dirname(__file__)}{relative_file_path}'
 
-    def _check_db_schema(self) -> None:
-        if self._check_db_state(['ITEMS']):
-            self._logger.info(f'DB schema looks good')
+    @staticmethod
+    @cache
+    def read_sql_file(relative_file_path: str) -> str:
+        with open(ArcadiaDb.add_file_path(relative_file_path)) as f:
+            return f.read()
+
+    def open(self) -> None:
+        if self._connection is None:
+            conn: Connection = sqlite3.connect(self._db_path, cached_statements=self.cached_statements)
+            conn.row_factory = Row
+            for pragma, value in self.connection_pragmas.items():
+                conn.execute(f'PRAGMA {pragma} = {value};')
+            self._connection = conn
+            self._logger.info(f'Opened persistent Arcadia_DB connection')
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.commit()
+                self._connection.execute('PRAGMA optimize;')
+            finally:
+                self._connection.close()
+                self._connection = None
+                self._statement_texts.clear()
+                self._logger.info(f'Closed persistent Arcadia_DB connection')
+                self._data_version = None
+        if self._version_connection is not None:
+            self._version_connection.close()
+            self._version_connection = None
+            self._data_version = None
+
+    def _db_connect(self) -> Connection:
+        if self._connection is not None:
+            return self._connection
+        return super()._db_connect()
+
+    def _db_close(self, conn: Connection) -> None:
+        if conn is self._connection:
+            conn.commit()
         else:
-            self._logger.info(f'Tables not found')
-            self._create_db_schema()
+            super()._db_close(conn)
+
+    def data_changed(self) -> bool:
+        version_connection: Connection = self._connection
+        if version_connection is None:
+            if self._version_connection is None:
+                self._version_connection = sqlite3.connect(self._db_path)
+            version_connection = self._version_connection
+        data_version: int = version_connection.execute('PRAGMA data_version;').fetchone()[0]
+        changed: bool = data_version != self._data_version
+        self._data_version = data_version
+        return changed
+
+    def _get_user_version(self) -> int:
+        user_version: list[Row] = self._query_for_db_rows('PRAGMA user_version;')
+        return int(user_version[0][0]) if user_version else 0
+
+    def _set_user_version(self, version: int) -> None:
+        self._execute_write(f'PRAGMA user_version = {int(version)};')
+
+    def _migrate_db_schema(self) -> None:
+        user_version: int = self._get_user_version()
+        if user_version >= len(self.schema_migrations):
+            return
+        new_db: bool = not self._check_db_state(['ITEMS'])
+        for version, migration in enumerate(self.schema_migrations, start=1):
+            if version <= user_version:
+                continue
+            try:
+                getattr(self, f'_migrate_{migration}')()
+                self._set_user_version(version)
+            except Error as error:
+                self._logger.error(f'Error occurred migrating Arcadia_DB schema to version {version} '
+                                   f'({migration}): {str(error)}')
+                return
+        self._logger.info(f'DB schema is at version {len(self.schema_migrations)}')
+        if new_db:
             self._load_init_db_data()
 
-    def _create_db_schema(self) -> None:
+    def _migrate_items(self) -> None:
+        if self._check_db_state(['ITEMS']):
+            return
+        self._logger.info(f'Tables not found, initializing Arcadia_DB schema')
+        conn: Connection = self._db_connect()
+        conn.executescript(self.read_sql_file('/sql/schema.sql'))
+        self._db_close(conn)
+
+    def _migrate_item_tags(self) -> None:
+        if self._check_db_state(['ITEM_TAGS']):
+            return
+        self._logger.info(f'ITEM_TAGS table not found, building tag index from ITEMS')
+        conn: Connection = self._db_connect()
+        conn.executescript(self.read_sql_file('/sql/item_tags_schema.sql'))
+        db_cursor: Cursor = conn.cursor()
+        for item_id, tags in db_cursor.execute('SELECT ID, tags FROM ITEMS;').fetchall():
+            self._insert_item_tags(conn.cursor(), item_id, self._parse_tags(tags))
+        self._db_close(conn)
+        self._logger.info(f'ITEM_TAGS tag index has been built')
+
+    def _migrate_items_fts(self) -> None:
+        if self._check_db_state(['ITEMS_FTS']):
+            return
+        self._logger.info(f'ITEMS_FTS table not found, building full-text index from ITEMS')
+        conn: Connection = self._db_connect()
+        conn.executescript(self.read_sql_file('/sql/items_fts_schema.sql'))
+        self._db_close(conn)
+        self._logger.info(f'ITEMS_FTS full-text index has been built')
+
+    def _check_db_triggers(self, triggers: list[str]) -> bool:
+        db_triggers: list[Row] = self._query_with_params(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name IN (SELECT value FROM json_each(?));",
+            [json.dumps(triggers)]
+        )
+        return len(db_triggers) == len(triggers)
+
+    def _migrate_json_tags(self) -> None:
+        if self._check_db_triggers(['items_insert_tags', 'items_update_tags']):
+            return
+        self._logger.info(f'Tag triggers not found, converting ITEMS tags to JSON')
+        conn: Connection = self._db_connect()
+        db_cursor: Cursor = conn.cursor()
+        legacy_tags: list[Row] = db_cursor.execute(
+            'SELECT ID, tags FROM ITEMS WHERE json_valid(tags) = 0;'
+        ).fetchall()
+        db_cursor.executemany(
+            'UPDATE ITEMS SET tags = ? WHERE ID = ?;',
+            [(TagCodec.encode_tags(self._parse_tags(tags)), item_id) for item_id, tags in legacy_tags]
+        )
+        conn.executescript(self.read_sql_file('/sql/json_tags_schema.sql'))
+        self._db_close(conn)
+        self._logger.info(f'Converted tags of {len(legacy_tags)} records to JSON')
+
+    def _migrate_enrichment_queue(self) -> None:
+        if self._check_db_state(['ENRICHMENT_QUEUE']):
+            return
+        self._logger.info(f'ENRICHMENT_QUEUE table not found, queueing URL items without meta data')
+        conn: Connection = self._db_connect()
+        conn.executescript(self.read_sql_file('/sql/enrichment_queue_schema.sql'))
+        queued_count: int = conn.execute(
+            "INSERT INTO ENRICHMENT_QUEUE(item_id) SELECT ID FROM ITEMS WHERE data_type = 'URL' "
+            "AND title = 'None' AND description = 'None' AND image = 'None';"
+        ).rowcount
+        self._db_close(conn)
+        self._logger.info(f'Queued {queued_count} URL items for meta data enrichment')
+
+    def _migrate_items_indexes(self) -> None:
+        self._logger.info(f'Indexing ITEMS data, data_type and time_stamp')
+        conn: Connection = self._db_connect()
+        item_count: int = conn.execute('SELECT COUNT(*) FROM ITEMS;').fetchone()[0]
         try:
-            conn: Connection = self._db_connect()
-            with open(self.add_file_path('/sql/schema.sql')) as f:
-                conn.executescript(f.read())
-            self._logger.info(f'Initializing Arcadia_DB schema')
+            conn.executescript(self.read_sql_file('/sql/items_indexes_schema.sql'))
+        except Error:
+            conn.rollback()
             self._db_close(conn)
-            self._logger.info(f'Database has been initialized')
-        except Error as error:
-            self._logger.error(f'Error occurred initializing Arcadia_DB: {str(error)}')
+            raise
+        removed_count: int = item_count - conn.execute('SELECT COUNT(*) FROM ITEMS;').fetchone()[0]
+        self._db_close(conn)
+        self._logger.info(f'ITEMS indexes have been built, merged {removed_count} duplicate records')
+
+    def _migrate_tag_stats(self) -> None:
+        self._logger.info(f'Building TAG_STATS from ITEM_TAGS')
+        conn: Connection = self._db_connect()
+        conn.executescript(self.read_sql_file('/sql/tag_stats_schema.sql'))
+        conn.executescript(self.read_sql_file('/sql/rebuild_tag_stats.sql'))
+        self._db_close(conn)
+        self._logger.info(f'TAG_STATS has been built')
+
+    @staticmethod
+    def _read_tag_pairs_sql(relative_file_path: str) -> str:
+        return ArcadiaDb.read_sql_file(relative_file_path).format(max_item_tags=CoOccurrence.max_item_tags)
+
+    def _migrate_tag_pairs(self) -> None:
+        self._logger.info(f'Building TAG_PAIRS from ITEM_TAGS')
+        conn: Connection = self._db_connect()
+        conn.executescript(self._read_tag_pairs_sql('/sql/tag_pairs_schema.sql'))
+        conn.executescript(self._read_tag_pairs_sql('/sql/rebuild_tag_pairs.sql'))
+        self._db_close(conn)
+        self._logger.info(f'TAG_PAIRS has been built')
 
     def _load_init_db_data(self) -> None:
         for record in initial_records:
@@ -44,50 +270,250 @@ class ArcadiaDb(SqlLiteDb):
             self.insert_record(record[0])
             self.update_record_meta(db_url, **record[1])
 
+    def _explain_query(self, query: str, params: Union[list, tuple]) -> list[str]:
+        conn: Connection = self._db_connect()
+        query_plan: list[Row] = conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()
+        self._db_close(conn)
+        return [plan_row[3] for plan_row in query_plan]
+
+    def _statement_cached(self, query: str) -> bool:
+        if self._connection is None:
+            return False
+        cached: bool = query in self._statement_texts
+        self._statement_texts[query] = None
+        self._statement_texts.move_to_end(query)
+        if len(self._statement_texts) > self.cached_statements:
+            self._statement_texts.popitem(last=False)
+        return cached
+
+    def _record_query(self, query: str, params: Union[list, tuple], start_time: float, row_count: int) -> None:
+        if metrics.enabled:
+            metrics.inc('arcadia_db_statement_cache_total', outcome='hit' if self._statement_cached(query) else 'miss')
+        metrics.record_query(
+            query, time.perf_counter() - start_time, row_count, lambda: self._explain_query(query, params)
+        )
+
+    def _query_for_db_rows(self, query: str) -> list[Row]:
+        start_time: float = time.perf_counter()
+        db_rows: list[Row] = super()._query_for_db_rows(query)
+        self._record_query(query, [], start_time, len(db_rows))
+        return db_rows
+
+    def _query_with_params(self, query: str, params: Union[list, tuple]) -> list[Row]:
+        start_time: float = time.perf_counter()
+        conn: Connection = self._db_connect()
+        db_rows: list[Row] = conn.cursor().execute(query, params).fetchall()
+        self._db_close(conn)
+        self._record_query(query, params, start_time, len(db_rows))
+        return db_rows
+
+    def _execute_write(self, query: str, params: Union[list, tuple] = ()) -> int:
+        try:
+            start_time: float = time.perf_counter()
+            conn: Connection = self._db_connect()
+            row_count: int = conn.execute(query, params).rowcount
+            self._db_close(conn)
+            self._record_query(query, params, start_time, row_count)
+            return row_count
+        except Error as error:
+            self._logger.error(f'Error occurred writing to Arcadia_DB: {str(error)}')
+            return 0
+
+    def _parse_tags(self, tags: str) -> list[str]:
+        try:
+            return TagCodec.decode_tags(tags)
+        except (ValueError, SyntaxError) as error:
+            self._logger.error(f'Unable to parse tags "{tags}": {str(error)}')
+            return []
+
+    def _insert_item_tags(self, db_cursor: Cursor, item_id: int, tags: list[str]) -> None:
+        db_cursor.executemany(self._insert_item_tag_sql, [(item_id, tag) for tag in tags])
+
+    @staticmethod
+    def _record_from_row(row: Row) -> ArcadiaDbRecord:
+        record: dict = dict(row)
+        record['tags'] = TagCodec.decode_tags(record['tags'])
+        return record
+
     def _get_column(self, column: str) -> list[Row]:
         return self._query_for_db_rows(f'select {column} from ITEMS')
 
-    def get_record(self, item_key: str) -> Row:
-        db_record: list[Row] = self._query_for_db_rows(f'SELECT * FROM items WHERE data=\'{item_key}\'')
-        return db_record[0] if len(db_record) == 1 else {}
+    def get_record(self, item_key: str) -> ArcadiaDbRecord:
+        db_record: list[Row] = self._query_with_params(*QueryBuilder.record_query(item_key))
+        return self._record_from_row(db_record[0]) if len(db_record) == 1 else {}
 
-    def get_random_url_record(self) -> Row:
-        db_random_url: list[Row] = self._query_for_db_rows(
-            "SELECT * FROM items WHERE data_type='URL' ORDER BY RANDOM() LIMIT 1"
-        )
-        return db_random_url[0] if len(db_random_url) == 1 else {}
-
-    def get_records(self, search_term: str) -> list[Row]:
-        searchable_length: int = 3
-        lowercase_search_term: str = search_term.lower()
-        data_search: str = f'data LIKE "%{search_term}%" or ' if len(search_term) > searchable_length else ''
-        return self._query_for_db_rows(
-            f'select * from ITEMS where '
-            f'{data_search}'
-            f'LOWER(tags) LIKE "%\'{lowercase_search_term}\'%" or '
-            f'LOWER(tags) LIKE "%\_{lowercase_search_term}\'%" or '
-            f'LOWER(tags) LIKE "%\'{lowercase_search_term}\_%" or '
-            f'LOWER(title) LIKE "%{lowercase_search_term}%" or '
-            f'LOWER(description) LIKE "%{lowercase_search_term}%" '
-            f'escape "\\" '
-            f'order by id desc'
+    def get_random_url_record(self) -> ArcadiaDbRecord:
+        random_records: list[ArcadiaDbRecord] = self.get_random_url_records(1)
+        return random_records[0] if random_records else {}
+
+    def _random_id_range(self, tag: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+        if tag is None:
+            id_range: Row = self._query_for_db_rows(
+                'SELECT (SELECT MIN(ID) FROM ITEMS), (SELECT MAX(ID) FROM ITEMS);'
+            )[0]
+        else:
+            id_range: Row = self._query_with_params(
+                'SELECT (SELECT MIN(item_id) FROM ITEM_TAGS WHERE tag = ?1), '
+                '(SELECT MAX(item_id) FROM ITEM_TAGS WHERE tag = ?1);',
+                [tag]
+            )[0]
+        return id_range[0], id_range[1]
+
+    def _random_url_row(self, low_id: int, high_id: int, tag: Optional[str]) -> Optional[Row]:
+        probe_sql, seek_sql = self.random_tag_url_sql if tag is not None else self.random_url_sql
+        tag_params: list[str] = [tag] if tag is not None else []
+        for _ in range(self.random_probe_attempts):
+            probe_rows: list[Row] = self._query_with_params(probe_sql, [random.randint(low_id, high_id), *tag_params])
+            if probe_rows:
+                return probe_rows[0]
+        seek_rows: list[Row] = self._query_with_params(seek_sql, [random.randint(low_id, high_id), *tag_params]) or \
+            self._query_with_params(seek_sql, [low_id, *tag_params])
+        return seek_rows[0] if seek_rows else None
+
+    def _random_url_population(self, tag: Optional[str]) -> int:
+        if tag is None:
+            return self._query_for_db_rows("SELECT COUNT(*) FROM ITEMS WHERE data_type = 'URL';")[0][0]
+        url_counts: list[Row] = self._query_with_params('SELECT url_count FROM TAG_STATS WHERE tag = ?;', [tag])
+        return url_counts[0][0] if url_counts else 0
+
+    def _sample_url_rows(self, count: int, tag: Optional[str], excluded_ids: Iterable[int]) -> list[Row]:
+        ids_sql: str = self.random_tag_url_ids_sql if tag is not None else self.random_url_ids_sql
+        url_ids: list[int] = [
+            id_row[0] for id_row in self._query_with_params(
+                ids_sql, [json.dumps(list(excluded_ids)), *([tag] if tag is not None else [])]
+            )
+        ]
+        sampled_rows: list[Row] = self._query_with_params(
+            'SELECT * FROM ITEMS WHERE ID IN (SELECT value FROM json_each(?));',
+            [json.dumps(random.sample(url_ids, min(count, len(url_ids))))]
         )
+        random.shuffle(sampled_rows)
+        return sampled_rows
+
+    def get_random_url_records(self, count: int, tag: Optional[str] = None) -> list[ArcadiaDbRecord]:
+        population: int = self._random_url_population(tag)
+        count = min(count, population)
+        if count < 1:
+            return []
+        low_id, high_id = self._random_id_range(tag)
+        if low_id is None:
+            return []
+        random_rows: dict[int, Row] = {}
+        sparse: bool = population * self.random_probe_attempts < high_id - low_id + 1
+        if not sparse and count * self.random_sample_fraction < population:
+            repeated_draws: int = 0
+            while len(random_rows) < count and repeated_draws < self.random_probe_attempts:
+                random_row: Optional[Row] = self._random_url_row(low_id, high_id, tag)
+                if random_row is None:
+                    return []
+                if random_row['ID'] in random_rows:
+                    repeated_draws += 1
+                else:
+                    random_rows[random_row['ID']] = random_row
+                    repeated_draws = 0
+        if len(random_rows) < count:
+            for random_row in self._sample_url_rows(count - len(random_rows), tag, random_rows):
+                random_rows[random_row['ID']] = random_row
+        return [self._record_from_row(random_row) for random_row in random_rows.values()]
+
+    def get_records(self, search_term: str, limit: Optional[int] = None,
+                    before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        return self.find_records({'search_term': search_term}, limit, before_id)
+
+    def find_records(self, filters: RecordFilters, limit: Optional[int] = None,
+                     before_id: Optional[int] = None) -> list[ArcadiaDbRecord]:
+        db_records: list[Row] = self._query_with_params(*QueryBuilder.records_query(filters, limit, before_id))
+        return [self._record_from_row(db_record) for db_record in db_records]
+
+    def iter_records(self, search_term: str, before_id: Optional[int] = None,
+                     fetch_size: int = 200) -> Iterator[ArcadiaDbRecord]:
+        return self.iter_found_records({'search_term': search_term}, before_id, fetch_size)
+
+    def iter_found_records(self, filters: RecordFilters, before_id: Optional[int] = None,
+                           fetch_size: int = 200) -> Iterator[ArcadiaDbRecord]:
+        conn: Connection = self._db_connect()
+        try:
+            start_time: float = time.perf_counter()
+            query, params = QueryBuilder.records_query(filters, before_id=before_id)
+            db_cursor: Cursor = conn.cursor()
+            db_cursor.execute(query, params)
+            db_records: list[Row] = db_cursor.fetchmany(fetch_size)
+            self._record_query(query, params, start_time, len(db_records))
+            while db_records:
+                for db_record in db_records:
+                    yield self._record_from_row(db_record)
+                db_records = db_cursor.fetchmany(fetch_size)
+        finally:
+            self._db_close(conn)
+
+    @staticmethod
+    def to_fts_query(query: str) -> str:
+        fts_terms: list[str] = []
+        for phrase, term in re.findall(r'"([^"]*)"|(\S+)', query):
+            if phrase.strip():
+                fts_terms.append(f'"{phrase}"')
+            elif term:
+                is_prefix: bool = term.endswith('*')
+                term = term.rstrip('*').replace('"', '""')
+                if term:
+                    fts_terms.append(f'"{term}"*' if is_prefix else f'"{term}"')
+        return ' '.join(fts_terms)
+
+    def search_records(self, query: str, limit: int, offset: int,
+                       highlight: tuple[str, str] = ('[', ']')) -> list[dict]:
+        fts_query: str = self.to_fts_query(query)
+        if not fts_query:
+            return []
+        return [
+            self._record_from_row(db_row) for db_row in self._query_with_params(
+                self._search_records_sql,
+                [*highlight, *highlight, fts_query, limit, offset]
+            )
+        ]
 
     def get_tags(self) -> list[Row]:
-        return self._query_for_db_rows(
-            "SELECT value AS tag FROM items, json_each(REPLACE(tags, '''', '\"')) GROUP BY tag"
-        )
+        return self._query_for_db_rows('SELECT tag FROM TAG_STATS')
 
-    def get_tags_with_count(self) -> list[Row]:
-        return self._query_for_db_rows(
-            "SELECT value AS tag, COUNT(*) AS count FROM items, json_each(REPLACE(tags, '''', '\"')) "
-            "GROUP BY tag ORDER BY count DESC"
+    def get_tags_with_count(self, limit: Optional[int] = None) -> list[Row]:
+        return self._query_with_params(
+            'SELECT tag, item_count AS count, url_count, note_count, last_used FROM TAG_STATS '
+            'ORDER BY item_count DESC LIMIT ?',
+            [-1 if limit is None else limit]
         )
 
     def get_tag_count(self) -> Row:
-        return self._query_for_db_rows(
-            "SELECT COUNT(*) FROM (SELECT value AS tag FROM items, json_each(REPLACE(tags, '''', '\"')) GROUP BY tag)"
-        )[0]
+        return self._query_for_db_rows('SELECT COUNT(*) FROM TAG_STATS')[0]
+
+    def rebuild_tag_stats(self) -> int:
+        try:
+            conn: Connection = self._db_connect()
+            conn.executescript(self.read_sql_file('/sql/rebuild_tag_stats.sql'))
+            tag_count: int = conn.execute('SELECT COUNT(*) FROM TAG_STATS;').fetchone()[0]
+            self._db_close(conn)
+            self._logger.info(f'Rebuilt TAG_STATS for {tag_count} tags')
+            return tag_count
+        except Error as error:
+            self._logger.error(f'Error occurred rebuilding TAG_STATS: {str(error)}')
+            return 0
+
+    def get_tag_item_count(self, tag: str) -> int:
+        tag_rows: list[Row] = self._query_with_params('SELECT item_count FROM TAG_STATS WHERE tag = ?', [tag])
+        return tag_rows[0][0] if tag_rows else 0
+
+    def get_related_tags(self, tag: str, min_count: int = 1) -> list[Row]:
+        return self._query_with_params(self._related_tags_sql, [tag.lower(), min_count])
+
+    def rebuild_tag_pairs(self) -> int:
+        try:
+            conn: Connection = self._db_connect()
+            conn.executescript(self._read_tag_pairs_sql('/sql/rebuild_tag_pairs.sql'))
+            pair_count: int = conn.execute('SELECT COUNT(*) FROM TAG_PAIRS;').fetchone()[0]
+            self._db_close(conn)
+            self._logger.info(f'Rebuilt TAG_PAIRS with {pair_count} tag pairs')
+            return pair_count
+        except Error as error:
+            self._logger.error(f'Error occurred rebuilding TAG_PAIRS: {str(error)}')
+            return 0
 
     def get_record_count(self) -> Row:
         return self._query_for_db_rows("SELECT COUNT(*) FROM items")[0]
@@ -96,7 +522,7 @@ class ArcadiaDb(SqlLiteDb):
         return self._query_for_db_rows("SELECT COUNT(*) FROM items WHERE data_type='URL'")[0]
 
     def get_meta_data(self) -> list[Row]:
-        return self._get_column('data, title, description, image')
+        return self._get_column('data, data_type, title, description, image')
 
     def delete_arc_record(self, data_key: str) -> DeleteDbItemResponse:
         return self.delete_record(data_key, 'data', 'items')
@@ -108,54 +534,90 @@ class ArcadiaDb(SqlLiteDb):
             'data': []
         }
         item_data: str = item_package['content']
-        sql_path: str = self.add_file_path('/sql/insert_record.sql')
         conn: Connection = self._db_connect()
         db_cursor: Cursor = conn.cursor()
-        table_list: list = db_cursor.execute(
-            'SELECT data, tags FROM ITEMS WHERE data is ?;',
-            [item_data]
-        ).fetchall()
-
-        if not table_list:
-            try:
-                self._logger.info(f'Inserting "{item_data}" into Arcadia_DB')
-                with open(sql_path, 'r') as file:
-                    db_cursor.execute(
-                        file.read(),
-                        (
-                            self._get_time(),
-                            item_data,
-                            item_package['data_type'].value,
-                            str(item_package['tags']).lower()
-                        )
-                    )
-                response: AddDbItemResponse = {
+        try:
+            inserted_count: int = db_cursor.execute(
+                self._insert_record_sql,
+                (
+                    self._get_time(),
+                    item_data,
+                    item_package['data_type'].value,
+                    TagCodec.encode_tags([tag.lower() for tag in item_package['tags']])
+                )
+            ).rowcount
+            if inserted_count:
+                self._logger.info(f'Inserted "{item_data}" into Arcadia_DB')
+                response = {
                     'added_item': True,
                     'reason': 'item_added',
                     'data': []
                 }
-            except Error as error:
-                self._logger.error(f'Error occurred inserting record into Arcadia_DB: {str(error)}')
-            except IOError as io_error:
-                self._logger.error(f'IOError was thrown inserting record: {str(io_error)}')
-                raise
-            except Exception as exception:
-                self._logger.error(f'Exception was thrown inserting record: {str(exception)}')
-                raise
-        else:
-            self._logger.info(f'"{item_data}" is already in the DB, not reinserting')
-            response['data'] = table_list
-        self._db_close(conn)
+            else:
+                self._logger.info(f'"{item_data}" is already in the DB, not reinserting')
+                response['data'] = db_cursor.execute('SELECT data, tags FROM ITEMS WHERE data = ?;',
+                                                     [item_data]).fetchall()
+        except Error as error:
+            self._logger.error(f'Error occurred inserting record into Arcadia_DB: {str(error)}')
+        except Exception as exception:
+            self._logger.error(f'Exception was thrown inserting record: {str(exception)}')
+            raise
+        finally:
+            self._db_close(conn)
+        return response
+
+    def insert_records(self, item_packages: Iterable[ItemPackage], batch_size: int = 500) -> AddDbItemsResponse:
+        response: AddDbItemsResponse = {
+            'added_items': 0,
+            'duplicate_items': 0,
+            'invalid_items': 0,
+            'added_urls': []
+        }
+        item_iterator = iter(item_packages)
+        conn: Connection = self._db_connect()
+        db_cursor: Cursor = conn.cursor()
+        try:
+            while batch := list(islice(item_iterator, batch_size)):
+                unique_items: dict[str, ItemPackage] = {}
+                for item_package in batch:
+                    unique_items.setdefault(item_package['content'], item_package)
+                start_time: float = time.perf_counter()
+                added_items: list[Row] = db_cursor.execute(
+                    self._insert_records_sql,
+                    [
+                        self._get_time(),
+                        json.dumps([
+                            [
+                                item_data,
+                                item_package['data_type'].value,
+                                TagCodec.encode_tags([tag.lower() for tag in item_package['tags']])
+                            ]
+                            for item_data, item_package in unique_items.items()
+                        ])
+                    ]
+                ).fetchall()
+                conn.commit()
+                metrics.record_query(self._insert_records_sql, time.perf_counter() - start_time, len(added_items))
+
+                response['added_items'] += len(added_items)
+                response['duplicate_items'] += len(batch) - len(added_items)
+                response['added_urls'].extend(
+                    item_data for item_data, data_type in added_items if data_type == ArcadiaDataType.URL.value
+                )
+                self._logger.info(f'Inserted batch of {len(added_items)} records into Arcadia_DB')
+        except Error as error:
+            conn.rollback()
+            self._logger.error(f'Error occurred bulk inserting records into Arcadia_DB: {str(error)}')
+        finally:
+            self._db_close(conn)
         return response
 
     def update_record_meta(self, data_key: str, title: str, description: str, image_location: str) -> None:
         try:
             conn: Connection = self._db_connect()
             db_cursor: Cursor = conn.cursor()
-            db_cursor.execute(
-                'UPDATE items SET title = ?, description = ?, image = ? WHERE data = ?;',
-                [title, description, image_location, data_key]
-            )
+            db_cursor.execute(self._update_record_meta_sql, [title, description, image_location, data_key])
+            db_cursor.execute(self._dequeue_enrichment_sql, [data_key])
             self._db_close(conn)
             self._logger.info(f'Updated meta data successfully for: {data_key}')
         except Error as error:
@@ -164,6 +626,100 @@ class ArcadiaDb(SqlLiteDb):
             self._logger.error(f'Exception was thrown updating meta: {str(exception)}')
             raise
 
+    def update_records_meta(self, meta_updates: list[tuple[str, str, str, str]]) -> int:
+        try:
+            start_time: float = time.perf_counter()
+            conn: Connection = self._db_connect()
+            db_cursor: Cursor = conn.cursor()
+            db_cursor.executemany(
+                self._update_record_meta_sql,
+                [(title, description, image_location, data_key)
+                 for data_key, title, description, image_location in meta_updates]
+            )
+            updated_count: int = db_cursor.rowcount
+            db_cursor.execute(
+                'DELETE FROM ENRICHMENT_QUEUE WHERE item_id IN '
+                '(SELECT ID FROM ITEMS WHERE data IN (SELECT value FROM json_each(?)));',
+                [json.dumps([meta_update[0] for meta_update in meta_updates])]
+            )
+            self._db_close(conn)
+            metrics.record_query(self._update_record_meta_sql, time.perf_counter() - start_time, updated_count)
+            self._logger.info(f'Updated meta data for {updated_count} of {len(meta_updates)} records')
+            return updated_count
+        except Error as error:
+            self._logger.error(f'Error occurred updating meta batch on Arcadia_DB: {str(error)}')
+            return 0
+
+    def claim_enrichments(self, now: float, limit: int, lease_until: float) -> list[Row]:
+        try:
+            return self._query_with_params(self.read_sql_file('/sql/claim_enrichments.sql'), [now, limit, lease_until])
+        except Error as error:
+            self._logger.error(f'Error occurred claiming enrichments on Arcadia_DB: {str(error)}')
+            return []
+
+    def release_enrichments(self, item_ids: list[int], now: float) -> int:
+        return self._execute_write(
+            "UPDATE ENRICHMENT_QUEUE SET status = 'pending', next_attempt_at = ?1 "
+            "WHERE status = 'in_progress' AND item_id IN (SELECT value FROM json_each(?2));",
+            [now, json.dumps(item_ids)]
+        )
+
+    def get_enrichment_host_backoffs(self, now: float) -> dict[str, float]:
+        return {
+            host: next_attempt_at for host, next_attempt_at in self._query_with_params(
+                'SELECT host, next_attempt_at FROM ENRICHMENT_HOSTS WHERE next_attempt_at > ?;', [now]
+            )
+        }
+
+    def get_enrichment_counts(self) -> dict[str, int]:
+        return {
+            status: count for status, count in self._query_for_db_rows(
+                'SELECT status, COUNT(*) FROM ENRICHMENT_QUEUE GROUP BY status'
+            )
+        }
+
+    def record_enrichment_attempts(self, failures: list[tuple[int, float, str]], deferrals: list[tuple[int, float]],
+                                   max_attempts: int) -> None:
+        try:
+            conn: Connection = self._db_connect()
+            db_cursor: Cursor = conn.cursor()
+            db_cursor.executemany(
+                self.read_sql_file('/sql/record_enrichment_failure.sql'),
+                [(item_id, next_attempt_at, error, max_attempts) for item_id, next_attempt_at, error in failures]
+            )
+            db_cursor.executemany(
+                "UPDATE ENRICHMENT_QUEUE SET status = 'pending', next_attempt_at = ? WHERE item_id = ?;",
+                [(next_attempt_at, item_id) for item_id, next_attempt_at in deferrals]
+            )
+            self._db_close(conn)
+        except Error as error:
+            self._logger.error(f'Error occurred recording enrichment attempts on Arcadia_DB: {str(error)}')
+
+    def record_enrichment_hosts(self, failed_hosts: list[str], succeeded_hosts: list[str], now: float,
+                                retry_delay: float, max_retry_delay: float) -> None:
+        try:
+            conn: Connection = self._db_connect()
+            db_cursor: Cursor = conn.cursor()
+            db_cursor.executemany(
+                self.read_sql_file('/sql/record_host_failure.sql'),
+                [(host, now, retry_delay, max_retry_delay) for host in failed_hosts]
+            )
+            db_cursor.executemany('DELETE FROM ENRICHMENT_HOSTS WHERE host = ?;', [(host,) for host in succeeded_hosts])
+            self._db_close(conn)
+        except Error as error:
+            self._logger.error(f'Error occurred recording enrichment hosts on Arcadia_DB: {str(error)}')
+
+    def enqueue_url_records(self) -> int:
+        return self._execute_write(
+            "INSERT OR REPLACE INTO ENRICHMENT_QUEUE(item_id) SELECT ID FROM ITEMS WHERE data_type = 'URL';"
+        )
+
+    def retry_failed_enrichments(self) -> int:
+        return self._execute_write(
+            "UPDATE ENRICHMENT_QUEUE SET status = 'pending', attempts = 0, next_attempt_at = 0 "
+            "WHERE status = 'failed';"
+        )
+
     def update_record(self, data_key: str, new_data_key: str, title: str, tags: list[str], description: str,
                       image_location: str) -> UpdateDbItemResponse:
         response: UpdateDbItemResponse = {
@@ -176,7 +732,7 @@ class ArcadiaDb(SqlLiteDb):
             db_cursor: Cursor = conn.cursor()
             db_cursor.execute(
                 'UPDATE items SET data=?, tags=?, title = ?, description = ?, image = ? WHERE data = ?;',
-                [new_data_key, str(tags), title, description, image_location, data_key]
+                [new_data_key, TagCodec.encode_tags(tags), title, description, image_location, data_key]
             )
             self._db_close(conn)
             self._logger.info(f'Updated record data successfully for: {data_key}')
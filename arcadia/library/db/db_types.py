@@ -22,3 +22,28 @@ class ItemPackage(TypedDict):
     data_type: ArcadiaDataType
     content: str
     tags: list[str]
+
+
+class AddDbItemsResponse(TypedDict):
+    added_items: int
+    duplicate_items: int
+    invalid_items: int
+    added_urls: list[str]
+
+
+class EnrichmentResponse(TypedDict):
+    attempted: int
+    updated: int
+    failed: int
+    deferred: int
+
+
+class RecordFilters(TypedDict, total=False):
+    search_term: str
+    all_tags: list[str]
+    any_tags: list[str]
+    exclude_tags: list[str]
+    data_type: ArcadiaDataType
+    since: str
+    until: str
+    has_metadata: bool
@@ -0,0 +1,86 @@
+import json
+from typing import Optional
+from .db_types import ArcadiaDataType, RecordFilters
+
+
+class QueryBuilder:
+    searchable_length: int = 3
+    escape: str = "ESCAPE '\\'"
+    tag_items: str = 'SELECT item_id FROM ITEM_TAGS WHERE tag IN (SELECT value FROM json_each(?))'
+    has_metadata: str = "(title != 'None' OR description != 'None' OR image != 'None')"
+
+    @staticmethod
+    def escape_like(term: str) -> str:
+        return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    @staticmethod
+    def _tags_param(tags: list[str]) -> list[str]:
+        return list(dict.fromkeys(tag.strip().lower() for tag in tags if tag.strip()))
+
+    @staticmethod
+    def _search_term_clause(search_term: str) -> tuple[str, list]:
+        escape: str = QueryBuilder.escape
+        lowercase_search_term: str = search_term.lower()
+        escaped_term: str = QueryBuilder.escape_like(lowercase_search_term)
+        clause: str = (
+            f'(data LIKE ? {escape} OR '
+            f'ID IN (SELECT item_id FROM ITEM_TAGS WHERE tag = ? OR tag LIKE ? {escape} OR tag LIKE ? {escape}) OR '
+            f'LOWER(title) LIKE ? {escape} OR '
+            f'LOWER(description) LIKE ? {escape})'
+        )
+        return clause, [
+            f'%{QueryBuilder.escape_like(search_term)}%' if len(search_term) > QueryBuilder.searchable_length else None,
+            lowercase_search_term,
+            f'{escaped_term}\\_%',
+            f'%\\_{escaped_term}',
+            f'%{escaped_term}%',
+            f'%{escaped_term}%'
+        ]
+
+    @staticmethod
+    def where_clauses(filters: RecordFilters) -> tuple[list[str], list]:
+        clauses: list[str] = []
+        params: list = []
+        if filters.get('search_term'):
+            clause, clause_params = QueryBuilder._search_term_clause(filters['search_term'])
+            clauses.append(clause)
+            params.extend(clause_params)
+        all_tags: list[str] = QueryBuilder._tags_param(filters.get('all_tags') or [])
+        if all_tags:
+            clauses.append(f'ID IN ({QueryBuilder.tag_items} GROUP BY item_id HAVING COUNT(*) = ?)')
+            params.extend([json.dumps(all_tags), len(all_tags)])
+        any_tags: list[str] = QueryBuilder._tags_param(filters.get('any_tags') or [])
+        if any_tags:
+            clauses.append(f'ID IN ({QueryBuilder.tag_items})')
+            params.append(json.dumps(any_tags))
+        exclude_tags: list[str] = QueryBuilder._tags_param(filters.get('exclude_tags') or [])
+        if exclude_tags:
+            clauses.append(f'ID NOT IN ({QueryBuilder.tag_items})')
+            params.append(json.dumps(exclude_tags))
+        if filters.get('data_type'):
+            data_type = filters['data_type']
+            clauses.append('data_type = ?')
+            params.append(data_type.value if isinstance(data_type, ArcadiaDataType) else str(data_type).upper())
+        if filters.get('since'):
+            clauses.append('time_stamp >= ?')
+            params.append(filters['since'])
+        if filters.get('until'):
+            clauses.append('time_stamp < ?')
+            params.append(filters['until'])
+        if filters.get('has_metadata') is not None:
+            clauses.append(QueryBuilder.has_metadata if filters['has_metadata'] else f'NOT {QueryBuilder.has_metadata}')
+        return clauses, params
+
+    @staticmethod
+    def records_query(filters: RecordFilters, limit: Optional[int] = None,
+                      before_id: Optional[int] = None) -> tuple[str, list]:
+        clauses, params = QueryBuilder.where_clauses(filters)
+        if before_id is not None:
+            clauses.insert(0, 'ID < ?')
+            params.insert(0, before_id)
+        where: str = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        return f'SELECT * FROM ITEMS{where} ORDER BY ID DESC LIMIT ?', params + [-1 if limit is None else limit]
+
+    @staticmethod
+    def record_query(data_key: str) -> tuple[str, list]:
+        return 'SELECT * FROM ITEMS WHERE data = ? LIMIT 2', [data_key]
@@ -0,0 +1,9 @@
+UPDATE ENRICHMENT_QUEUE
+SET status = 'in_progress', next_attempt_at = ?3
+WHERE item_id IN (
+    SELECT item_id FROM ENRICHMENT_QUEUE
+    WHERE status IN ('pending', 'in_progress') AND next_attempt_at <= ?1
+    ORDER BY next_attempt_at, item_id
+    LIMIT ?2
+)
+RETURNING item_id, attempts, (SELECT data FROM ITEMS WHERE ITEMS.ID = ENRICHMENT_QUEUE.item_id) AS url;
@@ -0,0 +1,2 @@
+DELETE FROM ENRICHMENT_QUEUE
+WHERE item_id IN (SELECT ID FROM ITEMS WHERE data = ?);
@@ -0,0 +1,30 @@
+CREATE TABLE ENRICHMENT_QUEUE(
+    item_id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX idx_enrichment_queue_due ON ENRICHMENT_QUEUE(status, next_attempt_at);
+
+CREATE TABLE ENRICHMENT_HOSTS(
+    host TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TRIGGER items_enqueue_enrichment AFTER INSERT ON ITEMS WHEN new.data_type = 'URL'
+BEGIN
+    INSERT OR IGNORE INTO ENRICHMENT_QUEUE(item_id) VALUES (new.ID);
+END;
+
+CREATE TRIGGER items_requeue_enrichment AFTER UPDATE OF data ON ITEMS
+    WHEN new.data_type = 'URL' AND new.data IS NOT old.data
+BEGIN
+    INSERT OR REPLACE INTO ENRICHMENT_QUEUE(item_id) VALUES (new.ID);
+END;
+
+CREATE TRIGGER items_delete_enrichment AFTER DELETE ON ITEMS
+BEGIN
+    DELETE FROM ENRICHMENT_QUEUE WHERE item_id = old.ID;
+END;
@@ -0,0 +1,2 @@
+INSERT OR IGNORE INTO ITEM_TAGS(item_id, tag)
+VALUES (?, ?);
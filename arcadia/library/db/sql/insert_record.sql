@@ -1,3 +1,3 @@
-
 INSERT INTO ITEMS(time_stamp, data, data_type, tags)
-VALUES (?, ?, ?, ?);
\ No newline at end of file
+VALUES (?, ?, ?, ?)
+ON CONFLICT(data) DO NOTHING;
@@ -0,0 +1,6 @@
+INSERT INTO ITEMS(time_stamp, data, data_type, tags)
+SELECT ?, json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]')
+FROM json_each(?)
+WHERE true
+ON CONFLICT(data) DO NOTHING
+RETURNING data, data_type;
@@ -0,0 +1,12 @@
+CREATE TABLE ITEM_TAGS(
+    item_id INTEGER NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (item_id, tag)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_item_tags_tag ON ITEM_TAGS(tag, item_id);
+
+CREATE TRIGGER items_delete_tags AFTER DELETE ON ITEMS
+BEGIN
+    DELETE FROM ITEM_TAGS WHERE item_id = old.ID;
+END;
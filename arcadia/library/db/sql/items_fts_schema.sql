@@ -0,0 +1,31 @@
+CREATE VIRTUAL TABLE ITEMS_FTS USING fts5(
+    title,
+    description,
+    data,
+    content='ITEMS',
+    content_rowid='ID',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER items_fts_insert AFTER INSERT ON ITEMS
+BEGIN
+    INSERT INTO ITEMS_FTS(rowid, title, description, data)
+    VALUES (new.ID, new.title, new.description, new.data);
+END;
+
+CREATE TRIGGER items_fts_delete AFTER DELETE ON ITEMS
+BEGIN
+    INSERT INTO ITEMS_FTS(ITEMS_FTS, rowid, title, description, data)
+    VALUES ('delete', old.ID, old.title, old.description, old.data);
+END;
+
+CREATE TRIGGER items_fts_update AFTER UPDATE OF title, description, data ON ITEMS
+BEGIN
+    INSERT INTO ITEMS_FTS(ITEMS_FTS, rowid, title, description, data)
+    VALUES ('delete', old.ID, old.title, old.description, old.data);
+    INSERT INTO ITEMS_FTS(rowid, title, description, data)
+    VALUES (new.ID, new.title, new.description, new.data);
+END;
+
+INSERT INTO ITEMS_FTS(ITEMS_FTS) VALUES ('rebuild');
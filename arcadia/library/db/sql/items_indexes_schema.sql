@@ -0,0 +1,38 @@
+BEGIN;
+
+UPDATE ITEMS SET
+    tags = (
+        SELECT json_group_array(DISTINCT tag.value)
+        FROM ITEMS AS duplicate, json_each(duplicate.tags) AS tag
+        WHERE duplicate.data = ITEMS.data
+    ),
+    title = COALESCE((
+        SELECT duplicate.title FROM ITEMS AS duplicate
+        WHERE duplicate.data = ITEMS.data AND duplicate.title != 'None'
+        ORDER BY duplicate.ID DESC LIMIT 1
+    ), title),
+    description = COALESCE((
+        SELECT duplicate.description FROM ITEMS AS duplicate
+        WHERE duplicate.data = ITEMS.data AND duplicate.description != 'None'
+        ORDER BY duplicate.ID DESC LIMIT 1
+    ), description),
+    image = COALESCE((
+        SELECT duplicate.image FROM ITEMS AS duplicate
+        WHERE duplicate.data = ITEMS.data AND duplicate.image != 'None'
+        ORDER BY duplicate.ID DESC LIMIT 1
+    ), image)
+WHERE ID IN (SELECT MIN(ID) FROM ITEMS GROUP BY data HAVING COUNT(*) > 1);
+
+DELETE FROM ENRICHMENT_QUEUE WHERE item_id IN (
+    SELECT ID FROM ITEMS
+    WHERE ID IN (SELECT MIN(ID) FROM ITEMS GROUP BY data HAVING COUNT(*) > 1)
+      AND (title != 'None' OR description != 'None' OR image != 'None')
+);
+
+DELETE FROM ITEMS WHERE ID NOT IN (SELECT MIN(ID) FROM ITEMS GROUP BY data);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_items_data ON ITEMS(data);
+CREATE INDEX IF NOT EXISTS idx_items_data_type ON ITEMS(data_type);
+CREATE INDEX IF NOT EXISTS idx_items_time_stamp ON ITEMS(time_stamp);
+
+COMMIT;
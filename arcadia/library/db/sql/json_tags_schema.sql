@@ -0,0 +1,12 @@
+CREATE TRIGGER items_insert_tags AFTER INSERT ON ITEMS
+BEGIN
+    INSERT OR IGNORE INTO ITEM_TAGS(item_id, tag)
+    SELECT new.ID, value FROM json_each(new.tags);
+END;
+
+CREATE TRIGGER items_update_tags AFTER UPDATE OF tags ON ITEMS
+BEGIN
+    DELETE FROM ITEM_TAGS WHERE item_id = old.ID;
+    INSERT OR IGNORE INTO ITEM_TAGS(item_id, tag)
+    SELECT new.ID, value FROM json_each(new.tags);
+END;
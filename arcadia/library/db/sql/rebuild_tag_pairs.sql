@@ -0,0 +1,9 @@
+DELETE FROM TAG_PAIRS;
+
+INSERT INTO TAG_PAIRS(tag_a, tag_b, pair_count)
+SELECT lower(first.tag), lower(second.tag), COUNT(*)
+FROM ITEM_TAGS AS first
+JOIN ITEM_TAGS AS second ON second.item_id = first.item_id AND lower(first.tag) < lower(second.tag)
+JOIN ITEMS ON ITEMS.ID = first.item_id
+WHERE json_array_length(ITEMS.tags) BETWEEN 2 AND {max_item_tags}
+GROUP BY lower(first.tag), lower(second.tag);
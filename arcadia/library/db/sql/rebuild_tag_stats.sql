@@ -0,0 +1,11 @@
+DELETE FROM TAG_STATS;
+
+INSERT INTO TAG_STATS(tag, item_count, url_count, note_count, last_used)
+SELECT ITEM_TAGS.tag,
+       COUNT(*),
+       SUM(ITEMS.data_type = 'URL'),
+       SUM(ITEMS.data_type = 'NOTE'),
+       MAX(ITEMS.time_stamp)
+FROM ITEM_TAGS
+JOIN ITEMS ON ITEMS.ID = ITEM_TAGS.item_id
+GROUP BY ITEM_TAGS.tag;
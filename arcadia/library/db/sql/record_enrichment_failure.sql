@@ -0,0 +1,6 @@
+UPDATE ENRICHMENT_QUEUE
+SET attempts = attempts + 1,
+    next_attempt_at = ?2,
+    last_error = ?3,
+    status = CASE WHEN attempts + 1 >= ?4 THEN 'failed' ELSE 'pending' END
+WHERE item_id = ?1;
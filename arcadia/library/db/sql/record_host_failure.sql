@@ -0,0 +1,4 @@
+INSERT INTO ENRICHMENT_HOSTS(host, failures, next_attempt_at) VALUES (?1, 1, ?2 + ?3)
+ON CONFLICT(host) DO UPDATE SET
+    failures = failures + 1,
+    next_attempt_at = ?2 + min(?4, ?3 * (1 << min(failures, 20)));
@@ -0,0 +1,9 @@
+SELECT TAG_PAIRS.tag_b AS tag, TAG_PAIRS.pair_count, TAG_STATS.item_count
+FROM TAG_PAIRS
+JOIN TAG_STATS ON TAG_STATS.tag = TAG_PAIRS.tag_b
+WHERE TAG_PAIRS.tag_a = ?1 AND TAG_PAIRS.pair_count >= ?2
+UNION ALL
+SELECT TAG_PAIRS.tag_a AS tag, TAG_PAIRS.pair_count, TAG_STATS.item_count
+FROM TAG_PAIRS
+JOIN TAG_STATS ON TAG_STATS.tag = TAG_PAIRS.tag_a
+WHERE TAG_PAIRS.tag_b = ?1 AND TAG_PAIRS.pair_count >= ?2;
@@ -0,0 +1,9 @@
+SELECT ITEMS.*,
+       bm25(ITEMS_FTS, 10.0, 4.0, 1.0) AS rank,
+       snippet(ITEMS_FTS, 0, ?, ?, '…', 12) AS title_snippet,
+       snippet(ITEMS_FTS, 1, ?, ?, '…', 24) AS description_snippet
+FROM ITEMS_FTS
+JOIN ITEMS ON ITEMS.ID = ITEMS_FTS.rowid
+WHERE ITEMS_FTS MATCH ?
+ORDER BY rank
+LIMIT ? OFFSET ?;
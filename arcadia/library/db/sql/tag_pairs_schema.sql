@@ -0,0 +1,56 @@
+CREATE TABLE TAG_PAIRS(
+    tag_a TEXT NOT NULL,
+    tag_b TEXT NOT NULL,
+    pair_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag_a, tag_b)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_tag_pairs_tag_b ON TAG_PAIRS(tag_b, tag_a);
+
+CREATE TRIGGER items_insert_tag_pairs AFTER INSERT ON ITEMS
+BEGIN
+    INSERT INTO TAG_PAIRS(tag_a, tag_b, pair_count)
+    SELECT first.tag, second.tag, 1
+    FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(new.tags)) AS first
+    JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(new.tags)) AS second ON first.tag < second.tag
+    WHERE json_array_length(new.tags) BETWEEN 2 AND {max_item_tags}
+    ON CONFLICT(tag_a, tag_b) DO UPDATE SET pair_count = pair_count + 1;
+END;
+
+CREATE TRIGGER items_update_tag_pairs AFTER UPDATE OF tags ON ITEMS WHEN old.tags IS NOT new.tags
+BEGIN
+    UPDATE TAG_PAIRS SET pair_count = pair_count - 1
+    WHERE json_array_length(old.tags) BETWEEN 2 AND {max_item_tags} AND (tag_a, tag_b) IN (
+        SELECT first.tag AS tag_a, second.tag AS tag_b
+        FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS first
+        JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS second ON first.tag < second.tag
+    );
+    INSERT INTO TAG_PAIRS(tag_a, tag_b, pair_count)
+    SELECT first.tag, second.tag, 1
+    FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(new.tags)) AS first
+    JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(new.tags)) AS second ON first.tag < second.tag
+    WHERE json_array_length(new.tags) BETWEEN 2 AND {max_item_tags}
+    ON CONFLICT(tag_a, tag_b) DO UPDATE SET pair_count = pair_count + 1;
+    DELETE FROM TAG_PAIRS
+    WHERE pair_count <= 0 AND json_array_length(old.tags) BETWEEN 2 AND {max_item_tags} AND (tag_a, tag_b) IN (
+        SELECT first.tag AS tag_a, second.tag AS tag_b
+        FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS first
+        JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS second ON first.tag < second.tag
+    );
+END;
+
+CREATE TRIGGER items_delete_tag_pairs AFTER DELETE ON ITEMS
+BEGIN
+    UPDATE TAG_PAIRS SET pair_count = pair_count - 1
+    WHERE json_array_length(old.tags) BETWEEN 2 AND {max_item_tags} AND (tag_a, tag_b) IN (
+        SELECT first.tag AS tag_a, second.tag AS tag_b
+        FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS first
+        JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS second ON first.tag < second.tag
+    );
+    DELETE FROM TAG_PAIRS
+    WHERE pair_count <= 0 AND json_array_length(old.tags) BETWEEN 2 AND {max_item_tags} AND (tag_a, tag_b) IN (
+        SELECT first.tag AS tag_a, second.tag AS tag_b
+        FROM (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS first
+        JOIN (SELECT DISTINCT lower(value) AS tag FROM json_each(old.tags)) AS second ON first.tag < second.tag
+    );
+END;
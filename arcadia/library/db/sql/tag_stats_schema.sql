@@ -0,0 +1,54 @@
+CREATE TABLE TAG_STATS(
+    tag TEXT PRIMARY KEY COLLATE NOCASE,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    url_count INTEGER NOT NULL DEFAULT 0,
+    note_count INTEGER NOT NULL DEFAULT 0,
+    last_used TEXT
+) WITHOUT ROWID;
+
+CREATE INDEX idx_tag_stats_item_count ON TAG_STATS(item_count DESC);
+
+CREATE TRIGGER items_insert_tag_stats AFTER INSERT ON ITEMS
+BEGIN
+    INSERT INTO TAG_STATS(tag, item_count, url_count, note_count, last_used)
+    SELECT value, 1, new.data_type = 'URL', new.data_type = 'NOTE', new.time_stamp
+    FROM json_each(new.tags)
+    WHERE true
+    GROUP BY value COLLATE NOCASE
+    ON CONFLICT(tag) DO UPDATE SET
+        item_count = item_count + 1,
+        url_count = url_count + excluded.url_count,
+        note_count = note_count + excluded.note_count,
+        last_used = max(coalesce(last_used, ''), excluded.last_used);
+END;
+
+CREATE TRIGGER items_update_tag_stats AFTER UPDATE OF tags, data_type ON ITEMS
+    WHEN old.tags IS NOT new.tags OR old.data_type IS NOT new.data_type
+BEGIN
+    UPDATE TAG_STATS SET
+        item_count = item_count - 1,
+        url_count = url_count - (old.data_type = 'URL'),
+        note_count = note_count - (old.data_type = 'NOTE')
+    WHERE tag IN (SELECT value FROM json_each(old.tags));
+    INSERT INTO TAG_STATS(tag, item_count, url_count, note_count, last_used)
+    SELECT value, 1, new.data_type = 'URL', new.data_type = 'NOTE', new.time_stamp
+    FROM json_each(new.tags)
+    WHERE true
+    GROUP BY value COLLATE NOCASE
+    ON CONFLICT(tag) DO UPDATE SET
+        item_count = item_count + 1,
+        url_count = url_count + excluded.url_count,
+        note_count = note_count + excluded.note_count,
+        last_used = max(coalesce(last_used, ''), excluded.last_used);
+    DELETE FROM TAG_STATS WHERE item_count <= 0 AND tag IN (SELECT value FROM json_each(old.tags));
+END;
+
+CREATE TRIGGER items_delete_tag_stats AFTER DELETE ON ITEMS
+BEGIN
+    UPDATE TAG_STATS SET
+        item_count = item_count - 1,
+        url_count = url_count - (old.data_type = 'URL'),
+        note_count = note_count - (old.data_type = 'NOTE')
+    WHERE tag IN (SELECT value FROM json_each(old.tags));
+    DELETE FROM TAG_STATS WHERE item_count <= 0 AND tag IN (SELECT value FROM json_each(old.tags));
+END;
@@ -0,0 +1,2 @@
+UPDATE ITEMS SET title = ?1, description = ?2, image = ?3
+WHERE data = ?4 AND (title IS NOT ?1 OR description IS NOT ?2 OR image IS NOT ?3);
@@ -0,0 +1,24 @@
+import ast
+import json
+from functools import lru_cache
+from typing import Union
+
+
+class TagCodec:
+    @staticmethod
+    def encode_tags(tags: list[str]) -> str:
+        return json.dumps(list(tags), ensure_ascii=False)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _decode_tags(tags: str) -> tuple[str, ...]:
+        try:
+            return tuple(json.loads(tags))
+        except ValueError:
+            return tuple(ast.literal_eval(tags))
+
+    @staticmethod
+    def decode_tags(tags: Union[str, list[str]]) -> list[str]:
+        if isinstance(tags, list):
+            return tags
+        return list(TagCodec._decode_tags(tags))
@@ -0,0 +1,214 @@
+import json
+import logging.config
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, Optional, TypedDict
+
+
+class SlowQuery(TypedDict):
+    query: str
+    duration_ms: float
+    rows: int
+    plan: list[str]
+    time_stamp: float
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets: tuple[float, ...] = buckets
+        self.counts: list[int] = [0] * len(buckets)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+    def cumulative_counts(self) -> list[int]:
+        cumulative: list[int] = []
+        total: int = 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class MetricsRegistry:
+    seconds_buckets: tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+                                          2.5, 5.0, 10.0, 30.0)
+    bytes_buckets: tuple[float, ...] = (1024, 4096, 16384, 65536, 131072, 262144, 524288, 1048576, 4194304)
+    truthy_values: tuple[str, ...] = ('1', 'true', 'yes', 'on')
+
+    def __init__(self, enabled: bool = False, slow_query_ms: Optional[float] = None, slow_query_log_size: int = 100):
+        self._logger: logging.Logger = logging.getLogger(type(self).__name__)
+        self._logger.setLevel(logging.INFO)
+        self.enabled: bool = enabled
+        self.slow_query_ms: Optional[float] = slow_query_ms
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self._slow_queries: deque[SlowQuery] = deque(maxlen=slow_query_log_size)
+
+    def configure(self, enabled: bool, slow_query_ms: Optional[float] = None, logging_object: Any = None) -> None:
+        self.enabled = enabled or slow_query_ms is not None
+        self.slow_query_ms = slow_query_ms
+        if logging_object is not None:
+            self._logger = logging_object.getLogger(type(self).__name__)
+            self._logger.setLevel(logging.INFO)
+
+    def configure_from_env(self, environ: Mapping[str, str] = os.environ, logging_object: Any = None) -> None:
+        slow_query_ms: Optional[str] = environ.get('ARCADIA_SLOW_QUERY_MS')
+        self.configure(
+            environ.get('ARCADIA_METRICS', '').lower() in self.truthy_values,
+            float(slow_query_ms) if slow_query_ms else None,
+            logging_object
+        )
+
+    @staticmethod
+    def _labels(labels: dict[str, Any]) -> tuple:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        if not self.enabled:
+            return
+        key: tuple[str, tuple] = (name, self._labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, buckets: Optional[tuple[float, ...]] = None, **labels) -> None:
+        if not self.enabled:
+            return
+        key: tuple[str, tuple] = (name, self._labels(labels))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(buckets or self.seconds_buckets)
+            self._histograms[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def query_fingerprint(query: str) -> str:
+        fingerprint: str = re.sub(r"'(?:[^']|'')*'", '?', ' '.join(query.split()))
+        return re.sub(r'\b\d+\b', '?', fingerprint)[:160]
+
+    def record_query(self, query: str, duration: float, rows: int,
+                     explain: Optional[Callable[[], list[str]]] = None) -> None:
+        if not self.enabled:
+            return
+        fingerprint: str = self.query_fingerprint(query)
+        self.observe('arcadia_db_query_seconds', duration, query=fingerprint)
+        self.inc('arcadia_db_query_rows_total', rows, query=fingerprint)
+        duration_ms: float = duration * 1000
+        if self.slow_query_ms is not None and duration_ms >= self.slow_query_ms:
+            plan: list[str] = []
+            if explain is not None:
+                try:
+                    plan = explain()
+                except Exception as error:
+                    plan = [f'Unable to explain query: {str(error)}']
+            self.inc('arcadia_db_slow_queries_total', query=fingerprint)
+            with self._lock:
+                self._slow_queries.append({
+                    'query': fingerprint,
+                    'duration_ms': round(duration_ms, 3),
+                    'rows': rows,
+                    'plan': plan,
+                    'time_stamp': time.time()
+                })
+            self._logger.warning(f'Slow query ({duration_ms:.1f} ms, {rows} rows): {fingerprint} '
+                                 f'| plan: {" / ".join(plan)}')
+
+    def slow_queries(self) -> list[SlowQuery]:
+        with self._lock:
+            return list(self._slow_queries)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._slow_queries.clear()
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def _prometheus_labels(labels: tuple, extra: Optional[tuple] = None) -> str:
+        label_pairs: tuple = labels + (extra or ())
+        if not label_pairs:
+            return ''
+        return '{' + ','.join(
+            f'{key}="{MetricsRegistry._escape_label(value)}"' for key, value in label_pairs
+        ) + '}'
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            counters: list[tuple[tuple[str, tuple], float]] = sorted(self._counters.items())
+            histograms: list[tuple[tuple[str, tuple], Histogram]] = sorted(
+                self._histograms.items(), key=lambda item: item[0]
+            )
+            typed_names: set[str] = set()
+            for (name, labels), value in counters:
+                if name not in typed_names:
+                    lines.append(f'# TYPE {name} counter')
+                    typed_names.add(name)
+                lines.append(f'{name}{self._prometheus_labels(labels)} {value:g}')
+            for (name, labels), histogram in histograms:
+                if name not in typed_names:
+                    lines.append(f'# TYPE {name} histogram')
+                    typed_names.add(name)
+                for bound, count in zip(histogram.buckets, histogram.cumulative_counts()):
+                    lines.append(f'{name}_bucket{self._prometheus_labels(labels, (("le", f"{bound:g}"),))} {count}')
+                lines.append(f'{name}_bucket{self._prometheus_labels(labels, (("le", "+Inf"),))} {histogram.count}')
+                lines.append(f'{name}_sum{self._prometheus_labels(labels)} {histogram.sum:g}')
+                lines.append(f'{name}_count{self._prometheus_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                'histograms': [
+                    {
+                        'name': name,
+                        'labels': dict(labels),
+                        'count': histogram.count,
+                        'sum': histogram.sum,
+                        'buckets': dict(zip([f'{bound:g}' for bound in histogram.buckets],
+                                            histogram.cumulative_counts()))
+                    }
+                    for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+                ],
+                'slow_queries': list(self._slow_queries)
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def write(self, output_path: str) -> None:
+        with open(output_path, 'w') as output_file:
+            output_file.write(self.to_json() if output_path.endswith('.json') else self.to_prometheus())
+
+
+metrics: MetricsRegistry = MetricsRegistry()
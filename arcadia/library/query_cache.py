@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, TypedDict
+
+
+class QueryCacheStats(TypedDict):
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class QueryCache:
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300.0):
+        self._max_entries: int = max(0, max_entries)
+        self._ttl: Optional[float] = ttl
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+        self._invalidations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def _expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and time.monotonic() - stored_at >= self._ttl
+
+    def get(self, key: tuple[str, Hashable], loader: Callable[[], Any]) -> Any:
+        entry: Optional[tuple[float, Any]] = self._entries.get(key)
+        if entry is not None:
+            if not self._expired(entry[0]):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            del self._entries[key]
+            self._expirations += 1
+        self._misses += 1
+        value: Any = loader()
+        if value is not None and self._max_entries:
+            self._entries[key] = (time.monotonic(), value)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        if not namespaces:
+            self.clear()
+            return
+        stale_keys: list[tuple] = [key for key in self._entries if key[0] in namespaces]
+        for key in stale_keys:
+            del self._entries[key]
+        self._invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._invalidations += 1
+
+    def stats(self) -> QueryCacheStats:
+        return {
+            'size': len(self._entries),
+            'max_entries': self._max_entries,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'invalidations': self._invalidations
+        }
@@ -0,0 +1,120 @@
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Iterable
+
+
+class TagIndex:
+    gram_size: int = 3
+
+    def __init__(self, tags: Iterable[str] = ()):
+        self._tags: dict[str, set[str]] = defaultdict(set)
+        self._sorted_keys: list[str] = []
+        self._postings: dict[str, set[str]] = defaultdict(set)
+        self.sync(tags)
+
+    def __len__(self) -> int:
+        return sum(len(tags) for tags in self._tags.values())
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._tags.get(tag.lower(), ())
+
+    @staticmethod
+    def _grams(text: str, padded: bool = True) -> set[str]:
+        text = f'  {text} ' if padded else text
+        return {text[index:index + TagIndex.gram_size] for index in range(len(text) - TagIndex.gram_size + 1)}
+
+    @staticmethod
+    def edit_distance(source: str, target: str, max_distance: int) -> int:
+        if abs(len(source) - len(target)) > max_distance:
+            return max_distance + 1
+        previous_row: list[int] = list(range(len(target) + 1))
+        for source_index, source_char in enumerate(source, 1):
+            current_row: list[int] = [source_index]
+            for target_index, target_char in enumerate(target, 1):
+                current_row.append(min(
+                    previous_row[target_index] + 1,
+                    current_row[target_index - 1] + 1,
+                    previous_row[target_index - 1] + (source_char != target_char)
+                ))
+            if min(current_row) > max_distance:
+                return max_distance + 1
+            previous_row = current_row
+        return previous_row[-1]
+
+    def add(self, tag: str) -> None:
+        key: str = tag.lower()
+        if key not in self._tags:
+            insort(self._sorted_keys, key)
+            for gram in self._grams(key):
+                self._postings[gram].add(key)
+        self._tags[key].add(tag)
+
+    def remove(self, tag: str) -> None:
+        key: str = tag.lower()
+        if tag not in self._tags.get(key, ()):
+            return
+        self._tags[key].discard(tag)
+        if not self._tags[key]:
+            del self._tags[key]
+            del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+            for gram in self._grams(key):
+                self._postings[gram].discard(key)
+                if not self._postings[gram]:
+                    del self._postings[gram]
+
+    def sync(self, tags: Iterable[str]) -> None:
+        current_tags: set[str] = set(tags)
+        indexed_tags: set[str] = {tag for variants in self._tags.values() for tag in variants}
+        for tag in indexed_tags - current_tags:
+            self.remove(tag)
+        for tag in current_tags - indexed_tags:
+            self.add(tag)
+
+    def _expand(self, keys: Iterable[str]) -> list[str]:
+        return [tag for key in keys for tag in sorted(self._tags[key])]
+
+    def _prefix_keys(self, prefix: str) -> list[str]:
+        keys: list[str] = []
+        for key in self._sorted_keys[bisect_left(self._sorted_keys, prefix):]:
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return keys
+
+    def _substring_keys(self, query: str) -> set[str]:
+        if len(query) < self.gram_size:
+            return {key for key in self._tags if query in key}
+        query_grams: list[set[str]] = sorted(
+            (self._postings.get(gram, set()) for gram in self._grams(query, padded=False)), key=len
+        )
+        candidates: set[str] = set(query_grams[0]).intersection(*query_grams[1:])
+        return {key for key in candidates if query in key}
+
+    def search_prefix(self, prefix: str) -> list[str]:
+        return self._expand(self._prefix_keys(prefix.lower()))
+
+    def search_substring(self, query: str) -> list[str]:
+        return self._expand(sorted(self._substring_keys(query.lower())))
+
+    def search_fuzzy(self, query: str, max_distance: int = 2, limit: int = 10) -> list[str]:
+        key_query: str = query.lower()
+        overlap: Counter = Counter()
+        for gram in self._grams(key_query):
+            overlap.update(self._postings.get(gram, ()))
+        ranked: list[tuple[int, int, str]] = []
+        for key, shared_grams in overlap.most_common(limit * 20):
+            distance: int = self.edit_distance(key_query, key, max_distance)
+            if distance <= max_distance:
+                ranked.append((distance, -shared_grams, key))
+        return self._expand(key for _, _, key in sorted(ranked)[:limit])
+
+    def suggest(self, query: str, limit: int = 10, max_distance: int = 2) -> list[str]:
+        key_query: str = query.lower()
+        prefix_keys: list[str] = sorted(self._prefix_keys(key_query), key=len)
+        substring_keys: list[str] = sorted(self._substring_keys(key_query) - set(prefix_keys), key=len)
+        suggestions: list[str] = self._expand(prefix_keys + substring_keys)
+        if len(suggestions) < limit:
+            suggestions.extend(
+                tag for tag in self.search_fuzzy(key_query, max_distance, limit) if tag not in suggestions
+            )
+        return suggestions[:limit]
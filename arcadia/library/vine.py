@@ -1,15 +1,18 @@
-import ast
+import itertools
 import sqlite3
 import logging.config
 
 from .arcadia_types import NodeType, VineNode, VineRoot, DataViewType
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, TextIO, Union
 
 from .db.db_types import ArcadiaDbRecord, ArcadiaDataType
+from .db.tag_codec import TagCodec
+from .metrics import metrics
 
 
 class Vine:
-    def __init__(self, logging_object: Any, main_tag: str, records: list[sqlite3.Row], data_view_type: DataViewType):
+    def __init__(self, logging_object: Any, main_tag: str, records: Iterable[Union[sqlite3.Row, dict]],
+                 data_view_type: DataViewType):
         self._logger: logging.Logger = logging_object.getLogger(type(self).__name__)
         self._logger.setLevel(logging.INFO)
         self._data_view_type: DataViewType = data_view_type
@@ -19,76 +22,180 @@ class Vine:
             'sub_node': []
         }
         self._records: list[ArcadiaDbRecord] = []
-        self._vine_sub_categories: list[str] = []
-        if len(records) > 0:
-            self._copy_records(records)
-            self._vine_sub_categories = list(set(self._vine_sub_categories))
-            self._vine_sub_categories.sort()
-            self._structure_vine(self._records)
+        self._record_count: int = 0
+        self._sub_nodes: dict[str, VineNode] = {}
+        self._node_sizes: dict[Optional[str], int] = {}
+        self._node_first_seen: dict[str, tuple[int, int]] = {}
+        self._node_limit: Optional[int] = None
+        self._streaming: bool = False
+        self.add_records(records)
 
     def __str__(self):
+        with metrics.timer('arcadia_vine_render_seconds', output='string'):
+            return ''.join(self.lines())
+
+    def lines(self, node_limit: Optional[int] = None, line_limit: Optional[int] = None) -> Iterator[str]:
+        return self._limit_lines(self._summary_lines(node_limit), line_limit)
+
+    def _limit_lines(self, summary_lines: Iterator[str], line_limit: Optional[int]) -> Iterator[str]:
         try:
-            title_raw: str = f'{self._vine["subject"].capitalize()}'
-            title: str = f'*{title_raw}*' if self._data_view_type == DataViewType.ENHANCED_TEXT else title_raw
-            title_view: str = f'🌿  {title}\n'
-            main_category_summary: str = ''
-            sub_category_summaries: str = ''
-            if len(self._records) == 0:
-                return f'{title_view} No results found\n'
-            else:
-                if self._vine['main_node']:
-                    main_category_summary += self._main_category_summary(self._vine['main_node'], NodeType.root)
-                for node in self._vine['sub_node']:
-                    sub_category_summaries += self._sub_category_summary(node, NodeType.subNode)
-                return f'{title_view}{main_category_summary}\n{sub_category_summaries}'
+            line_count: int = 0
+            for line in summary_lines:
+                if line_limit is not None and line_count >= line_limit:
+                    yield f'  … output truncated at {line_limit} lines\n'
+                    return
+                line_count += line.count('\n')
+                yield line
         except TypeError as type_error:
             self._logger.error(f'Received type error outputting string representation: {str(type_error)}')
         except NameError as name_error:
             self._logger.error(f'Received name error outputting string representation: {str(name_error)}')
 
-    def _copy_records(self, records: list[sqlite3.Row]) -> None:
+    def write(self, stream: TextIO, node_limit: Optional[int] = None, line_limit: Optional[int] = None) -> None:
+        with metrics.timer('arcadia_vine_render_seconds', output='stream'):
+            for line in self.lines(node_limit, line_limit):
+                stream.write(line)
+
+    def write_records(self, records: Iterable[Union[sqlite3.Row, dict]], stream: TextIO,
+                      node_limit: Optional[int] = None, line_limit: Optional[int] = None,
+                      sub_node_ranks: Optional[dict[str, float]] = None) -> None:
+        with metrics.timer('arcadia_vine_render_seconds', output='stream'):
+            for line in self._limit_lines(self._streamed_lines(records, node_limit, sub_node_ranks), line_limit):
+                stream.write(line)
+
+    def _title_view(self) -> str:
+        title_raw: str = f'{self._vine["subject"].capitalize()}'
+        title: str = f'*{title_raw}*' if self._data_view_type == DataViewType.ENHANCED_TEXT else title_raw
+        return f'🌿  {title}\n'
+
+    def _summary_lines(self, node_limit: Optional[int]) -> Iterator[str]:
+        title_view: str = self._title_view()
+        if self._record_count == 0:
+            yield f'{title_view} No results found\n'
+            return
+        yield title_view
+        if self._vine['main_node']:
+            yield from self._category_lines(self._vine['main_node'], NodeType.root, '  ', node_limit)
+        yield '\n'
+        yield from self._sub_node_lines(node_limit)
+
+    def _sub_node_lines(self, node_limit: Optional[int]) -> Iterator[str]:
+        for node in self._vine['sub_node']:
+            subtitle: str = f'*{node["subject"]}*' \
+                if self._data_view_type == DataViewType.ENHANCED_TEXT else f'{node["subject"]}: '
+            yield f'  {subtitle}\n'
+            yield from self._category_lines(node, NodeType.subNode, '', node_limit)
+
+    def _streamed_lines(self, records: Iterable[Union[sqlite3.Row, dict]], node_limit: Optional[int],
+                        sub_node_ranks: Optional[dict[str, float]]) -> Iterator[str]:
+        self._streaming = True
+        self._node_limit = node_limit
+        record_iterator: Iterator[Union[sqlite3.Row, dict]] = iter(records)
+        first_record: Optional[Union[sqlite3.Row, dict]] = next(record_iterator, None)
+        if first_record is None:
+            yield f'{self._title_view()} No results found\n'
+            return
+        yield self._title_view()
+        shown_counts: dict[str, int] = {ArcadiaDataType.NOTE.value: 0, ArcadiaDataType.URL.value: 0}
+        for record in itertools.chain([first_record], record_iterator):
+            record_copy: ArcadiaDbRecord = self._copy_record(record)
+            for _ in range(self._add_to_vine(record_copy)):
+                shown_count: int = sum(shown_counts.values())
+                if node_limit is not None and shown_count >= node_limit:
+                    continue
+                index: int = shown_counts[record_copy['data_type']]
+                first_prefix: str = '' if record_copy['data_type'] == ArcadiaDataType.URL.value \
+                    and shown_counts[ArcadiaDataType.NOTE.value] else '  '
+                yield f'{first_prefix if index == 0 else "  "}◦ {record_copy["time_stamp"]} ' \
+                      f'[{self.tag_string(record_copy["tags"])}]: {str(record_copy["data"])}\n'
+                shown_counts[record_copy['data_type']] += 1
+        if self._vine['main_node']:
+            root_size: int = self._node_sizes.get(None, 0)
+            if root_size > sum(shown_counts.values()):
+                yield f'  ◦ … {root_size - sum(shown_counts.values())} more\n'
+            elif root_size == 0:
+                yield '  '
+        yield '\n'
+        self._vine['sub_node'].sort(key=lambda node: self._node_first_seen.get(node['subject'], (0, 0)))
+        if sub_node_ranks is not None:
+            self.order_sub_nodes(sub_node_ranks)
+        yield from self._sub_node_lines(node_limit)
+
+    def _category_lines(self, node: VineNode, node_type: NodeType, first_prefix: str,
+                        node_limit: Optional[int]) -> Iterator[str]:
+        spacer: str = '' if node_type == NodeType.root else '   '
+        prefix: str = first_prefix
+        shown_count: int = 0
+        node_size: int = self._node_sizes.get(None if node_type == NodeType.root else node['subject'], 0)
+        for node_array in (node['notes'], node['urls']):
+            for index, item in enumerate(node_array):
+                if node_limit is not None and shown_count >= node_limit:
+                    yield f'  {spacer}◦ … {node_size - shown_count} more\n'
+                    return
+                yield f'{prefix if index == 0 else "  "}{spacer}◦ {item["time_stamp"]} ' \
+                      f'[{self.tag_string(item["tags"])}]: {str(item["data"])}\n'
+                shown_count += 1
+            if node_array:
+                prefix = ''
+        if node_limit is not None and shown_count < node_size:
+            yield f'  {spacer}◦ … {node_size - shown_count} more\n'
+        elif shown_count == 0:
+            yield first_prefix
+
+    def add_records(self, records: Iterable[Union[sqlite3.Row, dict]]) -> None:
         try:
-            for record in records:
-                record_copy = dict(record).copy()
-                record_copy['tags'] = ast.literal_eval(record_copy['tags'])
-                self._vine_sub_categories = self._vine_sub_categories + record_copy['tags']
-                self._records.append(record_copy)
+            with metrics.timer('arcadia_vine_build_seconds'):
+                for record in records:
+                    self._add_to_vine(self._copy_record(record))
         except TypeError as type_error:
             self._logger.error(f'Received error copying records: {str(type_error)}')
-
-    def _structure_vine(self, records: list[ArcadiaDbRecord]) -> None:
-        try:
-            for record in records:
-                tags_copy = record['tags'].copy()
-                for sub_category in self._vine_sub_categories:
-                    lowercased_sub_category: str = sub_category.lower()
-                    if sub_category in record['tags']:
-                        node_type = NodeType.subNode
-                        if lowercased_sub_category == self._vine['subject']:
-                            node_type = NodeType.root
-                        record['tags'].remove(sub_category)
-
-                        if node_type == NodeType.root or sub_category != self._vine['subject']:
-                            new_node: VineNode = self._get_vine_node(sub_category, node_type)
-                            if record['data_type'] == ArcadiaDataType.NOTE.value:
-                                new_node['notes'].append(record)
-                            elif record['data_type'] == ArcadiaDataType.URL.value:
-                                new_node['urls'].append(record)
-                record['tags'] = tags_copy
-
-        except TypeError as type_error:
-            self._logger.error(f'Received error structuring vine: {str(type_error)}')
         except KeyError as key_error:
             self._logger.error(f'Received error structuring vine: {str(key_error)}')
 
+    def _copy_record(self, record: Union[sqlite3.Row, dict]) -> ArcadiaDbRecord:
+        record_copy: ArcadiaDbRecord = dict(record)
+        record_copy['tags'] = TagCodec.decode_tags(record_copy['tags'])
+        self._record_count += 1
+        if not self._streaming:
+            self._records.append(record_copy)
+        return record_copy
+
+    def _add_to_vine(self, record: ArcadiaDbRecord) -> int:
+        root_count: int = 0
+        for tag_position, sub_category in enumerate(sorted(set(record['tags']))):
+            node_type: NodeType = self._node_type(sub_category)
+            new_node: VineNode = self._get_vine_node(sub_category, node_type)
+            if self._streaming and node_type == NodeType.subNode:
+                first_seen: tuple[int, int] = (-record['ID'], tag_position)
+                self._node_first_seen[sub_category] = min(self._node_first_seen.get(sub_category, first_seen),
+                                                          first_seen)
+            if record['data_type'] not in (ArcadiaDataType.NOTE.value, ArcadiaDataType.URL.value):
+                continue
+            node_key: Optional[str] = None if node_type == NodeType.root else sub_category
+            node_size: int = self._node_sizes.get(node_key, 0)
+            self._node_sizes[node_key] = node_size + 1
+            if node_type == NodeType.root:
+                root_count += 1
+                if self._streaming:
+                    continue
+            if self._node_limit is not None and node_size >= self._node_limit:
+                continue
+            if record['data_type'] == ArcadiaDataType.NOTE.value:
+                new_node['notes'].append(record)
+            else:
+                new_node['urls'].append(record)
+        return root_count
+
+    def _node_type(self, sub_category: str) -> NodeType:
+        return NodeType.root if sub_category.lower() == self._vine['subject'] else NodeType.subNode
+
     def _get_vine_node(self, node_subject: str, node_type: Optional[NodeType] = NodeType.subNode) -> VineNode:
         if node_type == NodeType.root:
             if self._vine['main_node']:
                 return self._vine['main_node']
         elif node_type == NodeType.subNode:
-            for node in self._vine['sub_node']:
-                if node_subject == node['subject']:
-                    return node
+            if node_subject in self._sub_nodes:
+                return self._sub_nodes[node_subject]
 
         new_node: VineNode = {
             'subject': node_subject,
@@ -99,37 +206,14 @@ class Vine:
         if node_type == NodeType.root:
             self._vine.update({'main_node': new_node})
         elif node_type == NodeType.subNode:
+            self._sub_nodes[node_subject] = new_node
             self._vine['sub_node'].append(new_node)
         return new_node
 
-    def _main_category_summary(self, node, node_type: NodeType) -> str:
-        return f'  {self._category_summary(node, node_type)}'
-
-    def _sub_category_summary(self, node, node_type: NodeType) -> str:
-        subtitle_raw: str = node["subject"]
-        subtitle: str = f'*{subtitle_raw}*' \
-            if self._data_view_type == DataViewType.ENHANCED_TEXT else f'{subtitle_raw}: '
-        return f'  {subtitle}\n{self._category_summary(node, node_type)}'
-
-    def _category_summary(self, node, node_type: NodeType) -> str:
-        try:
-            return f'{self._sub_category_details(node["notes"], node_type)}' \
-                   f'{self._sub_category_details(node["urls"], node_type)}'
-        except TypeError as type_error:
-            self._logger.error(f'Received type error creating sub category sub string: {str(type_error)}')
-
-    def _sub_category_details(self, node_array: list[ArcadiaDbRecord], node_type: NodeType) -> str:
-        try:
-            if len(node_array):
-                spacer: str = '' if node_type == NodeType.root else '   '
-                return '  '.join(
-                    f'{spacer}◦ {item["time_stamp"]} [{self.tag_string(item["tags"])}]: {str(item["data"])}\n'
-                    for item in node_array
-                )
-            else:
-                return ''
-        except TypeError as type_error:
-            self._logger.error(f'Received type error creating category sub string: {str(type_error)}')
+    def order_sub_nodes(self, ranks: dict[str, float]) -> None:
+        self._vine['sub_node'].sort(
+            key=lambda node: (node['subject'].lower() not in ranks, -ranks.get(node['subject'].lower(), 0.0))
+        )
 
     @staticmethod
     def tag_string(tags) -> str:
@@ -1,60 +1,260 @@
+import argparse
+import json
 import os
 import sys
 import logging.config
+from typing import Optional
 from dotenv import load_dotenv
 
 from library.arcadia_types import DataViewType
-from library.db.db_types import ItemPackage, ArcadiaDataType
+from library.db.db_types import ItemPackage, ArcadiaDataType, ArcadiaDbRecord
 from library.arcadia import Arcadia
+from library.arcadia_client import ArcadiaClient, ArcadiaDaemonError
+from library.daemon_protocol import DaemonProtocol
+from library.metrics import metrics
+from library.co_occurrence import CoOccurrence
+from library.collectors.importer import Importer
+
+commands: tuple[str, ...] = ('tag', 'related', 'search', 'add', 'stats', 'get', 'random', 'delete', 'update',
+                             'import', 'rebuild-stats')
+write_commands: tuple[str, ...] = ('add', 'delete', 'update', 'import', 'rebuild-stats')
+daemon_commands: tuple[str, ...] = ('tag', 'related', 'search', 'add', 'stats', 'get', 'random')
+
+
+def configure_logging(command: str) -> None:
+    if command in write_commands:
+        logging.config.fileConfig(fname=os.path.abspath('arcadia/bin/logging.conf'), disable_existing_loggers=False)
+    else:
+        logging.basicConfig(level=logging.WARNING, format='%(levelname)s [%(name)s] %(message)s')
+        logging.disable(logging.INFO)
+
+
+def positive_int(value: str) -> int:
+    number: int = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return number
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py', description='Arcadia data organization CLI')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    tag_parser = subparsers.add_parser('tag', help='summarize items by tag')
+    tag_parser.add_argument('tag')
+    tag_parser.add_argument('--limit', type=int, help='maximum lines of output')
+    tag_parser.add_argument('--related-order', action='store_true', help='list the most related tags first')
+
+    related_parser = subparsers.add_parser('related', help='tags that co-occur with a tag')
+    related_parser.add_argument('tag')
+    related_parser.add_argument('-k', type=int, default=10, help='number of related tags to show')
+    related_parser.add_argument('--metric', choices=CoOccurrence.metrics, default='lift')
+    related_parser.add_argument('--min-count', type=int, default=1, help='minimum shared items')
+
+    search_parser = subparsers.add_parser('search', help='full-text search titles, descriptions and URLs')
+    search_parser.add_argument('query', nargs='+')
+    search_parser.add_argument('--limit', type=int, default=20)
+    search_parser.add_argument('--offset', type=int, default=0)
+
+    add_parser = subparsers.add_parser('add', help='add a URL or note')
+    add_parser.add_argument('content')
+    add_parser.add_argument('tags', help='comma separated, no spaces')
+    add_parser.add_argument('--note', action='store_true', help='store content as a note instead of a URL')
+    add_parser.add_argument('--no-scrape', action='store_true', help='leave URL metadata for scraper_db_sync.py')
+
+    stats_parser = subparsers.add_parser('stats', help='item, URL and tag counts')
+    stats_parser.add_argument('--subjects', type=int, metavar='N', help='also list the N most used tags')
+
+    get_parser = subparsers.add_parser('get', help='show a stored item')
+    get_parser.add_argument('content', help='item URL or note')
+
+    random_parser = subparsers.add_parser('random', help='show random URL items')
+    random_parser.add_argument('--count', type=positive_int, default=1)
+    random_parser.add_argument('--tag', help='only sample items with this tag')
+
+    delete_parser = subparsers.add_parser('delete', help='delete a stored item')
+    delete_parser.add_argument('content')
+
+    update_parser = subparsers.add_parser('update', help='update fields of a stored item')
+    update_parser.add_argument('content')
+    update_parser.add_argument('--content', dest='new_content', help='replacement URL or note')
+    update_parser.add_argument('--tags', help='replacement tags, comma separated')
+    update_parser.add_argument('--title')
+    update_parser.add_argument('--description')
+    update_parser.add_argument('--image')
+
+    subparsers.add_parser('rebuild-stats', help='recompute tag statistics from scratch')
+
+    import_parser = subparsers.add_parser('import', help='bulk import URLs, CSV, JSONL or bookmarks')
+    import_parser.add_argument('file', help='file of newline-delimited URLs, CSV, JSONL or bookmarks HTML')
+    import_parser.add_argument('--format', choices=Importer.formats, help='defaults to file extension')
+    import_parser.add_argument('--tags', default='imported', help='tags for items without their own')
+    import_parser.add_argument('--batch-size', type=int, default=500)
+    import_parser.add_argument('--scrape', action='store_true', help='fetch URL metadata after import')
+    return parser
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    if len(argv) == 1 and argv[0] not in commands and not argv[0].startswith('-'):
+        argv = ['tag', argv[0]]
+    elif len(argv) == 2 and argv[0] not in commands:
+        argv = ['add', argv[0], argv[1]]
+    return create_parser().parse_args(argv)
+
+
+def print_item(item: ArcadiaDbRecord) -> None:
+    print(json.dumps(item, indent=2, ensure_ascii=False) if item else 'Item not found')
+
+
+def print_items(items: list[ArcadiaDbRecord]) -> None:
+    if not items:
+        print('Item not found')
+    for item in items:
+        print_item(item)
+
+
+def print_stats(tag_count: int, item_count: int, url_count: int, enrichment_counts: dict[str, int],
+                subject_counts: list[dict]) -> None:
+    print(f'Total Tag Count: {tag_count}')
+    print(f'Total Item Count: {item_count}')
+    print(f'Total Url Count: {url_count}')
+    print(f'Enrichment Queue: {enrichment_counts}')
+    for subject_count in subject_counts:
+        print(f'  {subject_count["tag"]}: {subject_count["count"]}')
+
+
+def print_related(tag: str, related_subjects: list[dict]) -> None:
+    if not related_subjects:
+        print(f'No tags found with {tag}')
+    for related_subject in related_subjects:
+        print(f'  {related_subject["tag"]}: {related_subject["pair_count"]}/{related_subject["item_count"]} items, '
+              f'lift {related_subject["lift"]:.2f}, npmi {related_subject["npmi"]:.2f}')
+
+
+def run_daemon_command(args: argparse.Namespace, client: ArcadiaClient) -> None:
+    if args.command == 'tag':
+        similar_subjects: list[str] = client.get_similar_subjects(args.tag)
+        summary: str = client.get_summary(args.tag, line_limit=args.limit, order_by_related=args.related_order)
+        print(f'\nSimilar Tags: {similar_subjects}\n')
+        sys.stdout.write(summary)
+
+    elif args.command == 'related':
+        print_related(args.tag, client.get_related_subjects(args.tag, args.k, args.metric, args.min_count))
+
+    elif args.command == 'search':
+        print(client.search(' '.join(args.query), args.limit, args.offset))
+
+    elif args.command == 'add':
+        print(client.add_item(args.content, args.tags.split(','),
+                              ArcadiaDataType.NOTE.value if args.note else ArcadiaDataType.URL.value,
+                              fetch_meta=not args.no_scrape))
+
+    elif args.command == 'stats':
+        stats: dict = client.get_stats(args.subjects or 0)
+        print_stats(stats['tag_count'], stats['item_count'], stats['url_count'], stats['enrichment'],
+                    stats['subjects'])
+
+    elif args.command == 'get':
+        print_item(client.get_item(args.content))
+
+    elif args.command == 'random':
+        print_items(client.get_random_url_items(args.count, args.tag))
+
+
+def run_command(args: argparse.Namespace, sql_lite_db: str) -> None:
+    with Arcadia(logging, sql_lite_db, DataViewType.TEXT, persistent=True) as arcadia:
+        if args.command == 'tag':
+            print(f'\nSimilar Tags: {arcadia.get_similar_subjects(args.tag)}\n')
+            arcadia.write_summary(args.tag, sys.stdout, line_limit=args.limit, order_by_related=args.related_order)
+
+        elif args.command == 'related':
+            print_related(args.tag, arcadia.get_related_subjects(args.tag, args.k, args.metric, args.min_count))
+
+        elif args.command == 'search':
+            print(arcadia.search(' '.join(args.query), args.limit, args.offset))
+
+        elif args.command == 'add':
+            add_package: ItemPackage = {
+                'data_type': ArcadiaDataType.NOTE if args.note else ArcadiaDataType.URL,
+                'content': args.content,
+                'tags': args.tags.split(',')
+            }
+            print(arcadia.add_item(add_package, fetch_meta=not args.no_scrape))
+
+        elif args.command == 'stats':
+            print_stats(arcadia.get_subject_count(), arcadia.get_item_count(), arcadia.get_url_item_count(),
+                        arcadia.get_enrichment_counts(),
+                        arcadia.get_counts_of_subjects(args.subjects) if args.subjects else [])
+
+        elif args.command == 'get':
+            print_item(arcadia.get_item(args.content))
+
+        elif args.command == 'random':
+            print_items(arcadia.get_random_url_items(args.count, args.tag))
+
+        elif args.command == 'delete':
+            print(arcadia.delete_item(args.content))
+
+        elif args.command == 'update':
+            item: ArcadiaDbRecord = arcadia.get_item(args.content)
+            if not item:
+                print('Item not found')
+                return
+            print(arcadia.update_item(
+                args.content,
+                args.new_content or item['data'],
+                item['title'] if args.title is None else args.title,
+                args.tags.split(',') if args.tags else item['tags'],
+                item['description'] if args.description is None else args.description,
+                item['image'] if args.image is None else args.image
+            ))
+
+        elif args.command == 'rebuild-stats':
+            print(f'Rebuilt statistics for {arcadia.rebuild_subject_stats()} tags')
+
+        elif args.command == 'import':
+            import_errors: list[str] = []
+            import_response = arcadia.add_items(
+                Importer.read_items(args.file, args.format, args.tags.split(','), import_errors),
+                args.batch_size
+            )
+            for import_error in import_errors:
+                logging.getLogger(__name__).warning(f'Skipped invalid import row {import_error}')
+            print(f'Added: {import_response["added_items"]}, '
+                  f'Duplicates: {import_response["duplicate_items"]}, '
+                  f'Invalid: {import_response["invalid_items"] + len(import_errors)}')
+            if args.scrape:
+                arcadia.update_items_meta(import_response['added_urls'])
+
 
 if __name__ == '__main__':
-    logging.config.fileConfig(fname=os.path.abspath('arcadia/bin/logging.conf'), disable_existing_loggers=False)
+    if len(sys.argv) < 2:
+        print('Please give term to search')
+        exit()
+    cli_args: argparse.Namespace = parse_args(sys.argv[1:])
+    configure_logging(cli_args.command)
     logger: logging.Logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
 
     try:
         load_dotenv()
         SQL_LITE_DB: str = os.getenv('SQL_LITE_DB')
-
-        if len(sys.argv) == 2:
-            search_term = sys.argv[1]
-            arcadia = Arcadia(logging, SQL_LITE_DB, DataViewType.TEXT)
-            subjects = arcadia.get_subjects_dictionary()
-
-            # TODO: Look at supplying stats through CLI
-            # print(f'Total Tag Count: {arcadia.get_subject_count()}')
-            # print(f'Total Item Count: {arcadia.get_item_count()}')
-            # print(f'Total Url Count: {arcadia.get_url_item_count()}')
-
-            print(f'\nSimilar Tags: {arcadia.get_similar_subjects(search_term)}\n')
-            print(arcadia.get_summary(search_term))
-
-            # TODO: Support getting/deleting/updating items through CLI
-            # print(arcadia.get_counts_of_subjects())
-            # print(arcadia.get_random_url_item())
-            # arcadia.delete_item('https://www.youtube.com/@MrCastIron/videos')
-            # print(arcadia.update_item(
-            #     'https://www.google.com',
-            #     'https://google.com',
-            #     'Something Else',
-            #     ['hey', 'there', 'you'],
-            #     'New Description',
-            #     'new/image/location'
-            # ))
-            # print(arcadia.get_item('https://www.openfietsmap.nl/downloads/europe'))
-
-        elif len(sys.argv) == 3:
-            add_data = sys.argv[1]
-            data_tags = sys.argv[2].split(',')
-            arcadia = Arcadia(logging, SQL_LITE_DB, DataViewType.TEXT)
-            add_package: ItemPackage = {
-                'data_type': ArcadiaDataType.URL,
-                'content': add_data,
-                'tags': data_tags
-            }
-            print(arcadia.add_item(add_package))
+        METRICS_OUTPUT: str = os.getenv('ARCADIA_METRICS_OUTPUT')
+        metrics.configure_from_env(logging_object=logging)
+        daemon_client: Optional[ArcadiaClient] = ArcadiaClient.connect_if_running(
+            DaemonProtocol.socket_path(SQL_LITE_DB)
+        ) if cli_args.command in daemon_commands else None
+        if daemon_client:
+            try:
+                with daemon_client:
+                    run_daemon_command(cli_args, daemon_client)
+            except (ArcadiaDaemonError, OSError) as daemon_error:
+                logger.warning(f'Arcadia daemon request failed, running locally: {str(daemon_error)}')
+                run_command(cli_args, SQL_LITE_DB)
         else:
-            print('Please give term to search')
+            run_command(cli_args, SQL_LITE_DB)
+        if METRICS_OUTPUT and metrics.enabled:
+            metrics.write(METRICS_OUTPUT)
 
     except TypeError as type_error:
         print(f'Received TypeError: Check that the .env project file is configured correctly: {type_error}')
@@ -1,11 +1,14 @@
 import os
+import sys
 import logging.config
-import sqlite3
 
 from dotenv import load_dotenv
 from library.arcadia_types import DataViewType
 from library.arcadia import Arcadia
-from library.db.arcadia_db import ArcadiaDb
+from library.metrics import metrics
+from library.collectors.scraper import Scraper
+from library.collectors.scrape_cache import ScrapeCache
+from library.db.db_types import EnrichmentResponse
 
 
 if __name__ == '__main__':
@@ -16,17 +19,48 @@ if __name__ == '__main__':
     try:
         load_dotenv()
         SQL_LITE_DB: str = os.getenv('SQL_LITE_DB')
-        arcadia_db: ArcadiaDb = ArcadiaDb(logging, SQL_LITE_DB)
-        arcadia: Arcadia = Arcadia(logging, SQL_LITE_DB, DataViewType.RAW)
-        db_urls: list[sqlite3.Row] = arcadia_db.get_meta_data()
-        urls: list[str] = []
-        count = 0
-
-        for url in db_urls:
-            if url['title'] == 'None' and url['description'] == 'None' and url['image'] == 'None':
-                count += 1
-                arcadia.update_item_meta(url['data'])
-        logger.info(f'Total Updates Attempted: {count}')
+        METRICS_OUTPUT: str = os.getenv('ARCADIA_METRICS_OUTPUT')
+        metrics.configure_from_env(logging_object=logging)
+        SCRAPE_WORKERS: int = int(os.getenv('SCRAPE_WORKERS', '8'))
+        SCRAPE_HOST_CONCURRENCY: int = int(os.getenv('SCRAPE_HOST_CONCURRENCY', '2'))
+        SCRAPE_HOST_DELAY: float = float(os.getenv('SCRAPE_HOST_DELAY', '1.0'))
+        SCRAPE_CACHE_DB: str = os.getenv('SCRAPE_CACHE_DB')
+        ENRICHMENT_BATCH_SIZE: int = int(os.getenv('ENRICHMENT_BATCH_SIZE', '500'))
+        ENRICHMENT_MAX_ATTEMPTS: int = int(os.getenv('ENRICHMENT_MAX_ATTEMPTS', '5'))
+        ENRICHMENT_RETRY_DELAY: float = float(os.getenv('ENRICHMENT_RETRY_DELAY', '300'))
+        ENRICHMENT_CLAIM_LEASE: float = float(os.getenv('ENRICHMENT_CLAIM_LEASE', '3600'))
+        REFRESH_ALL: bool = '--refresh' in sys.argv[1:]
+        RETRY_FAILED: bool = '--retry-failed' in sys.argv[1:]
+        Scraper.max_head_bytes = int(os.getenv('SCRAPE_MAX_BYTES', str(Scraper.max_head_bytes)))
+        scrape_cache: ScrapeCache = ScrapeCache(
+            logging,
+            SCRAPE_CACHE_DB,
+            ttl=float(os.getenv('SCRAPE_CACHE_TTL', '86400')),
+            max_entries=int(os.getenv('SCRAPE_CACHE_MAX_ENTRIES', '100000'))
+        ) if SCRAPE_CACHE_DB else None
+        with Arcadia(logging, SQL_LITE_DB, DataViewType.RAW, scrape_cache=scrape_cache) as arcadia:
+            if REFRESH_ALL:
+                logger.info(f'Queued {arcadia.enqueue_url_items()} URL items for refresh')
+            if RETRY_FAILED:
+                logger.info(f'Requeued {arcadia.retry_failed_enrichments()} failed URL items')
+            attempted_count: int = 0
+            updated_count: int = 0
+            while True:
+                enrichment_response: EnrichmentResponse = arcadia.process_enrichment_queue(
+                    ENRICHMENT_BATCH_SIZE, SCRAPE_WORKERS, SCRAPE_HOST_CONCURRENCY, SCRAPE_HOST_DELAY,
+                    max_attempts=ENRICHMENT_MAX_ATTEMPTS, retry_delay=ENRICHMENT_RETRY_DELAY,
+                    claim_lease=ENRICHMENT_CLAIM_LEASE
+                )
+                attempted_count += enrichment_response['attempted']
+                updated_count += enrichment_response['updated']
+                if not enrichment_response['attempted'] and not enrichment_response['deferred']:
+                    break
+            logger.info(f'Total Updates Attempted: {attempted_count}, Total Updated: {updated_count}, '
+                        f'Queue: {arcadia.get_enrichment_counts()}')
+        if scrape_cache:
+            scrape_cache.close()
+        if METRICS_OUTPUT and metrics.enabled:
+            metrics.write(METRICS_OUTPUT)
 
     except TypeError as type_error:
         logger.error(f'Received TypeError: {type_error}')
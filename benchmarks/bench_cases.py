@@ -0,0 +1,127 @@
+import io
+import itertools
+from typing import Any, Callable
+from arcadia.library.arcadia import Arcadia
+from arcadia.library.arcadia_types import DataViewType
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ArcadiaDbRecord
+from arcadia.library.vine import Vine
+from .harness import BenchmarkHarness
+from .library_generator import LibraryGenerator
+
+
+class BenchContext:
+    def __init__(self, logging_object: Any, db_location: str, generator: LibraryGenerator):
+        self.logging_object = logging_object
+        self.db_location: str = db_location
+        self.generator: LibraryGenerator = generator
+        self.arcadia_db: ArcadiaDb = ArcadiaDb(logging_object, db_location, persistent=True)
+        self.popular_tag: str = generator.tags[0]
+        self.rare_tag: str = generator.tags[-1]
+        self._unique_items: itertools.count = itertools.count(generator.item_count * 10)
+
+    def new_arcadia(self, data_view_type: DataViewType = DataViewType.TEXT) -> Arcadia:
+        return Arcadia(self.logging_object, self.db_location, data_view_type, persistent=True, query_cache_size=0)
+
+    def unique_index(self) -> int:
+        return next(self._unique_items)
+
+    def close(self) -> None:
+        self.arcadia_db.close()
+
+
+def bench_get_records(harness: BenchmarkHarness, context: BenchContext) -> None:
+    harness.benchmark('get_records[popular]', lambda: context.arcadia_db.get_records(context.popular_tag), 'db')
+    harness.benchmark('get_records[rare]', lambda: context.arcadia_db.get_records(context.rare_tag), 'db')
+    harness.benchmark('get_records[page_50]', lambda: context.arcadia_db.get_records(context.popular_tag, 50), 'db')
+
+
+def bench_get_tags(harness: BenchmarkHarness, context: BenchContext) -> None:
+    harness.benchmark('get_tags', context.arcadia_db.get_tags, 'db')
+    harness.benchmark('get_tags_with_count', context.arcadia_db.get_tags_with_count, 'db')
+
+
+def bench_search(harness: BenchmarkHarness, context: BenchContext) -> None:
+    query: str = f'{context.popular_tag[:3]}*'
+    harness.benchmark('search_records[prefix]', lambda: context.arcadia_db.search_records(query, 20, 0), 'db')
+
+
+def bench_vine(harness: BenchmarkHarness, context: BenchContext) -> None:
+    records: list[ArcadiaDbRecord] = context.arcadia_db.get_records(context.popular_tag)
+    vine: Vine = Vine(context.logging_object, context.popular_tag, records, DataViewType.TEXT)
+    extra_info: dict = {'records': len(records)}
+    harness.benchmark(
+        'vine_build', lambda: Vine(context.logging_object, context.popular_tag, records, DataViewType.TEXT), 'vine',
+        extra_info=extra_info
+    )
+    harness.benchmark('vine_render', vine.__str__, 'vine', extra_info=extra_info)
+    harness.benchmark('vine_write', lambda: vine.write(io.StringIO()), 'vine', extra_info=extra_info)
+
+
+def bench_subjects(harness: BenchmarkHarness, context: BenchContext) -> None:
+    arcadias: list[Arcadia] = []
+
+    def new_arcadia() -> None:
+        arcadias.append(context.new_arcadia())
+
+    harness.benchmark('get_subjects_dictionary[cold]', lambda: arcadias[-1].get_subjects_dictionary(), 'arcadia',
+                      setup=new_arcadia)
+    harness.benchmark('get_subjects_dictionary[warm]', arcadias[-1].get_subjects_dictionary, 'arcadia')
+    harness.benchmark('get_similar_subjects', lambda: arcadias[-1].get_similar_subjects(context.popular_tag[:3]),
+                      'arcadia')
+    for arcadia in arcadias:
+        arcadia.close()
+
+
+def bench_insert(harness: BenchmarkHarness, context: BenchContext) -> None:
+    harness.benchmark(
+        'insert_record',
+        lambda: context.arcadia_db.insert_record(context.generator.item_package(context.unique_index())),
+        'db_write'
+    )
+    batch_size: int = 1000
+    harness.benchmark(
+        'insert_records[1000]',
+        lambda: context.arcadia_db.insert_records(
+            context.generator.item_package(context.unique_index()) for _ in range(batch_size)
+        ),
+        'db_write',
+        rounds=3,
+        extra_info={'batch_size': batch_size}
+    )
+
+
+def bench_scraper(harness: BenchmarkHarness, context: BenchContext) -> None:
+    from arcadia.library.collectors.scraper import Scraper
+    from arcadia.library.collectors.scrape_pool import ScrapePool
+    from .stub_server import StubServer
+
+    with StubServer() as stub_server:
+        session = Scraper.create_session()
+        page_url: str = stub_server.url('/page/1')
+        harness.benchmark('scraper_get_url_meta[stream]', lambda: Scraper.get_url_meta(page_url, session), 'scraper')
+        harness.benchmark('scraper_get_url_meta[bs4]', lambda: Scraper.get_url_meta(page_url, session, stream=False),
+                          'scraper')
+        session.close()
+
+    with StubServer(latency=0.02) as stub_server:
+        page_urls: list[str] = [stub_server.url(f'/page/{page}') for page in range(50)]
+
+        def scrape_pages() -> None:
+            scrape_pool: ScrapePool = ScrapePool(context.logging_object, workers=8, host_concurrency=8, host_delay=0)
+            list(scrape_pool.scrape(page_urls))
+            scrape_pool.close()
+
+        harness.benchmark('scrape_pool[50_pages]', scrape_pages, 'scraper', rounds=3,
+                          extra_info={'pages': len(page_urls), 'latency': 0.02})
+
+
+bench_cases: dict[str, Callable[[BenchmarkHarness, BenchContext], None]] = {
+    'get_records': bench_get_records,
+    'get_tags': bench_get_tags,
+    'search': bench_search,
+    'vine': bench_vine,
+    'subjects': bench_subjects,
+    'insert': bench_insert,
+    'scraper': bench_scraper
+}
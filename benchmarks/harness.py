@@ -0,0 +1,130 @@
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, TypedDict
+
+
+class BenchmarkStats(TypedDict):
+    name: str
+    group: str
+    rounds: int
+    iterations: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    p95: float
+    ops: float
+    extra_info: dict
+
+
+class BenchmarkHarness:
+    def __init__(self, rounds: int = 10, warmup_rounds: int = 1, min_round_time: float = 0.0):
+        self.rounds: int = max(1, rounds)
+        self.warmup_rounds: int = max(0, warmup_rounds)
+        self.min_round_time: float = min_round_time
+        self.results: list[BenchmarkStats] = []
+
+    @staticmethod
+    def _percentile(timings: list[float], percentile: float) -> float:
+        ordered: list[float] = sorted(timings)
+        return ordered[min(len(ordered) - 1, int(round(percentile * (len(ordered) - 1))))]
+
+    def _iterations(self, function: Callable[[], Any]) -> int:
+        if not self.min_round_time:
+            return 1
+        start: float = time.perf_counter()
+        function()
+        elapsed: float = time.perf_counter() - start
+        return max(1, int(self.min_round_time / elapsed)) if elapsed else 1000
+
+    def benchmark(self, name: str, function: Callable[[], Any], group: str = '',
+                  setup: Optional[Callable[[], None]] = None, rounds: Optional[int] = None,
+                  extra_info: Optional[dict] = None) -> BenchmarkStats:
+        for _ in range(self.warmup_rounds):
+            if setup:
+                setup()
+            function()
+        iterations: int = 1 if setup else self._iterations(function)
+        timings: list[float] = []
+        gc_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds or self.rounds):
+                if setup:
+                    setup()
+                start: float = time.perf_counter()
+                for _ in range(iterations):
+                    function()
+                timings.append((time.perf_counter() - start) / iterations)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        mean: float = statistics.fmean(timings)
+        stats: BenchmarkStats = {
+            'name': name,
+            'group': group,
+            'rounds': len(timings),
+            'iterations': iterations,
+            'min': min(timings),
+            'max': max(timings),
+            'mean': mean,
+            'median': statistics.median(timings),
+            'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            'p95': self._percentile(timings, 0.95),
+            'ops': 1 / mean if mean else 0.0,
+            'extra_info': extra_info or {}
+        }
+        self.results.append(stats)
+        return stats
+
+    @staticmethod
+    def _commit() -> Optional[str]:
+        try:
+            return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def report(self, params: Optional[dict] = None) -> dict:
+        return {
+            'datetime': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'machine_info': {
+                'python_version': platform.python_version(),
+                'python_implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'system': platform.system()
+            },
+            'commit_info': {'id': self._commit()},
+            'params': params or {},
+            'benchmarks': self.results
+        }
+
+    def write_report(self, report_path: str, params: Optional[dict] = None) -> None:
+        with open(report_path, 'w') as report_file:
+            json.dump(self.report(params), report_file, indent=2)
+
+    @staticmethod
+    def compare(report: dict, baseline: dict, threshold: float = 1.25) -> list[str]:
+        baseline_stats: dict[str, dict] = {stats['name']: stats for stats in baseline.get('benchmarks', [])}
+        regressions: list[str] = []
+        for stats in report['benchmarks']:
+            previous: Optional[dict] = baseline_stats.get(stats['name'])
+            if previous and previous['median'] and stats['median'] / previous['median'] > threshold:
+                regressions.append(
+                    f'{stats["name"]}: median {stats["median"] * 1000:.3f} ms vs '
+                    f'{previous["median"] * 1000:.3f} ms ({stats["median"] / previous["median"]:.2f}x)'
+                )
+        return regressions
+
+    def summary(self) -> str:
+        lines: list[str] = [f'{"benchmark":<36}{"median ms":>12}{"p95 ms":>12}{"ops/s":>12}{"rounds":>8}']
+        for stats in self.results:
+            lines.append(f'{stats["name"]:<36}{stats["median"] * 1000:>12.3f}{stats["p95"] * 1000:>12.3f}'
+                         f'{stats["ops"]:>12.1f}{stats["rounds"]:>8}')
+        return '\n'.join(lines)
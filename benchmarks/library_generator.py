@@ -0,0 +1,78 @@
+import logging.config
+import random
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, Iterator
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ItemPackage, ArcadiaDataType, AddDbItemsResponse
+
+
+class LibraryGenerator:
+    syllables: tuple[str, ...] = (
+        'ar', 'ca', 'di', 'py', 'thon', 'rust', 'web', 'data', 'ops', 'net', 'sec', 'ml', 'go', 'js', 'db', 'ui',
+        'api', 'dev', 'lin', 'ux', 'os', 'cloud', 'edge', 'kit', 'lab', 'map', 'art', 'bio', 'geo', 'fin'
+    )
+
+    def __init__(self, seed: int = 84, item_count: int = 10000, tag_count: int = 2000, tags_per_item: int = 3,
+                 zipf_exponent: float = 1.1, url_ratio: float = 0.8, meta_ratio: float = 0.5):
+        self._random: random.Random = random.Random(seed)
+        self.item_count: int = item_count
+        self.tag_count: int = tag_count
+        self.tags_per_item: int = tags_per_item
+        self.zipf_exponent: float = zipf_exponent
+        self.url_ratio: float = url_ratio
+        self.meta_ratio: float = meta_ratio
+        self.tags: list[str] = self._generate_tags()
+        self._cumulative_weights: list[float] = list(accumulate(
+            1 / rank ** zipf_exponent for rank in range(1, tag_count + 1)
+        ))
+
+    def _generate_tags(self) -> list[str]:
+        tags: dict[str, None] = {}
+        while len(tags) < self.tag_count:
+            tag: str = ''.join(self._random.choices(self.syllables, k=self._random.randint(1, 3)))
+            if self._random.random() < 0.2:
+                tag = f'{tag}_{self._random.choice(self.syllables)}'
+            tags.setdefault(tag, None)
+        return list(tags)
+
+    def zipf_tag(self) -> str:
+        point: float = self._random.random() * self._cumulative_weights[-1]
+        return self.tags[min(bisect(self._cumulative_weights, point), self.tag_count - 1)]
+
+    def item_tags(self) -> list[str]:
+        tags: set[str] = set()
+        while len(tags) < min(self.tags_per_item, self.tag_count):
+            tags.add(self.zipf_tag())
+        return list(tags)
+
+    def item_package(self, index: int) -> ItemPackage:
+        if self._random.random() < self.url_ratio:
+            return {
+                'data_type': ArcadiaDataType.URL,
+                'content': f'https://{self._random.choice(self.tags)}.example.com/{index}',
+                'tags': self.item_tags()
+            }
+        return {
+            'data_type': ArcadiaDataType.NOTE,
+            'content': f'note {index} about {" ".join(self.item_tags())}',
+            'tags': self.item_tags()
+        }
+
+    def generate_items(self, start: int = 0) -> Iterator[ItemPackage]:
+        for index in range(start, start + self.item_count):
+            yield self.item_package(index)
+
+    def meta_updates(self, urls: list[str]) -> list[tuple[str, str, str, str]]:
+        return [
+            (url, f'{self.zipf_tag().title()} article {index}', f'About {" and ".join(self.item_tags())}',
+             f'https://cdn.example.com/{index}.png')
+            for index, url in enumerate(urls) if self._random.random() < self.meta_ratio
+        ]
+
+    def build_db(self, logging_object: Any, db_location: str) -> AddDbItemsResponse:
+        with ArcadiaDb(logging_object, db_location, persistent=True) as arcadia_db:
+            response: AddDbItemsResponse = arcadia_db.insert_records(self.generate_items(), batch_size=1000)
+            arcadia_db.update_records_meta(self.meta_updates(response['added_urls']))
+        return response
+
@@ -0,0 +1,57 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from .bench_cases import BenchContext, bench_cases
+from .harness import BenchmarkHarness
+from .library_generator import LibraryGenerator
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Benchmark Arcadia hot paths')
+    parser.add_argument('--items', type=int, default=10000, help='synthetic ITEMS rows')
+    parser.add_argument('--tags', type=int, default=2000, help='distinct tags')
+    parser.add_argument('--tags-per-item', type=int, default=3)
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf exponent of the tag distribution')
+    parser.add_argument('--seed', type=int, default=84)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--cases', default=','.join(bench_cases), help='comma separated subset of cases')
+    parser.add_argument('--db', help='reuse or create the synthetic DB at this path')
+    parser.add_argument('--output', default='benchmark_report.json', help='JSON report path')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25, help='median slowdown ratio counted as regression')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.disable(logging.INFO)
+    generator: LibraryGenerator = LibraryGenerator(args.seed, args.items, args.tags, args.tags_per_item, args.zipf)
+    temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+    db_location: str = args.db or os.path.join(temp_dir.name, 'arcadia_bench.db')
+    if not os.path.exists(db_location):
+        start: float = time.perf_counter()
+        generator.build_db(logging, db_location)
+        print(f'Generated {args.items} items with {args.tags} tags in {time.perf_counter() - start:.1f}s')
+
+    harness: BenchmarkHarness = BenchmarkHarness(args.rounds)
+    context: BenchContext = BenchContext(logging, db_location, generator)
+    try:
+        for case in args.cases.split(','):
+            bench_cases[case](harness, context)
+    finally:
+        context.close()
+    harness.write_report(args.output, {key: value for key, value in vars(args).items() if key != 'baseline'})
+    print(harness.summary())
+    print(f'Report written to {args.output}')
+
+    temp_dir.cleanup()
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions: list[str] = BenchmarkHarness.compare(harness.report(), json.load(baseline_file),
+                                                              args.threshold)
+        for regression in regressions:
+            print(f'Regression: {regression}')
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,86 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class StubPageHandler(BaseHTTPRequestHandler):
+    protocol_version: str = 'HTTP/1.1'
+    latency: float = 0.0
+    body_bytes: int = 256 * 1024
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _page(self) -> bytes:
+        head: str = (
+            f'<html><head><meta charset="utf-8"><title>Stub page {self.path}</title>'
+            f'<meta property="og:title" content="Stub {self.path}">'
+            f'<meta name="description" content="Benchmark page served at {self.path}">'
+            f'<link rel="icon" sizes="64x64" href="/icon-64.png"><link rel="icon" sizes="128x128" href="/icon-128.png">'
+            f'</head><body>'
+        )
+        return (head + '<p>lorem ipsum</p>' * (self.body_bytes // 16) + '</body></html>').encode()
+
+    def do_GET(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.send_header('content-length', '0')
+            self.end_headers()
+            return
+        page: bytes = self._page()
+        etag: str = f'"{hashlib.md5(page).hexdigest()}"'
+        if self.headers.get('if-none-match') == etag:
+            self.send_response(304)
+            self.send_header('etag', etag)
+            self.send_header('content-length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('content-type', 'text/html; charset=utf-8')
+        self.send_header('content-length', str(len(page)))
+        self.send_header('etag', etag)
+        self.end_headers()
+        try:
+            self.wfile.write(page)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class StubServer:
+    def __init__(self, latency: float = 0.0, body_bytes: int = 256 * 1024, port: int = 0):
+        handler: type = type('ConfiguredStubPageHandler', (StubPageHandler,), {
+            'latency': latency,
+            'body_bytes': body_bytes
+        })
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'StubServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def url(self, path: str) -> str:
+        return f'{self.base_url}/{path.lstrip("/")}'
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
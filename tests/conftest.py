@@ -0,0 +1,34 @@
+import os
+import sqlite3
+from typing import Callable, Iterator
+
+import pytest
+from arcadia.library.co_occurrence import CoOccurrence
+
+sql_path = os.path.join(os.path.dirname(__file__), '..', 'arcadia', 'library', 'db', 'sql')
+
+
+def read_sql_file(file_name: str) -> str:
+    with open(os.path.join(sql_path, file_name)) as sql_file:
+        return sql_file.read().replace('{max_item_tags}', str(CoOccurrence.max_item_tags))
+
+
+@pytest.fixture
+def read_sql() -> Callable[[str], str]:
+    return read_sql_file
+
+
+@pytest.fixture
+def sql_db() -> Iterator[Callable[..., sqlite3.Connection]]:
+    connections: list[sqlite3.Connection] = []
+
+    def connect(*schema_files: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(':memory:')
+        for schema_file in schema_files:
+            conn.executescript(read_sql_file(schema_file))
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
@@ -0,0 +1,45 @@
+import os
+import socket
+import tempfile
+import threading
+from arcadia.library.arcadia_client import ArcadiaClient, ArcadiaDaemonError
+from arcadia.library.daemon_protocol import DaemonProtocol
+
+
+def serve_once(server_socket: socket.socket) -> None:
+    connection, _ = server_socket.accept()
+    with connection, connection.makefile('rb') as reader:
+        for line in reader:
+            request = DaemonProtocol.decode(line)
+            if request['method'] == 'search':
+                response = {'id': request['id'], 'result': [request['params']['query']]}
+            else:
+                response = {'id': request['id'], 'error': f'Unknown method: {request["method"]}'}
+            connection.sendall(DaemonProtocol.encode(response))
+
+
+def test_client_round_trips_and_errors():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        socket_path = os.path.join(temp_dir, 'arcadia.sock')
+        assert ArcadiaClient.connect_if_running(socket_path) is None
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server_socket.bind(socket_path)
+        server_socket.listen()
+        server_thread = threading.Thread(target=serve_once, args=(server_socket,))
+        server_thread.start()
+        with ArcadiaClient.connect_if_running(socket_path, timeout=5) as client:
+            assert client.search('café "tea"') == ['café "tea"']
+            try:
+                client.call('missing')
+                assert False
+            except ArcadiaDaemonError as error:
+                assert str(error) == 'Unknown method: missing'
+        server_thread.join(5)
+        server_socket.close()
+
+
+def test_protocol_is_compact_newline_delimited_json():
+    message = DaemonProtocol.encode({'id': 1, 'method': 'stats', 'params': {}})
+    assert message == b'{"id":1,"method":"stats","params":{}}\n'
+    assert DaemonProtocol.decode(message)['method'] == 'stats'
+    assert DaemonProtocol.socket_path('/tmp/arcadia.db', '/run/arcadia.sock') == '/run/arcadia.sock'
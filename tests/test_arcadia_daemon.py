@@ -0,0 +1,35 @@
+import logging
+import threading
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.arcadia_client import ArcadiaClient, ArcadiaDaemonError
+from arcadia.library.arcadia_daemon import ArcadiaDaemon
+
+
+def test_daemon_dispatches_client_requests(tmp_path):
+    db_path = str(tmp_path / 'arcadia.db')
+    with ArcadiaDaemon(logging, db_path, str(tmp_path / 'arcadia.sock')) as arcadia_daemon:
+        server_thread = threading.Thread(target=arcadia_daemon.serve_forever)
+        server_thread.start()
+        try:
+            with ArcadiaClient(arcadia_daemon.socket_path, timeout=5) as client:
+                assert client.ping()['db'] == db_path
+                added = client.add_item('daemon sqlite note', ['python', 'daemon'], 'NOTE', fetch_meta=False)
+                assert added['added_item']
+                duplicate = client.add_item('daemon sqlite note', ['python'], 'NOTE', fetch_meta=False)
+                assert duplicate['reason'] == 'item_duplicate'
+                assert duplicate['data'] == [{'data': 'daemon sqlite note', 'tags': ['python', 'daemon']}]
+                item = client.get_item('daemon sqlite note')
+                assert (item['data'], item['data_type'], item['tags']) == ('daemon sqlite note', 'NOTE',
+                                                                           ['python', 'daemon'])
+                assert 'daemon sqlite note' in client.search('sqlite')
+                with pytest.raises(ArcadiaDaemonError, match='Unknown method: missing'):
+                    client.call('missing')
+                with pytest.raises(ArcadiaDaemonError, match='count must be a positive integer'):
+                    client.get_random_url_items(0)
+        finally:
+            arcadia_daemon.shutdown()
+            server_thread.join(5)
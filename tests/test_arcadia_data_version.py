@@ -0,0 +1,44 @@
+import logging
+import sqlite3
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.arcadia import Arcadia
+from arcadia.library.arcadia_types import DataViewType
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+def insert_external_note(db_path: str, content: str, tag: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO ITEMS(time_stamp, data, data_type, tags) VALUES ('2024-01-01', ?, 'NOTE', ?)",
+                 [content, f'["{tag}"]'])
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.parametrize('persistent', [True, False])
+def test_summary_sees_external_writes(tmp_path, persistent):
+    db_path = str(tmp_path / 'arcadia.db')
+    with Arcadia(logging, db_path, DataViewType.RAW, persistent=persistent) as arcadia:
+        arcadia.add_item({'data_type': ArcadiaDataType.NOTE, 'content': 'first note', 'tags': ['python']})
+        assert 'second note' not in str(arcadia.get_summary('python'))
+        insert_external_note(db_path, 'second note', 'python')
+        assert 'second note' in str(arcadia.get_summary('python'))
+
+
+def test_own_writes_do_not_absorb_external_writes(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'arcadia.db')
+    with Arcadia(logging, db_path, DataViewType.RAW, persistent=True) as arcadia:
+        arcadia.add_item({'data_type': ArcadiaDataType.URL, 'content': 'https://a.com', 'tags': ['python']})
+        assert 'zebra' not in str(arcadia.get_subjects_dictionary())
+        update_record_meta = arcadia._arcadia_db.update_record_meta
+
+        def update_after_external_write(*args):
+            insert_external_note(db_path, 'zebra note', 'zebra')
+            return update_record_meta(*args)
+
+        monkeypatch.setattr(arcadia._arcadia_db, 'update_record_meta', update_after_external_write)
+        assert arcadia.set_item_meta('https://a.com', {'title': {'content': 'A'}, 'description': {}, 'image': {}})
+        assert 'zebra' in str(arcadia.get_subjects_dictionary())
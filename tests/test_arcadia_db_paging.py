@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+@pytest.fixture
+def arcadia_db(tmp_path):
+    with ArcadiaDb(logging, str(tmp_path / 'arcadia.db'), persistent=True) as db:
+        db.insert_records([
+            {'data_type': ArcadiaDataType.URL if index % 2 else ArcadiaDataType.NOTE, 'content': f'item {index}',
+             'tags': ['python'] if index % 5 else ['rust']}
+            for index in range(30)
+        ])
+        yield db
+
+
+@pytest.mark.parametrize('limit', [1, 7, 24, 50])
+def test_keyset_pages_cover_every_record_once(arcadia_db, limit):
+    all_records = arcadia_db.get_records('python')
+    assert len(all_records) == 24
+    paged_ids: list[int] = []
+    before_id = None
+    while True:
+        page = arcadia_db.get_records('python', limit, before_id)
+        if not page:
+            break
+        assert len(page) <= limit
+        paged_ids.extend(record['ID'] for record in page)
+        before_id = page[-1]['ID']
+    assert paged_ids == [record['ID'] for record in all_records]
+    assert paged_ids == sorted(paged_ids, reverse=True)
+
+
+def test_iter_records_matches_get_records(arcadia_db):
+    assert list(arcadia_db.iter_records('python', fetch_size=4)) == arcadia_db.get_records('python')
+    before_id = arcadia_db.get_records('python', 5)[-1]['ID']
+    assert list(arcadia_db.iter_records('python', before_id, fetch_size=3)) == \
+        arcadia_db.get_records('python', before_id=before_id)
@@ -0,0 +1,80 @@
+import logging
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.db import arcadia_db as arcadia_db_module
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+def item_package(content: str, tags: list[str], data_type: ArcadiaDataType = ArcadiaDataType.URL) -> dict:
+    return {'data_type': data_type, 'content': content, 'tags': tags}
+
+
+@pytest.fixture
+def arcadia_db(tmp_path):
+    with ArcadiaDb(logging, str(tmp_path / 'arcadia.db'), persistent=True) as db:
+        yield db
+
+
+def url_ids(arcadia_db: ArcadiaDb, tag: str = None) -> set[int]:
+    if tag is None:
+        return {row[0] for row in arcadia_db._query_for_db_rows("SELECT ID FROM ITEMS WHERE data_type = 'URL';")}
+    return {
+        row[0] for row in arcadia_db._query_with_params(
+            "SELECT ITEMS.ID FROM ITEM_TAGS JOIN ITEMS ON ITEMS.ID = ITEM_TAGS.item_id "
+            "WHERE ITEM_TAGS.tag = ? AND ITEMS.data_type = 'URL';", [tag]
+        )
+    }
+
+
+@pytest.mark.parametrize('count', [1, 5, 30])
+def test_random_records_are_distinct_url_rows(arcadia_db, count):
+    arcadia_db.insert_records([item_package(f'https://site{index}.com', ['web']) for index in range(40)])
+    arcadia_db.insert_records([item_package(f'note {index}', ['web'], ArcadiaDataType.NOTE) for index in range(40)])
+    records = arcadia_db.get_random_url_records(count)
+    assert len(records) == count
+    assert len({record['ID'] for record in records}) == count
+    assert {record['ID'] for record in records} <= url_ids(arcadia_db)
+    assert {record['data_type'] for record in records} == {'URL'}
+
+
+def test_random_records_are_capped_at_the_population(arcadia_db):
+    arcadia_db.insert_records([item_package(f'https://site{index}.com', ['web']) for index in range(10)])
+    assert {record['ID'] for record in arcadia_db.get_random_url_records(1000)} == url_ids(arcadia_db)
+    assert arcadia_db.get_random_url_records(0) == []
+
+
+def test_random_records_follow_the_tag_filter(arcadia_db):
+    arcadia_db.insert_records([
+        item_package(f'https://site{index}.com', ['python'] if index % 3 == 0 else ['rust']) for index in range(30)
+    ])
+    arcadia_db.insert_records([item_package('python note', ['python'], ArcadiaDataType.NOTE)])
+    python_ids = url_ids(arcadia_db, 'python')
+    assert {record['ID'] for record in arcadia_db.get_random_url_records(100, 'python')} == python_ids
+    sampled_records = arcadia_db.get_random_url_records(2, 'python')
+    assert len(sampled_records) == 2
+    assert all('python' in record['tags'] for record in sampled_records)
+    assert arcadia_db.get_random_url_records(5, 'missing') == []
+
+
+def test_random_row_seeks_past_missed_probes(arcadia_db, monkeypatch):
+    arcadia_db.insert_records([item_package(f'note {index}', ['web'], ArcadiaDataType.NOTE) for index in range(50)])
+    arcadia_db.insert_records([item_package(f'https://site{index}.com', ['web']) for index in range(3)])
+    low_id, high_id = arcadia_db._random_id_range('web')
+    first_web_url = min(url_ids(arcadia_db, 'web'))
+    monkeypatch.setattr(arcadia_db_module.random, 'randint', lambda low, high: low)
+    assert arcadia_db._random_url_row(low_id, high_id, 'web')['ID'] == first_web_url
+    assert arcadia_db._random_url_row(low_id, high_id, None)['ID'] == first_web_url
+
+
+def test_sparse_tags_sample_every_url_row(arcadia_db):
+    arcadia_db.insert_records([item_package(f'note {index}', ['web'], ArcadiaDataType.NOTE) for index in range(50)])
+    arcadia_db.insert_records([item_package(f'https://site{index}.com', ['web']) for index in range(3)])
+    web_ids = url_ids(arcadia_db, 'web')
+    sampled_ids = [record['ID'] for record in arcadia_db.get_random_url_records(2, 'web')]
+    assert len(set(sampled_ids)) == 2 and set(sampled_ids) <= web_ids
+    excluded_id = min(web_ids)
+    assert {row['ID'] for row in arcadia_db._sample_url_rows(5, 'web', [excluded_id])} == web_ids - {excluded_id}
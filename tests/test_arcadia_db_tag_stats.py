@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+class TagStatsBaselineDb(ArcadiaDb):
+    schema_migrations = ArcadiaDb.schema_migrations[:ArcadiaDb.schema_migrations.index('tag_stats')]
+
+
+def item_package(content: str, tags: list[str], data_type: ArcadiaDataType = ArcadiaDataType.URL) -> dict:
+    return {'data_type': data_type, 'content': content, 'tags': tags}
+
+
+def test_tag_stats_backfill_and_top_tags(tmp_path):
+    db_path = str(tmp_path / 'arcadia.db')
+    with TagStatsBaselineDb(logging, db_path, persistent=True) as baseline_db:
+        assert not baseline_db._check_db_state(['TAG_STATS'])
+        baseline_db.insert_records([
+            item_package('https://a', ['python', 'web']),
+            item_package('https://b', ['Python', 'rust']),
+            item_package('python note', ['python', 'web'], ArcadiaDataType.NOTE)
+        ])
+
+    with ArcadiaDb(logging, db_path, persistent=True) as arcadia_db:
+        assert arcadia_db._get_user_version() == len(ArcadiaDb.schema_migrations)
+        top_tags = [tuple(row)[:4] for row in arcadia_db.get_tags_with_count(2)]
+        assert top_tags == [('python', 3, 2, 1), ('web', 2, 1, 1)]
+        assert arcadia_db.get_tag_count()[0] == 4
+        arcadia_db.delete_arc_record('https://a')
+        triggered_tags = sorted(tuple(row) for row in arcadia_db.get_tags_with_count())
+        assert arcadia_db.rebuild_tag_stats() == 4
+        assert sorted(tuple(row) for row in arcadia_db.get_tags_with_count()) == triggered_tags
+        assert [tuple(row)[:2] for row in arcadia_db.get_tags_with_count(1)] == [('python', 2)]
@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.arcadia import Arcadia
+from arcadia.library.arcadia_types import DataViewType
+from arcadia.library.db.arcadia_db import ArcadiaDb
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+@pytest.mark.parametrize('query, fts_query', [
+    ('sqlite', '"sqlite"'),
+    ('sql*', '"sql"*'),
+    ('"full text" search*', '"full text" "search"*'),
+    ('unbalanced "quote', '"unbalanced" """quote"'),
+    ('em"bed"ded', '"em""bed""ded"'),
+    ('a "" b', '"a" "b"'),
+    ('*', ''),
+    ('** "  "', '')
+])
+def test_to_fts_query(sql_db, query, fts_query):
+    assert ArcadiaDb.to_fts_query(query) == fts_query
+    if fts_query:
+        conn = sql_db('schema.sql', 'items_fts_schema.sql')
+        conn.execute('SELECT rowid FROM ITEMS_FTS WHERE ITEMS_FTS MATCH ?', [fts_query]).fetchall()
+
+
+def test_search_ranks_and_highlights(tmp_path):
+    with Arcadia(logging, str(tmp_path / 'arcadia.db'), DataViewType.RAW, persistent=True) as arcadia:
+        for content in ['sqlite ranking note', 'plain note about ranking']:
+            arcadia.add_item({'data_type': ArcadiaDataType.NOTE, 'content': content, 'tags': ['search']})
+        arcadia.set_items_meta([('sqlite ranking note', {'title': {'content': 'SQLite ranking'}, 'description': {},
+                                                         'image': {}})])
+        results = arcadia.search('rank*')
+        assert [result['item']['data'] for result in results] == ['sqlite ranking note', 'plain note about ranking']
+        assert results[0]['rank'] <= results[1]['rank']
+        assert results[0]['title_snippet'] == 'SQLite [ranking]'
+        assert [result['item']['data'] for result in arcadia.search('"note about"')] == ['plain note about ranking']
+        assert arcadia.search('*') == []
+        assert arcadia.search('unbalanced "sqlite') == []
+        assert [result['item']['data'] for result in arcadia.search('"sqlite')] == ['sqlite ranking note']
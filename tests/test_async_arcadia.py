@@ -0,0 +1,28 @@
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip('willow_core')
+
+from arcadia.library.arcadia_types import DataViewType
+from arcadia.library.async_arcadia import AsyncArcadia
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+def test_open_add_search_close_and_reopen(tmp_path):
+    async def run() -> None:
+        arcadia = AsyncArcadia(logging, str(tmp_path / 'arcadia.db'), DataViewType.RAW, readers=2)
+        async with arcadia:
+            response = await arcadia.add_item({'data_type': ArcadiaDataType.NOTE, 'content': 'async sqlite note',
+                                               'tags': ['python']})
+            assert response['added_item']
+            results = await arcadia.search('sqlite')
+            assert [result['item']['data'] for result in results] == ['async sqlite note']
+
+        await arcadia.close()
+        async with arcadia:
+            assert await arcadia.get_item_count() == 2
+            assert [result['item']['data'] for result in await arcadia.search('async')] == ['async sqlite note']
+
+    asyncio.run(run())
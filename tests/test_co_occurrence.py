@@ -0,0 +1,19 @@
+import math
+import pytest
+from arcadia.library.co_occurrence import CoOccurrence
+
+
+def test_rank_by_lift_and_pair_count():
+    pairs = [('web', 40, 80), ('rust', 10, 10), ('async', 5, 20)]
+    by_lift = CoOccurrence.rank(pairs, tag_count=50, total_count=100, k=2)
+    assert [subject['tag'] for subject in by_lift] == ['rust', 'web']
+    assert by_lift[0]['lift'] == pytest.approx(2.0)
+    assert by_lift[0]['pmi'] == pytest.approx(math.log(2.0))
+    assert by_lift[0]['npmi'] == pytest.approx(math.log(2.0) / -math.log(0.1))
+    by_count = CoOccurrence.rank(pairs, tag_count=50, total_count=100, k=3, metric='pair_count')
+    assert [subject['tag'] for subject in by_count] == ['web', 'rust', 'async']
+
+
+def test_rank_rejects_unknown_metric():
+    with pytest.raises(ValueError):
+        CoOccurrence.rank([], tag_count=1, total_count=1, metric='jaccard')
@@ -0,0 +1,30 @@
+import sqlite3
+
+
+def queue_row(conn: sqlite3.Connection) -> tuple:
+    return conn.execute('SELECT status, attempts, next_attempt_at, last_error FROM ENRICHMENT_QUEUE').fetchone()
+
+
+def test_failures_back_off_until_max_attempts(sql_db, read_sql):
+    conn = sql_db('schema.sql', 'enrichment_queue_schema.sql')
+    conn.execute("INSERT INTO ITEMS(time_stamp, data, data_type, tags) VALUES ('2024-01-01', 'https://a', 'URL', '[]')")
+    failure_sql = read_sql('record_enrichment_failure.sql')
+    conn.execute(failure_sql, (1, 110.0, 'timeout', 3))
+    assert queue_row(conn) == ('pending', 1, 110.0, 'timeout')
+    conn.execute(failure_sql, (1, 220.0, 'status 500', 3))
+    assert queue_row(conn) == ('pending', 2, 220.0, 'status 500')
+    conn.execute(failure_sql, (1, 440.0, 'status 404', 3))
+    assert queue_row(conn) == ('failed', 3, 440.0, 'status 404')
+    assert conn.execute(read_sql('claim_enrichments.sql'), (1000.0, 10, 2000.0)).fetchall() == []
+
+
+def test_host_failures_defer_with_capped_growth(sql_db, read_sql):
+    conn = sql_db('schema.sql', 'enrichment_queue_schema.sql')
+    host_sql = read_sql('record_host_failure.sql')
+    next_attempts = []
+    for now in (100.0, 200.0, 300.0, 400.0):
+        conn.execute(host_sql, ('a.com', now, 10.0, 50.0))
+        next_attempts.append(conn.execute("SELECT failures, next_attempt_at FROM ENRICHMENT_HOSTS").fetchone())
+    assert next_attempts == [(1, 110.0), (2, 220.0), (3, 340.0), (4, 450.0)]
+    conn.execute(host_sql, ('b.com', 100.0, 10.0, 50.0))
+    assert conn.execute("SELECT host FROM ENRICHMENT_HOSTS WHERE next_attempt_at > 400.0").fetchall() == [('a.com',)]
@@ -0,0 +1,17 @@
+def test_claims_do_not_overlap_until_lease_expires(sql_db, read_sql):
+    conn = sql_db('schema.sql', 'enrichment_queue_schema.sql')
+    conn.executemany('INSERT INTO ITEMS(time_stamp, data, data_type, tags) VALUES (?, ?, ?, ?)',
+                     [('2024-01-01', f'https://{host}', 'URL', '[]') for host in 'abc'])
+    claim_sql = read_sql('claim_enrichments.sql')
+
+    first_claim = conn.execute(claim_sql, (100.0, 2, 200.0)).fetchall()
+    second_claim = conn.execute(claim_sql, (100.0, 2, 200.0)).fetchall()
+    assert sorted(first_claim) == [(1, 0, 'https://a'), (2, 0, 'https://b')]
+    assert second_claim == [(3, 0, 'https://c')]
+    assert conn.execute(claim_sql, (150.0, 5, 250.0)).fetchall() == []
+    assert sorted(conn.execute(claim_sql, (200.0, 5, 300.0)).fetchall()) == [
+        (1, 0, 'https://a'), (2, 0, 'https://b'), (3, 0, 'https://c')
+    ]
+    assert conn.execute('SELECT DISTINCT status, next_attempt_at FROM ENRICHMENT_QUEUE').fetchall() == [
+        ('in_progress', 300.0)
+    ]
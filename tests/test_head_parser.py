@@ -0,0 +1,40 @@
+from arcadia.library.collectors.head_parser import HeadParser
+
+
+def parse(html: str) -> HeadParser:
+    head_parser = HeadParser()
+    head_parser.feed(html)
+    head_parser.close()
+    return head_parser
+
+
+def test_prefers_open_graph_fields():
+    head_parser = parse(
+        '<html><head><title>Plain Title</title>'
+        '<meta property="og:title" content="OG Title">'
+        '<meta name="description" content="Plain description">'
+        '<meta property="og:image" content="https://example.com/card.png">'
+        '</head><body></body></html>'
+    )
+    assert head_parser.get_package() == {
+        'title': {'type': 'OpenGraph', 'content': 'OG Title'},
+        'description': {'type': 'Meta', 'content': 'Plain description'},
+        'image': {'type': 'OpenGraph', 'href': 'https://example.com/card.png'}
+    }
+
+
+def test_picks_largest_icon_under_size_limit():
+    head_parser = parse(
+        '<head><link rel="shortcut icon" href="/favicon.ico">'
+        '<link rel="icon" sizes="32x32" href="/32.png">'
+        '<link rel="icon" sizes="512x512" href="/512.png">'
+        '<link rel="icon" sizes="any" href="/icon.svg"></head>'
+    )
+    assert head_parser.get_url_image() == {'type': 'Meta', 'size': '32x32', 'href': '/32.png'}
+
+
+def test_stops_at_end_of_head():
+    head_parser = parse('<head><title>Kept</title></head><body><title>Ignored</title><meta name="description">')
+    assert head_parser.head_complete
+    assert head_parser.get_url_title() == {'type': 'Meta', 'content': 'Kept'}
+    assert head_parser.get_url_description() == {}
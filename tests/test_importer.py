@@ -0,0 +1,59 @@
+from arcadia.library.collectors.importer import Importer
+from arcadia.library.db.db_types import ArcadiaDataType
+
+
+def test_read_urls_skips_blank_and_comment_lines(tmp_path):
+    urls_file = tmp_path / 'urls.txt'
+    urls_file.write_text('https://a.com\n\n# comment\nhttps://b.com\n')
+    items = list(Importer.read_items(str(urls_file), default_tags=['inbox']))
+    assert [item['content'] for item in items] == ['https://a.com', 'https://b.com']
+    assert all(item['tags'] == ['inbox'] for item in items)
+
+
+def test_read_csv_and_jsonl_tags(tmp_path):
+    csv_file = tmp_path / 'items.csv'
+    csv_file.write_text('url,tags,data_type\nhttps://c.com,"tech;Web Dev",\na note,misc,note\n')
+    jsonl_file = tmp_path / 'items.jsonl'
+    jsonl_file.write_text('{"url": "https://d.com", "tags": ["X Y"]}\n{"content": "https://e.com", "tags": "a,b"}\n')
+
+    csv_items = list(Importer.read_items(str(csv_file)))
+    assert csv_items[0]['tags'] == ['tech', 'web_dev']
+    assert csv_items[1]['data_type'] == ArcadiaDataType.NOTE
+    assert [item['tags'] for item in Importer.read_items(str(jsonl_file))] == [['x_y'], ['a', 'b']]
+
+
+def test_read_bookmarks_uses_folders_as_tags(tmp_path):
+    bookmarks_file = tmp_path / 'bookmarks.html'
+    bookmarks_file.write_text(
+        '<H1>Bookmarks</H1><DL><p>'
+        '<DT><H3>Bookmarks bar</H3><DL><p>'
+        '<DT><H3>Dev Tools</H3><DL><p>'
+        '<DT><A HREF="https://g.com" TAGS="python">G</A>'
+        '<DT><A HREF="javascript:void(0)">bookmarklet</A>'
+        '<DT><A HREF>no link</A>'
+        '</DL><p></DL><p>'
+        '<DT><A HREF="https://h.com">H</A>'
+        '</DL><p>'
+    )
+    items = list(Importer.read_items(str(bookmarks_file)))
+    assert [(item['content'], item['tags']) for item in items] == [
+        ('https://g.com', ['dev_tools', 'python']),
+        ('https://h.com', ['imported'])
+    ]
+
+
+def test_bad_rows_are_skipped_and_reported(tmp_path):
+    csv_file = tmp_path / 'items.csv'
+    csv_file.write_text('url,tags,data_type\nhttps://a.com,x,memo\nhttps://b.com,y,\n')
+    jsonl_file = tmp_path / 'items.jsonl'
+    jsonl_file.write_text('{"url": "https://c.com"}\nnot json\n["list"]\n{"url": "https://d.com", "data_type": 3}\n'
+                          '{"url": "https://e.com", "tags": [1]}\n{"url": "https://f.com", "data_type": "note"}\n')
+    csv_errors = []
+    jsonl_errors = []
+
+    assert [item['content'] for item in Importer.read_items(str(csv_file), errors=csv_errors)] == ['https://b.com']
+    jsonl_items = list(Importer.read_items(str(jsonl_file), errors=jsonl_errors))
+    assert [item['content'] for item in jsonl_items] == ['https://c.com', 'https://f.com']
+    assert jsonl_items[1]['data_type'] == ArcadiaDataType.NOTE
+    assert csv_errors == [f'{csv_file}:2: \'MEMO\' is not a valid ArcadiaDataType']
+    assert [error.split(':')[1] for error in jsonl_errors] == ['2', '3', '4', '5']
@@ -0,0 +1,23 @@
+def test_merge_keeps_duplicate_metadata(sql_db, read_sql):
+    conn = sql_db('schema.sql', 'item_tags_schema.sql', 'items_fts_schema.sql', 'json_tags_schema.sql',
+                  'enrichment_queue_schema.sql')
+    conn.executemany(
+        'INSERT INTO ITEMS(time_stamp, data, data_type, tags, title, description, image) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [('2024-01-01', 'https://a', 'URL', '["python"]', 'None', 'None', 'None'),
+         ('2024-01-02', 'https://a', 'URL', '["web"]', 'A title', 'A description', 'None'),
+         ('2024-01-03', 'https://a', 'URL', '["python"]', 'None', 'None', 'a.png'),
+         ('2024-01-04', 'https://b', 'URL', '["rust"]', 'B title', 'None', 'None'),
+         ('2024-01-05', 'https://c', 'URL', '["go"]', 'None', 'None', 'None'),
+         ('2024-01-06', 'https://c', 'URL', '["go"]', 'None', 'None', 'None')]
+    )
+    conn.executescript(read_sql('items_indexes_schema.sql'))
+    assert conn.execute('SELECT ID, data, tags, title, description, image FROM ITEMS ORDER BY ID').fetchall() == [
+        (1, 'https://a', '["python","web"]', 'A title', 'A description', 'a.png'),
+        (4, 'https://b', '["rust"]', 'B title', 'None', 'None'),
+        (5, 'https://c', '["go"]', 'None', 'None', 'None')
+    ]
+    assert conn.execute('SELECT item_id FROM ENRICHMENT_QUEUE ORDER BY item_id').fetchall() == [(4,), (5,)]
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'idx_items_data'").fetchone() == (1,)
+    item_tags = conn.execute('SELECT tag FROM ITEM_TAGS WHERE item_id = 1 ORDER BY tag').fetchall()
+    assert item_tags == [('python',), ('web',)]
+    assert not conn.in_transaction
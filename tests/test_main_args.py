@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+pytest.importorskip('willow_core')
+pytest.importorskip('dotenv')
+
+
+@pytest.fixture
+def main_module(monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..', 'arcadia'))
+    import main
+    return main
+
+
+@pytest.mark.parametrize('argv, command, expected', [
+    (['python'], 'tag', {'tag': 'python', 'limit': None}),
+    (['https://a.com', 'python,web'], 'add', {'content': 'https://a.com', 'tags': 'python,web', 'note': False}),
+    (['stats'], 'stats', {'subjects': None}),
+    (['tag', 'stats'], 'tag', {'tag': 'stats'}),
+    (['tag', 'random', '--limit', '5'], 'tag', {'tag': 'random', 'limit': 5}),
+    (['add', 'stats', 'python', '--note'], 'add', {'content': 'stats', 'tags': 'python', 'note': True}),
+    (['random', '--count', '3'], 'random', {'count': 3, 'tag': None}),
+    (['search', 'full', 'text'], 'search', {'query': ['full', 'text']})
+])
+def test_parse_args_maps_legacy_forms(main_module, argv, command, expected):
+    args = main_module.parse_args(argv)
+    assert args.command == command
+    assert {key: getattr(args, key) for key in expected} == expected
+
+
+@pytest.mark.parametrize('argv', [['random', '--count', '0'], ['get'], ['--limit']])
+def test_parse_args_rejects_invalid_input(main_module, argv):
+    with pytest.raises(SystemExit):
+        main_module.parse_args(argv)
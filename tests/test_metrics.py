@@ -0,0 +1,35 @@
+import json
+from arcadia.library.metrics import MetricsRegistry
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+    registry.inc('arcadia_test_total')
+    registry.record_query('SELECT 1', 1.0, 1)
+    assert registry.to_prometheus() == '\n'
+    assert registry.slow_queries() == []
+
+
+def test_prometheus_and_json_dump():
+    registry = MetricsRegistry()
+    registry.configure_from_env({'ARCADIA_METRICS': 'true'})
+    registry.observe('arcadia_scrape_seconds', 0.003, outcome='fetched')
+    registry.observe('arcadia_scrape_seconds', 0.2, outcome='fetched')
+    registry.inc('arcadia_test_total', 2, kind='a"b')
+    prometheus_text = registry.to_prometheus()
+    assert '# TYPE arcadia_scrape_seconds histogram' in prometheus_text
+    assert 'arcadia_scrape_seconds_bucket{outcome="fetched",le="0.005"} 1' in prometheus_text
+    assert 'arcadia_scrape_seconds_bucket{outcome="fetched",le="+Inf"} 2' in prometheus_text
+    assert 'arcadia_test_total{kind="a\\"b"} 2' in prometheus_text
+    assert json.loads(registry.to_json())['histograms'][0]['count'] == 2
+
+
+def test_slow_queries_capture_plan_with_literals_removed():
+    registry = MetricsRegistry()
+    registry.configure_from_env({'ARCADIA_SLOW_QUERY_MS': '10'})
+    registry.record_query("SELECT * FROM items WHERE data='secret' LIMIT 5", 0.001, 1, lambda: ['SCAN items'])
+    registry.record_query("SELECT * FROM items WHERE data='secret' LIMIT 5", 0.05, 1, lambda: ['SCAN items'])
+    slow_queries = registry.slow_queries()
+    assert len(slow_queries) == 1
+    assert slow_queries[0]['query'] == 'SELECT * FROM items WHERE data=? LIMIT ?'
+    assert slow_queries[0]['plan'] == ['SCAN items']
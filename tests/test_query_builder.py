@@ -0,0 +1,44 @@
+import json
+import sqlite3
+from arcadia.library.db.db_types import ArcadiaDataType
+from arcadia.library.db.query_builder import QueryBuilder
+
+
+def create_items_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE ITEMS(ID INTEGER PRIMARY KEY, time_stamp TEXT, data TEXT, data_type TEXT, tags TEXT, '
+                 "title TEXT DEFAULT 'None', description TEXT DEFAULT 'None', image TEXT DEFAULT 'None')")
+    conn.execute('CREATE TABLE ITEM_TAGS(item_id INTEGER, tag TEXT COLLATE NOCASE, PRIMARY KEY (item_id, tag))')
+    items = [
+        (1, '2024-01-01T00:00:00Z', "https://quote.example/it's", 'URL', ['python', 'web'], 'Quotes'),
+        (2, '2024-02-01T00:00:00Z', 'https://rust.example', 'URL', ['rust', 'web'], 'None'),
+        (3, '2024-03-01T00:00:00Z', 'a python note', 'NOTE', ['python'], 'None')
+    ]
+    for item_id, time_stamp, data, data_type, tags, title in items:
+        conn.execute('INSERT INTO ITEMS(ID, time_stamp, data, data_type, tags, title) VALUES (?, ?, ?, ?, ?, ?)',
+                     (item_id, time_stamp, data, data_type, json.dumps(tags), title))
+        conn.executemany('INSERT INTO ITEM_TAGS VALUES (?, ?)', [(item_id, tag) for tag in tags])
+    return conn
+
+
+def found_ids(conn: sqlite3.Connection, filters: dict, limit=None, before_id=None) -> list[int]:
+    return [row[0] for row in conn.execute(*QueryBuilder.records_query(filters, limit, before_id))]
+
+
+def test_combined_filters():
+    conn = create_items_db()
+    assert found_ids(conn, {}) == [3, 2, 1]
+    assert found_ids(conn, {'all_tags': ['Python', 'web']}) == [1]
+    assert found_ids(conn, {'any_tags': ['python', 'rust'], 'exclude_tags': ['web']}) == [3]
+    assert found_ids(conn, {'data_type': ArcadiaDataType.URL, 'has_metadata': False}) == [2]
+    assert found_ids(conn, {'since': '2024-02-01', 'until': '2024-03-01'}) == [2]
+    assert found_ids(conn, {'search_term': "it's"}) == [1]
+    assert found_ids(conn, {'search_term': 'python'}, limit=1, before_id=3) == [1]
+
+
+def test_query_text_is_stable_across_values():
+    first_query, _ = QueryBuilder.records_query({'search_term': 'go', 'any_tags': ['a']}, 10)
+    second_query, _ = QueryBuilder.records_query({'search_term': "o'reilly", 'any_tags': ['b', 'c', 'd']})
+    assert first_query == second_query
+    assert QueryBuilder.record_query("x' OR '1'='1") == ('SELECT * FROM ITEMS WHERE data = ? LIMIT 2',
+                                                          ["x' OR '1'='1"])
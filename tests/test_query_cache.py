@@ -0,0 +1,29 @@
+from arcadia.library.query_cache import QueryCache
+
+
+def test_lru_eviction_and_stats():
+    query_cache = QueryCache(max_entries=2, ttl=None)
+    assert query_cache.get(('count',), lambda: 1) == 1
+    assert query_cache.get(('count',), lambda: 2) == 1
+    query_cache.get(('summary', 'python'), lambda: 'python vine')
+    query_cache.get(('summary', 'rust'), lambda: 'rust vine')
+    assert ('count',) not in query_cache
+    assert query_cache.stats()['hits'] == 1
+    assert query_cache.stats()['misses'] == 3
+    assert query_cache.stats()['evictions'] == 1
+
+
+def test_invalidate_namespace_and_expiry():
+    query_cache = QueryCache(max_entries=8, ttl=0)
+    query_cache.get(('count',), lambda: 1)
+    assert query_cache.get(('count',), lambda: 2) == 2
+    assert query_cache.stats()['expirations'] == 1
+
+    query_cache = QueryCache(max_entries=8, ttl=None)
+    query_cache.get(('count',), lambda: 1)
+    query_cache.get(('summary', 'python'), lambda: 'python vine')
+    query_cache.invalidate('summary')
+    assert ('count',) in query_cache
+    assert ('summary', 'python') not in query_cache
+    query_cache.invalidate()
+    assert len(query_cache) == 0
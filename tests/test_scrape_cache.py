@@ -0,0 +1,82 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from arcadia.library.collectors import scrape_cache as scrape_cache_module
+from arcadia.library.collectors.scrape_cache import ScrapeCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(scrape_cache_module, 'time', SimpleNamespace(time=lambda: fake_clock.now))
+    return fake_clock
+
+
+@pytest.fixture
+def scrape_cache(tmp_path):
+    cache = ScrapeCache(logging, str(tmp_path / 'scrape_cache.db'), ttl=10, max_age=100, max_entries=2,
+                        eviction_interval=1000)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize('url, cache_key', [
+    ('example.com', 'https://example.com/'),
+    ('  HTTPS://Example.COM:443/a?b=1#top ', 'https://example.com/a?b=1'),
+    ('http://example.com:80', 'http://example.com/'),
+    ('http://example.com:8080/a', 'http://example.com:8080/a')
+])
+def test_normalize_url(url, cache_key):
+    assert ScrapeCache.normalize_url(url) == cache_key
+
+
+def test_entries_expire_after_ttl(scrape_cache, clock):
+    scrape_cache.put('https://example.com/#section', '"v1"', None, {'title': {'content': 'Example'}})
+    entry = scrape_cache.get('EXAMPLE.com')
+    assert entry['payload'] == {'title': {'content': 'Example'}}
+    assert ScrapeCache.conditional_headers(entry) == {'if-none-match': '"v1"'}
+    clock.now += 9
+    assert scrape_cache.is_fresh(scrape_cache.get('example.com'))
+    clock.now += 2
+    assert not scrape_cache.is_fresh(scrape_cache.get('example.com'))
+    scrape_cache.touch('example.com')
+    assert scrape_cache.is_fresh(scrape_cache.get('example.com'))
+
+
+def test_eviction_keeps_recently_accessed_entries(scrape_cache, clock):
+    for url in ('a.com', 'b.com', 'c.com'):
+        scrape_cache.put(url, None, None, {})
+        clock.now += 1
+    scrape_cache.get('a.com')
+    assert scrape_cache.evict() == 1
+    assert [url for url in ('a.com', 'b.com', 'c.com') if scrape_cache.get(url)] == ['a.com', 'c.com']
+    clock.now += 101
+    scrape_cache.put('d.com', None, None, {})
+    assert scrape_cache.evict() == 2
+    assert scrape_cache.get('d.com') is not None
+
+
+def test_stale_entries_use_conditional_requests(scrape_cache, clock):
+    scraper_module = pytest.importorskip('arcadia.library.collectors.scraper')
+    requests_sent: list[dict] = []
+
+    def request(method, url, headers, **kwargs):
+        requests_sent.append(headers)
+        return SimpleNamespace(status_code=304, headers={}, close=lambda: None)
+
+    session = SimpleNamespace(request=request)
+    payload = {'title': {'content': 'Example'}, 'description': {}, 'image': {}}
+    scrape_cache.put('example.com', '"v1"', 'Mon, 01 Jan 2024 00:00:00 GMT', payload)
+    assert scraper_module.Scraper.fetch_url_meta('example.com', session, cache=scrape_cache) == (
+        {**payload, 'cache_status': 'hit'}, ''
+    )
+    assert requests_sent == []
+    clock.now += 11
+    assert scraper_module.Scraper.fetch_url_meta('example.com', session, cache=scrape_cache) == (
+        {**payload, 'cache_status': 'not_modified'}, ''
+    )
+    assert requests_sent[0]['if-none-match'] == '"v1"'
+    assert requests_sent[0]['if-modified-since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert scrape_cache.is_fresh(scrape_cache.get('example.com'))
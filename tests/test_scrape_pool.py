@@ -0,0 +1,69 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+scrape_pool_module = pytest.importorskip('arcadia.library.collectors.scrape_pool')
+ScrapePool = scrape_pool_module.ScrapePool
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = SimpleNamespace(lock=threading.Lock(), active=defaultdict(int), max_active=defaultdict(int),
+                            started=defaultdict(list), total_active=0, max_total_active=0, duration=0.0)
+
+    def fetch_url_meta(url, session=None, cache=None):
+        host = ScrapePool.get_host(url)
+        with calls.lock:
+            calls.active[host] += 1
+            calls.total_active += 1
+            calls.max_active[host] = max(calls.max_active[host], calls.active[host])
+            calls.max_total_active = max(calls.max_total_active, calls.total_active)
+            calls.started[host].append(time.monotonic())
+        time.sleep(calls.duration)
+        with calls.lock:
+            calls.active[host] -= 1
+            calls.total_active -= 1
+        if 'broken' in url:
+            return {}, 'API Status code: 500'
+        return {'title': {'content': url}}, ''
+
+    monkeypatch.setattr(scrape_pool_module.Scraper, 'create_session',
+                        staticmethod(lambda **kwargs: SimpleNamespace(close=lambda: None)))
+    monkeypatch.setattr(scrape_pool_module.Scraper, 'fetch_url_meta', staticmethod(fetch_url_meta))
+    return calls
+
+
+def test_hosts_are_interleaved_in_request_order(fetches):
+    urls = ['https://a.com/1', 'https://a.com/2', 'https://b.com/1', 'https://c.com/1', 'https://b.com/broken']
+    scrape_pool = ScrapePool(logging, workers=1, host_concurrency=1, host_delay=0)
+    results = list(scrape_pool.scrape_results(urls))
+    scrape_pool.close()
+    assert [url for url, _, _ in results] == [
+        'https://a.com/1', 'https://b.com/1', 'https://c.com/1', 'https://a.com/2', 'https://b.com/broken'
+    ]
+    assert results[-1] == ('https://b.com/broken', {}, 'API Status code: 500')
+    assert results[0][1] == {'title': {'content': 'https://a.com/1'}}
+
+
+def test_host_concurrency_is_capped(fetches):
+    fetches.duration = 0.05
+    urls = [f'https://{host}.com/{index}' for host in ('a', 'b') for index in range(6)]
+    scrape_pool = ScrapePool(logging, workers=8, host_concurrency=2, host_delay=0)
+    assert sorted(url for url, _ in scrape_pool.scrape(urls)) == sorted(urls)
+    scrape_pool.close()
+    assert max(fetches.max_active.values()) == 2
+    assert fetches.max_total_active > 2
+
+
+def test_requests_to_a_host_are_spaced_by_the_delay(fetches):
+    urls = [f'https://a.com/{index}' for index in range(4)] + ['https://b.com/1']
+    scrape_pool = ScrapePool(logging, workers=8, host_concurrency=4, host_delay=0.05)
+    assert len(list(scrape_pool.scrape(urls))) == 5
+    scrape_pool.close()
+    start_times = sorted(fetches.started['a.com'])
+    assert all(later - earlier >= 0.045 for earlier, later in zip(start_times, start_times[1:]))
+    assert fetches.started['b.com'][0] - start_times[0] < 0.045
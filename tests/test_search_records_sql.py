@@ -0,0 +1,43 @@
+import sqlite3
+
+search_schemas = ('schema.sql', 'items_fts_schema.sql')
+
+
+def add_items(conn: sqlite3.Connection, items: list[tuple[str, str, str]]) -> None:
+    conn.executemany(
+        "INSERT INTO ITEMS(time_stamp, data, data_type, tags, title, description) VALUES ('2024-01-01', ?, 'URL', "
+        "'[]', ?, ?)",
+        items
+    )
+
+
+def search(conn: sqlite3.Connection, read_sql, fts_query: str, limit: int = 20, offset: int = 0) -> list[tuple]:
+    return [
+        (row[2], row[-2], row[-1]) for row in conn.execute(
+            read_sql('search_records.sql'), ['[', ']', '[', ']', fts_query, limit, offset]
+        ).fetchall()
+    ]
+
+
+def test_title_matches_rank_above_description_and_data(sql_db, read_sql):
+    conn = sql_db(*search_schemas)
+    add_items(conn, [('https://a/sqlite', 'Rust book', 'Systems programming'),
+                     ('https://b', 'Python notes', 'Embedding sqlite in apps'),
+                     ('https://c', 'SQLite internals', 'How pages work')])
+    assert search(conn, read_sql, '"sqlite"') == [
+        ('https://c', '[SQLite] internals', 'How pages work'),
+        ('https://b', 'Python notes', 'Embedding [sqlite] in apps'),
+        ('https://a/sqlite', 'Rust book', 'Systems programming')
+    ]
+    assert [row[0] for row in search(conn, read_sql, '"sqlite"', 1, 1)] == ['https://b']
+
+
+def test_prefix_and_phrase_queries(sql_db, read_sql):
+    conn = sql_db(*search_schemas)
+    add_items(conn, [('https://a', 'Full text search', 'Ranking with bm25'),
+                     ('https://b', 'Text full of search tips', 'Sqlite tips')])
+    assert [row[0] for row in search(conn, read_sql, '"full text"')] == ['https://a']
+    assert sorted(row[0] for row in search(conn, read_sql, '"sea"*')) == ['https://a', 'https://b']
+    assert search(conn, read_sql, '"bm"* "rank"*') == [('https://a', 'Full text search', '[Ranking] with [bm25]')]
+    conn.execute("UPDATE ITEMS SET title = 'Plain title' WHERE data = 'https://a'")
+    assert [row[0] for row in search(conn, read_sql, '"full text"')] == []
@@ -0,0 +1,17 @@
+from arcadia.library.db.tag_codec import TagCodec
+
+
+def test_round_trips_tags_with_apostrophes():
+    tags = ["bob's", 'tech', 'café']
+    assert TagCodec.encode_tags(tags) == '["bob\'s", "tech", "café"]'
+    assert TagCodec.decode_tags(TagCodec.encode_tags(tags)) == tags
+
+
+def test_decodes_legacy_python_literal_tags():
+    assert TagCodec.decode_tags("['tech', 'js']") == ['tech', 'js']
+
+
+def test_decoded_tags_are_independent_copies():
+    first_tags = TagCodec.decode_tags('["a", "b"]')
+    first_tags.append('c')
+    assert TagCodec.decode_tags('["a", "b"]') == ['a', 'b']
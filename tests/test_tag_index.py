@@ -0,0 +1,22 @@
+from arcadia.library.tag_index import TagIndex
+
+
+def test_substring_and_prefix_search():
+    tag_index = TagIndex(['python', 'python_web', 'cpython', 'js', 'web'])
+    assert tag_index.search_substring('pyth') == ['cpython', 'python', 'python_web']
+    assert tag_index.search_substring('we') == ['python_web', 'web']
+    assert tag_index.search_prefix('py') == ['python', 'python_web']
+
+
+def test_suggest_ranks_prefix_then_substring_then_typos():
+    tag_index = TagIndex(['python', 'python_web', 'cpython', 'pytorch', 'rust'])
+    assert tag_index.suggest('python') == ['python', 'python_web', 'cpython']
+    assert tag_index.suggest('pyhton', max_distance=2)[0] == 'python'
+    assert tag_index.suggest('rsut', max_distance=2) == ['rust']
+
+
+def test_sync_adds_and_removes_tags():
+    tag_index = TagIndex(['a_tag', 'b_tag'])
+    tag_index.sync(['b_tag', 'c_tag'])
+    assert 'a_tag' not in tag_index
+    assert tag_index.search_substring('tag') == ['b_tag', 'c_tag']
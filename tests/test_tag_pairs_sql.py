@@ -0,0 +1,41 @@
+import json
+import sqlite3
+from arcadia.library.co_occurrence import CoOccurrence
+
+pair_schemas = ('schema.sql', 'item_tags_schema.sql', 'json_tags_schema.sql', 'tag_stats_schema.sql',
+                'tag_pairs_schema.sql')
+
+
+def add_items(conn: sqlite3.Connection, items: list[tuple[str, list[str]]]) -> None:
+    conn.executemany('INSERT INTO ITEMS(time_stamp, data, data_type, tags) VALUES (?, ?, ?, ?)',
+                     [('2024-01-01', data, 'URL', json.dumps(tags)) for data, tags in items])
+
+
+def tag_pairs(conn: sqlite3.Connection) -> list[tuple]:
+    return conn.execute('SELECT tag_a, tag_b, pair_count FROM TAG_PAIRS ORDER BY 1, 2').fetchall()
+
+
+def test_pair_counts_follow_item_changes(sql_db, read_sql):
+    conn = sql_db(*pair_schemas)
+    add_items(conn, [('https://a', ['python', 'Python', 'web']), ('https://b', ['web', 'rust', 'python']),
+                     ('https://c', ['python', 'web'])])
+    conn.execute("UPDATE ITEMS SET tags = '[\"rust\", \"web\"]' WHERE data = 'https://c'")
+    conn.execute("DELETE FROM ITEMS WHERE data = 'https://a'")
+    assert tag_pairs(conn) == [('python', 'rust', 1), ('python', 'web', 1), ('rust', 'web', 2)]
+    assert sorted(conn.execute(read_sql('related_tags.sql'), ('web', 1)).fetchall()) == [
+        ('python', 1, 1), ('rust', 2, 2)
+    ]
+    triggered_pairs = tag_pairs(conn)
+    conn.executescript(read_sql('rebuild_tag_pairs.sql'))
+    assert tag_pairs(conn) == triggered_pairs
+
+
+def test_items_over_the_tag_cap_are_left_out(sql_db, read_sql):
+    conn = sql_db(*pair_schemas)
+    many_tags = [f'tag{index}' for index in range(CoOccurrence.max_item_tags + 1)]
+    add_items(conn, [('https://many', many_tags), ('https://pair', ['tag0', 'tag1'])])
+    assert tag_pairs(conn) == [('tag0', 'tag1', 1)]
+    conn.executescript(read_sql('rebuild_tag_pairs.sql'))
+    assert tag_pairs(conn) == [('tag0', 'tag1', 1)]
+    conn.execute("DELETE FROM ITEMS WHERE data = 'https://many'")
+    assert tag_pairs(conn) == [('tag0', 'tag1', 1)]
@@ -0,0 +1,23 @@
+import sqlite3
+
+
+def tag_stats(conn: sqlite3.Connection) -> list[tuple]:
+    return conn.execute('SELECT lower(tag), item_count, url_count, note_count FROM TAG_STATS ORDER BY 1').fetchall()
+
+
+def test_triggers_match_rebuild(sql_db, read_sql):
+    conn = sql_db('schema.sql', 'item_tags_schema.sql', 'json_tags_schema.sql', 'tag_stats_schema.sql')
+    conn.executemany(
+        'INSERT INTO ITEMS(time_stamp, data, data_type, tags) VALUES (?, ?, ?, ?)',
+        [('2024-01-01', 'https://a', 'URL', '["python", "Python", "web"]'),
+         ('2024-01-02', 'https://b', 'URL', '["web"]'),
+         ('2024-01-03', 'note', 'NOTE', '["python"]')]
+    )
+    conn.execute("UPDATE ITEMS SET tags = '[\"rust\", \"web\"]' WHERE data = 'note'")
+    conn.execute("UPDATE ITEMS SET data_type = 'NOTE' WHERE data = 'https://b'")
+    conn.execute("DELETE FROM ITEMS WHERE data = 'https://a'")
+    assert tag_stats(conn) == [('rust', 1, 0, 1), ('web', 2, 0, 2)]
+    assert conn.execute("SELECT last_used FROM TAG_STATS WHERE tag = 'rust'").fetchone() == ('2024-01-03',)
+    triggered_stats = tag_stats(conn)
+    conn.executescript(read_sql('rebuild_tag_stats.sql'))
+    assert tag_stats(conn) == triggered_stats
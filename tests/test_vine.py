@@ -0,0 +1,71 @@
+import io
+import logging
+
+from arcadia.library.arcadia_types import DataViewType
+from arcadia.library.vine import Vine
+
+records = [
+    {'ID': 3, 'time_stamp': '2023-01-13T22:08:52Z', 'data': 'https://alpinejs.dev/', 'data_type': 'URL',
+     'tags': "['tech', 'js', 'framework']", 'title': 'None', 'description': 'None', 'image': 'None'},
+    {'ID': 2, 'time_stamp': '2023-01-13T22:05:00Z', 'data': 'Learn more js', 'data_type': 'NOTE',
+     'tags': "['js', 'tech']", 'title': 'None', 'description': 'None', 'image': 'None'},
+    {'ID': 1, 'time_stamp': '2023-01-13T22:01:12Z', 'data': 'https://techcrunch.com/', 'data_type': 'URL',
+     'tags': "['security', 'tech']", 'title': 'None', 'description': 'None', 'image': 'None'}
+]
+
+
+def test_vine_structure():
+    vine_root = Vine(logging, 'tech', records, DataViewType.RAW).get_vine_root()
+    assert [record['ID'] for record in vine_root['main_node']['urls']] == [3, 1]
+    assert [record['ID'] for record in vine_root['main_node']['notes']] == [2]
+    assert [node['subject'] for node in vine_root['sub_node']] == ['framework', 'js', 'security']
+    assert vine_root['sub_node'][0]['urls'][0]['tags'] == ['tech', 'js', 'framework']
+
+
+def test_vine_text():
+    assert str(Vine(logging, 'tech', records, DataViewType.TEXT)) == (
+        '🌿  Tech\n'
+        '  ◦ 2023-01-13T22:05:00Z [js, tech]: Learn more js\n'
+        '◦ 2023-01-13T22:08:52Z [tech, js, framework]: https://alpinejs.dev/\n'
+        '  ◦ 2023-01-13T22:01:12Z [security, tech]: https://techcrunch.com/\n'
+        '\n'
+        '  framework: \n'
+        '   ◦ 2023-01-13T22:08:52Z [tech, js, framework]: https://alpinejs.dev/\n'
+        '  js: \n'
+        '   ◦ 2023-01-13T22:05:00Z [js, tech]: Learn more js\n'
+        '   ◦ 2023-01-13T22:08:52Z [tech, js, framework]: https://alpinejs.dev/\n'
+        '  security: \n'
+        '   ◦ 2023-01-13T22:01:12Z [security, tech]: https://techcrunch.com/\n'
+    )
+    assert str(Vine(logging, 'none', [], DataViewType.TEXT)) == '🌿  None\n No results found\n'
+
+
+def test_vine_add_records_matches_full_build():
+    incremental_vine = Vine(logging, 'tech', records[:1], DataViewType.TEXT)
+    incremental_vine.add_records(records[1:])
+    assert incremental_vine.get_vine_root() == Vine(logging, 'tech', records, DataViewType.TEXT).get_vine_root()
+
+
+def test_vine_lines_pagination():
+    vine = Vine(logging, 'tech', records, DataViewType.TEXT)
+    assert ''.join(vine.lines()) == str(vine)
+    assert list(vine.lines(node_limit=1))[1:4] == [
+        '  ◦ 2023-01-13T22:05:00Z [js, tech]: Learn more js\n',
+        '  ◦ … 2 more\n',
+        '\n'
+    ]
+    assert list(vine.lines(line_limit=2))[-1] == '  … output truncated at 2 lines\n'
+
+
+def test_vine_write_records_streams_notes_then_urls():
+    notes_then_urls = [record for record in records if record['data_type'] == 'NOTE'] + \
+                      [record for record in records if record['data_type'] == 'URL']
+    for node_limit, line_limit in ((None, None), (1, None), (None, 3)):
+        built = io.StringIO()
+        Vine(logging, 'tech', records, DataViewType.TEXT).write(built, node_limit, line_limit)
+        streamed = io.StringIO()
+        Vine(logging, 'tech', (), DataViewType.TEXT).write_records(notes_then_urls, streamed, node_limit, line_limit)
+        assert streamed.getvalue() == built.getvalue()
+    streamed = io.StringIO()
+    Vine(logging, 'none', (), DataViewType.TEXT).write_records([], streamed)
+    assert streamed.getvalue() == '🌿  None\n No results found\n'